@@ -251,6 +251,9 @@ def run(args=None) -> None:
 
 def main():
     """主入口函数，支持命令行调用"""
+    from utils.logging_tool.encoding_fix import setup_utf8_encoding
+
+    setup_utf8_encoding()
     try:
         run()
     except KeyboardInterrupt:
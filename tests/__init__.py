@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+工具模块单元测试
+
+与 test_case 下的接口用例分开存放，不依赖登录等网络前置操作。
+tests 为包，pytest 收集时会将项目根目录加入 sys.path，无需手动添加。
+默认的 pytest 运行会一并收集；仅运行单元测试：python -m pytest tests
+"""
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+告警时间解析测试
+校验正则提取告警日期时间的结果与原先 strptime 解析一致，非法日期同样回退为当前时间
+"""
+import datetime
+import random
+import re
+
+import pytest
+
+from utils.notify.enhanced_notification_formatter import format_alarm_notification
+
+_ALARM_LINE = re.compile(r"\*\*⏰ 告警时间:\*\* (.*)")
+
+
+def _old_alarm_time(alarm_date, alarm_time):
+    """原实现：strptime 解析，失败时返回 None 表示使用当前时间"""
+    if not alarm_date:
+        return None
+    try:
+        if alarm_time:
+            dt = datetime.datetime.strptime(f"{alarm_date} {alarm_time}", '%Y-%m-%d %H:%M:%S')
+        else:
+            dt = datetime.datetime.strptime(alarm_date, '%Y-%m-%d')
+    except ValueError:
+        return None
+    return f"{dt.strftime('%Y年%m月%d日')} {dt.strftime('%H:%M:%S')}"
+
+
+def _formatted_alarm_time(alarm_date, alarm_time):
+    content = format_alarm_notification({"alarmDate": alarm_date, "alarmTime": alarm_time})
+    return _ALARM_LINE.search(content).group(1)
+
+
+def _assert_same_as_strptime(alarm_date, alarm_time):
+    expected = _old_alarm_time(alarm_date, alarm_time)
+    before = datetime.datetime.now()
+    actual = _formatted_alarm_time(alarm_date, alarm_time)
+    if expected is not None:
+        assert actual == expected, (alarm_date, alarm_time)
+    else:
+        # 回退为当前时间
+        after = datetime.datetime.now()
+        now_texts = {f"{t.strftime('%Y年%m月%d日')} {t.strftime('%H:%M:%S')}" for t in (before, after)}
+        assert actual in now_texts, (alarm_date, alarm_time)
+
+
+@pytest.mark.parametrize(
+    "alarm_date,alarm_time",
+    [
+        ("2025-01-05", "10:00:00"),
+        ("2025-01-05", ""),
+        ("2025-1-5", "9:5:3"),
+        ("2025-01- 5", ""),
+        ("2024-02-29", "23:59:59"),
+        ("2025-02-29", ""),
+        ("2025-13-45", ""),
+        ("2025-00-05", ""),
+        ("2025-01-05", "24:00:00"),
+        ("2025-01-05", "10:60:00"),
+        ("2025-01-05", "10:00:60"),
+        ("2025-01-05", "10:00"),
+        ("2025-01-05", "  10:00:00"),
+        ("2025-01-05\n", ""),
+        ("2025-01-05T10:00:00", ""),
+        ("0000-01-01", ""),
+        ("", "10:00:00"),
+    ],
+)
+def test_alarm_time_matches_strptime(alarm_date, alarm_time):
+    """补零、不补零、非法日期与多余字符的处理与 strptime 一致"""
+    _assert_same_as_strptime(alarm_date, alarm_time)
+
+
+def test_alarm_time_matches_strptime_on_random_values():
+    """随机组合的日期时间与 strptime 的解析结果一致"""
+    rng = random.Random(0)
+    for _ in range(2000):
+        alarm_date = rng.choice(["2025-", "2024-", "0001-"]) + "".join(
+            rng.choice("0123456789- ") for _ in range(rng.randint(1, 6))
+        )
+        alarm_time = "".join(rng.choice("0123456789: ") for _ in range(rng.randint(0, 9)))
+        _assert_same_as_strptime(alarm_date, alarm_time)
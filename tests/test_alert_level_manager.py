@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+告警级别管理测试
+校验基于 bisect 的分级结果与原先逐级比较的判断完全一致
+"""
+import itertools
+import math
+
+import pytest
+
+from utils.notify.alert_level_manager import (
+    calculate_alert_level,
+    classify_alert_levels,
+    get_performance_indicator,
+    get_warning_level_info,
+)
+
+NAN = float("nan")
+
+SUCCESS_RATES = [NAN, -math.inf, -1, 0, 39.9, 40, 59.99, 60, 79.5, 80, 94.99, 95, 99.9, 100, math.inf]
+FAILED_CASES = [NAN, 0, 4, 4.5, 5, 9, 10, 19, 20, 100]
+RESPONSE_TIMES = [NAN, -5, 0, 200, 200.1, 499, 500, 999, 1000, 1500, 2000, 2000.5, math.inf]
+
+
+def _old_alert_color(success_rate, failed_cases):
+    """原实现：按成功率逐级判断，失败用例数过多时提升告警级别"""
+    if success_rate >= 95:
+        color = "green"
+    elif success_rate >= 80:
+        color = "blue"
+    elif success_rate >= 60:
+        color = "yellow"
+    elif success_rate >= 40:
+        color = "orange"
+    else:
+        color = "red"
+
+    if failed_cases >= 20:
+        color = "red"
+    elif failed_cases >= 10 and color not in ["red"]:
+        color = "orange"
+    elif failed_cases >= 5 and color not in ["red", "orange"]:
+        color = "yellow"
+    return color
+
+
+def _old_performance_level(avg_response_time):
+    """原实现：按平均响应时间逐级判断"""
+    if avg_response_time <= 200:
+        return "优秀"
+    elif avg_response_time <= 500:
+        return "良好"
+    elif avg_response_time <= 1000:
+        return "一般"
+    elif avg_response_time <= 2000:
+        return "较慢"
+    return "很慢"
+
+
+@pytest.mark.parametrize("success_rate,failed_cases", list(itertools.product(SUCCESS_RATES, FAILED_CASES)))
+def test_alert_level_matches_if_chain(success_rate, failed_cases):
+    """阈值边界、无穷大与 NaN 的分级结果与原实现一致"""
+    expected = _old_alert_color(success_rate, failed_cases)
+    result = calculate_alert_level(success_rate, 100, failed_cases)
+    assert result.alert_level == expected
+    assert result.to_dict()["icon"] == get_warning_level_info(expected)["icon"]
+
+
+def test_batch_classification_matches_single():
+    """批量分级与逐条计算结果一致"""
+    pairs = list(itertools.product(SUCCESS_RATES, FAILED_CASES))
+    colors = classify_alert_levels([rate for rate, _ in pairs], [failed for _, failed in pairs])
+    assert colors == [_old_alert_color(rate, failed) for rate, failed in pairs]
+
+
+@pytest.mark.parametrize("avg_response_time", RESPONSE_TIMES)
+def test_performance_indicator_matches_if_chain(avg_response_time):
+    """性能指示器的分级与原实现一致"""
+    assert get_performance_indicator(avg_response_time)["level"] == _old_performance_level(avg_response_time)
+
+
+def test_warning_level_info_returns_independent_dict():
+    """get_warning_level_info 返回字典，修改后不影响后续调用"""
+    info = get_warning_level_info("red")
+    assert isinstance(info, dict)
+    info.update({"success_rate": 10, "icon": "x"})
+    assert get_warning_level_info("red")["icon"] == "🔴"
+    assert get_warning_level_info("purple")["level"] == "[未知]"
+
+
+def test_performance_indicator_returns_independent_dict():
+    """get_performance_indicator 返回新字典，修改后不影响后续调用"""
+    info = get_performance_indicator(100)
+    info["level"] = "changed"
+    assert get_performance_indicator(100)["level"] == "优秀"
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Excel 单元格值解析测试
+校验按首字符分流的解析结果与原先依次尝试数字、JSON、ast.literal_eval 的实现完全一致
+"""
+import ast
+import json
+import random
+import string
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from utils.read_files_tools.excel_control import _parse_cell_value_cached  # noqa: E402
+
+EDGE_CASES = [
+    # 空值与布尔值
+    "", " ", "none", "None", "NULL", "null", "true", "TRUE", "False", "Truex", "True or False", "Ｔｒｕｅ",
+    # 数字
+    "0", "00", "1", "-1", "+1", "1_000", "1.5", ".5", "-.5", "-0.0", "1e5", "1.5e3", "1e400", "0x1F", "1j",
+    "9" * 30, "1.5.2", "-", "+.", ".", "...", "--1", "inf", "-inf", "nan", "NaN", "Infinity",
+    # 非 ASCII 数字与前导空白
+    "١", "１", "²", " 1", "\t1", "\xa01", "　1", " ١", " 1.5", " 1e5", "\nNone", " [1]", " {'a': 1.5}",
+    # JSON 与 Python 字面量
+    "{}", "[]", "()", "{1, 2}", "set()", "set( )", '{"a": 1}', "{'a': 1}", "[1, 2]", "[1, 2", "(1, 2)", "1,2",
+    "[1, {'a': (2,)}]", "'a'", '"a"', "'''a'''", "b'x'", "rb'x'", "Rb'x'", "u'x'", "f'x'", "1 # c", "#c\n5",
+    # 普通字符串
+    "GET", "POST", "json", "data", "中文", "中'x'", "_x", "~1", "*", "x'", "http://x.y/a?b=1", "${{host()}}",
+    "$cache{token}", "__import__('os')", "frozenset()", "Ellipsis",
+]
+
+
+def _old_parse_cell_value(value):
+    """原实现：依次尝试布尔值、数字、JSON 与 ast.literal_eval"""
+    if not value or value.lower() in ["none", "null", ""]:
+        return None
+
+    if value.lower() in ["true", "false"]:
+        return value.lower() == "true"
+
+    try:
+        if "." in value:
+            return float(value)
+        else:
+            return int(value)
+    except ValueError:
+        pass
+
+    if value.startswith(("{", "[")):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+
+    return value
+
+
+def _outcome(parse, value):
+    """返回解析结果的类型与 repr，异常时返回异常类型，便于比较 NaN 等值"""
+    try:
+        result = parse(value)
+    except Exception as e:
+        return "raise", type(e).__name__
+    return type(result).__name__, repr(result)
+
+
+@pytest.mark.parametrize("value", EDGE_CASES)
+def test_parse_matches_old_implementation(value):
+    """边界取值的解析结果与原实现一致"""
+    assert _outcome(_parse_cell_value_cached, value) == _outcome(_old_parse_cell_value, value)
+
+
+def test_parse_matches_old_implementation_on_random_values():
+    """随机短字符串的解析结果与原实现一致"""
+    rng = random.Random(0)
+    alphabet = list(string.printable) + list("　١１²Ｔｒｕｅ中") + ["True", "None", "set()", "inf", "nan"]
+    for _ in range(20000):
+        value = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+        assert _outcome(_parse_cell_value_cached, value) == _outcome(_old_parse_cell_value, value), value
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+数据文件变化检测测试
+校验按修改时间与大小复用哈希、BLAKE2b 分块读取以及哈希失败时不写入缓存
+"""
+import hashlib
+import os
+
+import pytest
+
+from utils.read_files_tools import enhanced_case_automatic_control as control
+from utils.read_files_tools.enhanced_case_automatic_control import EnhancedTestCaseGenerator
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    """在临时目录中创建生成器，数据驱动类型固定为 yaml"""
+    monkeypatch.chdir(tmp_path)
+    gen = EnhancedTestCaseGenerator()
+    gen._current_driver_type = "yaml"
+    gen.file_changes = {"file_hashes": {}}
+    return gen
+
+
+@pytest.fixture
+def hash_calls(generator, monkeypatch):
+    """记录实际计算哈希的文件"""
+    calls = []
+    calculate = EnhancedTestCaseGenerator._calculate_file_hash
+
+    def recording(self, file_path):
+        calls.append(file_path)
+        return calculate(self, file_path)
+
+    monkeypatch.setattr(EnhancedTestCaseGenerator, "_calculate_file_hash", recording)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "size",
+    [0, 1, control.HASH_SMALL_FILE_SIZE - 1, control.HASH_SMALL_FILE_SIZE, control.HASH_SMALL_FILE_SIZE + 7,
+     control.HASH_MMAP_FILE_SIZE - 1, control.HASH_MMAP_FILE_SIZE, control.HASH_MMAP_FILE_SIZE + 1],
+)
+def test_file_hash_matches_whole_file_digest(generator, tmp_path, size):
+    """小文件、分块读取与 mmap 三种读取方式的哈希与一次性读取整个文件的结果一致"""
+    path = tmp_path / "data.yaml"
+    content = os.urandom(size)
+    path.write_bytes(content)
+    assert generator._calculate_file_hash(path) == hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def test_unchanged_files_reuse_hash(generator, hash_calls, tmp_path):
+    """修改时间与大小均未变化时直接复用上次的哈希，不读取文件内容"""
+    path = tmp_path / "a.yaml"
+    path.write_text("a: 1", encoding="utf-8")
+
+    new_files, modified_files, _ = generator._detect_changes([path])
+    assert new_files == [path] and not modified_files
+    assert len(hash_calls) == 1
+
+    new_files, modified_files, _ = generator._detect_changes([path])
+    assert not new_files and not modified_files
+    assert len(hash_calls) == 1
+
+
+def test_touched_file_with_same_content_is_not_modified(generator, hash_calls, tmp_path):
+    """仅修改时间变化时重新计算哈希，内容相同则不视为修改"""
+    path = tmp_path / "a.yaml"
+    path.write_text("a: 1", encoding="utf-8")
+    generator._detect_changes([path])
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    new_files, modified_files, _ = generator._detect_changes([path])
+
+    assert not new_files and not modified_files
+    assert len(hash_calls) == 2
+
+
+def test_changed_content_is_detected(generator, tmp_path):
+    """内容变化（大小不同）时识别为修改"""
+    path = tmp_path / "a.yaml"
+    path.write_text("a: 1", encoding="utf-8")
+    generator._detect_changes([path])
+
+    path.write_text("a: 12", encoding="utf-8")
+    _, modified_files, _ = generator._detect_changes([path])
+    assert modified_files == [path]
+
+
+def test_failed_hash_is_not_cached(generator, tmp_path, monkeypatch):
+    """哈希计算失败时不记录修改时间与大小，下次重新计算"""
+    path = tmp_path / "a.yaml"
+    path.write_text("a: 1", encoding="utf-8")
+    key = generator._file_key(path.resolve())
+
+    calls = []
+    monkeypatch.setattr(EnhancedTestCaseGenerator, "_calculate_file_hash", lambda self, p: calls.append(p) or "")
+    generator._detect_changes([path])
+    assert generator.file_changes["file_hashes"][key] == {"h": ""}
+
+    generator._detect_changes([path])
+    assert len(calls) == 2
+
+
+def test_cached_empty_hash_is_recalculated(generator, hash_calls, tmp_path):
+    """旧追踪文件中与修改时间、大小一同记录的空哈希不会被复用"""
+    path = tmp_path / "a.yaml"
+    path.write_text("a: 1", encoding="utf-8")
+    stat = os.stat(path)
+    key = generator._file_key(path.resolve())
+    generator.file_changes["file_hashes"][key] = {"m": stat.st_mtime_ns, "s": stat.st_size, "h": ""}
+
+    _, modified_files, _ = generator._detect_changes([path])
+
+    assert modified_files == [path]
+    assert len(hash_calls) == 1
+    assert generator.file_changes["file_hashes"][key]["h"]
+
+
+def test_parallel_hashing_matches_serial(generator, tmp_path):
+    """文件数量超过并行阈值时使用线程池，结果与逐个计算一致"""
+    paths = []
+    for i in range(control.PARALLEL_HASH_THRESHOLD * 2):
+        path = tmp_path / f"f{i}.yaml"
+        path.write_text(f"v: {i}", encoding="utf-8")
+        paths.append(path)
+
+    generator._detect_changes(paths)
+
+    hashes = generator.file_changes["file_hashes"]
+    for path in paths:
+        assert hashes[generator._file_key(path.resolve())]["h"] == generator._calculate_file_hash(path)
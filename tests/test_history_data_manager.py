@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+历史数据管理器测试
+校验 JSONL 存储、旧版 JSON 迁移、延迟合并写入以及增量维护的趋势统计与原实现一致
+"""
+import json
+import random
+
+import pytest
+
+from utils.notify import history_data_manager
+from utils.notify.history_data_manager import MAX_RECORDS, ROTATE_THRESHOLD, HistoryDataManager
+
+
+class _Metrics:
+    """模拟测试指标对象"""
+
+    def __init__(self, pass_rate):
+        self.total = 100
+        self.passed = int(pass_rate)
+        self.failed = 100 - int(pass_rate)
+        self.broken = 0
+        self.skipped = 0
+        self.pass_rate = pass_rate
+        self.time = "1.0"
+
+
+def _old_trend_statistics(history_data):
+    """原实现：每次对切片重新求和"""
+    recent_5 = history_data[-5:] if len(history_data) >= 5 else history_data
+    avg_recent = sum(record.get('success_rate', 0) for record in recent_5) / len(recent_5)
+    if len(history_data) >= 10:
+        earlier_5 = history_data[-10:-5]
+        avg_earlier = sum(record.get('success_rate', 0) for record in earlier_5) / len(earlier_5)
+    else:
+        avg_earlier = avg_recent
+    return round(avg_recent, 1), round(avg_earlier, 1), round(avg_recent - avg_earlier, 1)
+
+
+def _old_history_summary(history_data, limit=10):
+    """原实现：列表切片后分别求 sum / max / min"""
+    recent_data = history_data[-limit:] if len(history_data) > limit else history_data
+    success_rates = [record.get('success_rate', 0) for record in recent_data]
+    return round(sum(success_rates) / len(success_rates), 1), max(success_rates), min(success_rates)
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """在临时目录中创建历史数据管理器，并关闭定时写入，由用例显式调用 flush"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(history_data_manager.HistoryDataManager, "_schedule_drain", lambda self: None)
+    return HistoryDataManager("unit")
+
+
+def test_legacy_json_is_migrated_to_jsonl(manager):
+    """旧版 JSON 数组文件在首次加载时读取，保存后重写为 JSONL，只保留最近 MAX_RECORDS 条"""
+    legacy = [{"success_rate": float(i), "date": f"d{i}"} for i in range(MAX_RECORDS + 5)]
+    manager.legacy_history_file.write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert list(manager._load_history_data()) == legacy[-MAX_RECORDS:]
+
+    manager.save_test_result(_Metrics(50.0))
+    manager.flush()
+
+    records = _read_jsonl(manager.history_file)
+    assert records[:-1] == legacy[-MAX_RECORDS + 1:]
+    assert records[-1]["success_rate"] == 50.0
+    # 重新加载时优先读取 JSONL 文件
+    assert list(HistoryDataManager("unit")._load_history_data()) == records
+
+
+def test_flush_appends_all_pending_records(manager):
+    """多次保存合并为一次追加写入，文件内容与内存缓存一致"""
+    manager.save_test_result(_Metrics(90.0))
+    manager.flush()
+    for rate in (80.0, 85.0, 70.0):
+        manager.save_test_result(_Metrics(rate))
+    assert len(_read_jsonl(manager.history_file)) == 1
+
+    manager.flush()
+
+    records = _read_jsonl(manager.history_file)
+    assert [r["success_rate"] for r in records] == [90.0, 80.0, 85.0, 70.0]
+    assert records == list(manager._load_history_data())
+    assert manager._file_lines == 4
+
+
+def test_history_file_is_rewritten_after_rotate_threshold(manager):
+    """文件行数超过 ROTATE_THRESHOLD 时整体重写，仅保留最近 MAX_RECORDS 条"""
+    for i in range(ROTATE_THRESHOLD + 1):
+        manager.save_test_result(_Metrics(float(i)))
+        manager.flush()
+
+    records = _read_jsonl(manager.history_file)
+    assert len(records) <= ROTATE_THRESHOLD
+    assert records[-MAX_RECORDS:] == list(manager._load_history_data())
+    assert list(HistoryDataManager("unit")._load_history_data()) == records[-MAX_RECORDS:]
+
+
+def test_incremental_trend_sums_match_recomputation(manager):
+    """增量维护的窗口和与每次重新切片求和的结果一致，包括环形缓冲区淘汰旧记录之后"""
+    rng = random.Random(0)
+    for _ in range(MAX_RECORDS * 2 + 3):
+        manager.save_test_result(_Metrics(round(rng.uniform(0, 100), 2)))
+        history = list(manager._load_history_data())
+
+        stats = manager.get_trend_statistics()
+        if len(history) < 2:
+            assert stats["has_trend"] is False
+        else:
+            expected = _old_trend_statistics(history)
+            assert (stats["avg_recent_5"], stats["avg_earlier_5"], stats["trend_diff"]) == expected
+
+        summary = manager.get_history_summary()
+        avg, max_rate, min_rate = _old_history_summary(history)
+        assert summary["avg_success_rate"] == avg
+        assert summary["max_success_rate"] == max_rate
+        assert summary["min_success_rate"] == min_rate
+
+
+@pytest.mark.parametrize("limit", [0, -1, 3, 10, 100])
+def test_history_summary_limit(manager, limit):
+    """limit <= 0 或不小于记录数时统计全部记录，否则只统计最近 limit 条"""
+    rates = [float(i) for i in range(1, 13)]
+    for rate in rates:
+        manager.save_test_result(_Metrics(rate))
+
+    summary = manager.get_history_summary(limit=limit)
+
+    recent = rates[-limit:] if 0 < limit < len(rates) else rates
+    assert summary["recent_records"] == len(recent)
+    assert summary["avg_success_rate"] == round(sum(recent) / len(recent), 1)
+    assert summary["min_success_rate"] == recent[0]
+
+
+def test_get_history_manager_shares_unflushed_records(tmp_path, monkeypatch):
+    """同一项目返回同一实例，保存后尚未落盘的记录对后续获取的管理器可见"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(history_data_manager, "_managers", {})
+    monkeypatch.setattr(history_data_manager.HistoryDataManager, "_schedule_drain", lambda self: None)
+
+    first = history_data_manager.get_history_manager("unit")
+    first.save_test_result(_Metrics(80.0))
+    first.save_test_result(_Metrics(90.0))
+    second = history_data_manager.get_history_manager("unit")
+
+    assert second is first
+    assert not second.history_file.exists()
+    assert second.get_previous_success_rate() == 80.0
+    assert history_data_manager.get_history_manager("other") is not first
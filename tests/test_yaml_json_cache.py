@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+yaml 解析结果 JSON 缓存测试
+校验 JSON 缓存命中时的结果与直接解析 yaml 一致，文件变化或数据无法无损转换时不使用缓存
+"""
+import json
+import os
+
+import pytest
+import yaml
+
+from utils.read_files_tools import yaml_control
+from utils.read_files_tools.yaml_control import GetYamlData
+
+CASE_YAML = """\
+case_common:
+  allureEpic: 开发平台接口
+  allureFeature: 登录模块
+login_01:
+  host: ${{host()}}
+  url: /user/login
+  method: POST
+  is_run:
+  data:
+    username: '18800000001'
+    password: 123456
+    rate: 1.5
+    flags: [true, false, null]
+  assert:
+    errorCode: {jsonpath: $.errorCode, type: ==, value: 0}
+"""
+
+
+@pytest.fixture(autouse=True, params=["orjson", "json"])
+def json_cache_dir(request, tmp_path, monkeypatch):
+    """JSON 缓存写入临时目录，进程内缓存置空；分别使用 orjson 与标准库 json 读取缓存"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(yaml_control, "YAML_JSON_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(yaml_control, "_YAML_CACHE", {})
+    if request.param == "json":
+        monkeypatch.setattr(yaml_control, "orjson", None)
+    elif yaml_control.orjson is None:
+        pytest.skip("orjson 未安装")
+    return cache_dir
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _parse_directly(file_dir):
+    with open(file_dir, "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=yaml.FullLoader)
+
+
+def _forbid_yaml_parse(monkeypatch):
+    """禁止再次解析 yaml，确保结果来自 JSON 缓存"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("不应重新解析 yaml")
+
+    monkeypatch.setattr(yaml_control.yaml, "load", fail)
+
+
+def test_json_cache_round_trip(tmp_path, monkeypatch):
+    """新进程（进程内缓存为空）读取 JSON 缓存的结果与直接解析 yaml 一致，键顺序不变"""
+    file_dir = _write(tmp_path / "login.yaml", CASE_YAML)
+    expected = _parse_directly(file_dir)
+    assert GetYamlData(file_dir).get_yaml_data() == expected
+    assert os.path.exists(yaml_control._json_cache_path(file_dir))
+
+    monkeypatch.setattr(yaml_control, "_YAML_CACHE", {})
+    _forbid_yaml_parse(monkeypatch)
+    data = GetYamlData(file_dir).get_yaml_data()
+
+    assert data == expected
+    assert list(data) == list(expected)
+    assert list(data["login_01"]["data"]) == list(expected["login_01"]["data"])
+
+
+def test_json_cache_invalidated_by_content_change(tmp_path, monkeypatch):
+    """yaml 文件大小变化后重新解析"""
+    file_dir = _write(tmp_path / "login.yaml", CASE_YAML)
+    GetYamlData(file_dir).get_yaml_data()
+
+    _write(tmp_path / "login.yaml", CASE_YAML.replace("/user/login", "/user/login/v2"))
+    monkeypatch.setattr(yaml_control, "_YAML_CACHE", {})
+
+    assert GetYamlData(file_dir).get_yaml_data()["login_01"]["url"] == "/user/login/v2"
+
+
+def test_json_cache_invalidated_by_mtime_change(tmp_path, monkeypatch):
+    """yaml 文件大小不变、修改时间变化时重新解析"""
+    file_dir = _write(tmp_path / "login.yaml", CASE_YAML)
+    GetYamlData(file_dir).get_yaml_data()
+    mtime_ns = os.stat(file_dir).st_mtime_ns
+
+    _write(tmp_path / "login.yaml", CASE_YAML.replace("POST", "GETX"))
+    os.utime(file_dir, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    monkeypatch.setattr(yaml_control, "_YAML_CACHE", {})
+
+    assert GetYamlData(file_dir).get_yaml_data()["login_01"]["method"] == "GETX"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "created: 2022-03-28\n",
+        "1: int key\n",
+        "1.5: float key\n",
+        "point: !!python/tuple [1, 2]\n",
+        "ratio: .nan\n",
+    ],
+)
+def test_lossy_data_is_not_cached(tmp_path, monkeypatch, text):
+    """日期、非字符串键、元组、NaN 等无法与 JSON 无损互转的数据不写入缓存，结果仍与直接解析一致"""
+    file_dir = _write(tmp_path / "lossy.yaml", text)
+    expected = _parse_directly(file_dir)
+
+    data = GetYamlData(file_dir).get_yaml_data()
+
+    assert not os.path.exists(yaml_control._json_cache_path(file_dir))
+    assert repr(data) == repr(expected)
+
+
+def test_corrupt_json_cache_falls_back_to_yaml(tmp_path, json_cache_dir):
+    """JSON 缓存文件损坏时重新解析 yaml"""
+    file_dir = _write(tmp_path / "login.yaml", CASE_YAML)
+    json_cache_dir.mkdir(parents=True)
+    with open(yaml_control._json_cache_path(file_dir), "w", encoding="utf-8") as file:
+        file.write("{not json")
+
+    assert GetYamlData(file_dir).get_yaml_data() == _parse_directly(file_dir)
+    with open(yaml_control._json_cache_path(file_dir), encoding="utf-8") as file:
+        assert json.load(file)["data"] == _parse_directly(file_dir)
+
+
+def test_returned_data_is_a_copy(tmp_path):
+    """调用方修改返回结果不影响后续读取"""
+    file_dir = _write(tmp_path / "login.yaml", CASE_YAML)
+    data = GetYamlData(file_dir).get_yaml_data()
+    data["login_01"]["data"]["username"] = "changed"
+
+    assert GetYamlData(file_dir).get_yaml_data()["login_01"]["data"]["username"] == "18800000001"
@@ -31,7 +31,7 @@ from utils import config
 from utils.assertion import assert_type
 from utils.logging_tool.log_control import ERROR, WARNING
 from utils.other_tools.exceptions import AssertTypeError, JsonpathExtractionFailed, SqlNotFound
-from utils.other_tools.models import AssertMethod, load_module_functions
+from utils.other_tools.models import ASSERT_METHOD_NAMES, AssertMethod, load_module_functions
 from utils.read_files_tools.regular_control import cache_regular
 
 
@@ -107,7 +107,11 @@ class AssertUtil:
         assert "type" in self.get_assert_data.keys(), f"断言数据 '{self.get_assert_data}' 中缺少 'type' 属性"
 
         # 获取断言类型对应的枚举值名称
-        name = AssertMethod(self.get_assert_data.get("type")).name
+        _type = self.get_assert_data.get("type")
+        name = ASSERT_METHOD_NAMES.get(_type)
+        if name is None:
+            # 未知的断言类型，交由枚举抛出 ValueError
+            name = AssertMethod(_type).name
         return name
 
     @property
@@ -13,19 +13,32 @@ This module provides health check functionality.
 @Time   : 2023-12-20
 @Author : txl
 """
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from pathlib import Path
 import json
 import os
+import platform
 import requests
 import sys
 import threading
 import time
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import psutil
 
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
+# 网络连通性探测地址，并发发起 HEAD 请求，任一成功即视为网络正常
+CONNECTIVITY_TEST_URLS = ["https://www.baidu.com", "https://www.google.com", "https://httpbin.org/get"]
+
+# 网络连通性探测单个请求的超时时间（秒）
+NETWORK_TIMEOUT = 5
+# run_all_checks 的整体耗时预算（秒），需大于最慢检查项（网络探测）的耗时上限，
+# 仅在检查项卡住等异常情况下才返回上次结果
+OVERALL_BUDGET = NETWORK_TIMEOUT + 1
+# 执行检查项的常驻线程数
+CHECK_WORKERS = 8
+
 
 class HealthChecker:
     """健康检查器"""
@@ -34,6 +47,16 @@ class HealthChecker:
         self.checks = {}
         self.last_check_time = None
         self.check_interval = 30  # 30秒检查一次
+        # 进程级静态信息只需获取一次
+        self._sys_info = {"python_version": platform.python_version(), "platform": sys.platform, "pid": os.getpid()}
+        self._create_time = psutil.Process().create_time()
+        # 预取一次 CPU 采样，之后 cpu_percent(interval=None) 返回距上次调用期间的使用率，无需阻塞等待
+        psutil.cpu_percent(interval=None)
+        # 常驻线程池，避免每次探测都新建线程池；_running 记录仍在执行的检查，避免重复提交导致线程堆积
+        self._executor = ThreadPoolExecutor(max_workers=CHECK_WORKERS, thread_name_prefix="health-check")
+        self._running: Dict[str, Future] = {}
+        # 保护 last_result / last_check 与 _running，检查线程与请求线程会并发访问
+        self._lock = threading.Lock()
 
     def register_check(self, name: str, check_func, critical: bool = False):
         """注册健康检查项"""
@@ -42,7 +65,7 @@ class HealthChecker:
     def check_system_resources(self) -> Dict[str, Any]:
         """检查系统资源"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage("/")
 
@@ -128,20 +151,38 @@ class HealthChecker:
     def check_network_connectivity(self) -> Dict[str, Any]:
         """检查网络连接"""
         try:
-            # 检查外网连接
-            test_urls = ["https://www.baidu.com", "https://www.google.com", "https://httpbin.org/get"]
-
-            connectivity_results = {}
-            for url in test_urls:
-                try:
-                    response = requests.get(url, timeout=5)
-                    connectivity_results[url] = {
-                        "status": "ok",
-                        "status_code": response.status_code,
-                        "response_time": response.elapsed.total_seconds(),
-                    }
-                except Exception as e:
-                    connectivity_results[url] = {"status": "error", "error": str(e)}
+            # 检查外网连接：并发 HEAD 请求，首个成功即返回，其余标记为 pending
+            test_urls = CONNECTIVITY_TEST_URLS
+            connectivity_results = {url: {"status": "pending"} for url in test_urls}
+
+            executor = ThreadPoolExecutor(max_workers=len(test_urls))
+            # requests.Session 不保证线程安全，各线程独立发起请求
+            futures = {
+                executor.submit(requests.head, url, timeout=NETWORK_TIMEOUT, allow_redirects=True): url
+                for url in test_urls
+            }
+            try:
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        connectivity_results[url] = {"status": "error", "error": str(e)}
+                        continue
+
+                    if response.status_code < 400:
+                        connectivity_results[url] = {
+                            "status": "ok",
+                            "status_code": response.status_code,
+                            "response_time": response.elapsed.total_seconds(),
+                        }
+                        break
+                    connectivity_results[url] = {"status": "error", "status_code": response.status_code}
+            finally:
+                # 取消尚未开始的请求后不等待已发出的请求；shutdown 的 cancel_futures 参数需 Python 3.9+
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
 
             successful_connections = sum(1 for result in connectivity_results.values() if result["status"] == "ok")
 
@@ -177,8 +218,61 @@ class HealthChecker:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
-    def run_all_checks(self) -> Dict[str, Any]:
-        """运行所有健康检查"""
+    def _run_check(self, check_info: Dict[str, Any]) -> Dict[str, Any]:
+        """执行单个检查项并记录结果"""
+        try:
+            result = check_info["func"]()
+        except Exception as e:
+            result = {"status": "error", "error": str(e)}
+        with self._lock:
+            check_info["last_result"] = result
+            check_info["last_check"] = time.time()
+        return result
+
+    def _collect_results(self, budget: Optional[float]) -> Dict[str, Dict[str, Any]]:
+        """
+        并发执行所有检查项，在预算时间内收集结果
+
+        超时未完成的检查项返回上次结果并标记 stale，检查线程在后台继续运行，
+        完成后会刷新 last_result 供下次使用；仍在运行的检查项不会被重复提交。
+        """
+        futures = {}
+        with self._lock:
+            for name, info in self.checks.items():
+                future = self._running.get(name)
+                if future is None or future.done():
+                    future = self._executor.submit(self._run_check, info)
+                    self._running[name] = future
+                futures[future] = name
+
+        finished = {}
+        try:
+            for future in as_completed(futures, timeout=budget):
+                finished[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            with self._lock:
+                for future, name in futures.items():
+                    if name in finished:
+                        continue
+                    if future.done():
+                        finished[name] = future.result()
+                        continue
+                    last_result = self.checks[name]["last_result"]
+                    if last_result is not None:
+                        finished[name] = {**last_result, "stale": True}
+                    else:
+                        finished[name] = {"status": "warning", "error": "检查超时，暂无历史结果", "stale": True}
+
+        # 保持与注册顺序一致
+        return {name: finished[name] for name in self.checks}
+
+    def run_all_checks(self, budget: Optional[float] = OVERALL_BUDGET) -> Dict[str, Any]:
+        """
+        运行所有健康检查
+
+        Args:
+            budget: 整体耗时预算（秒），为 None 时等待全部检查完成
+        """
         self.last_check_time = time.time()
 
         # 注册默认检查项
@@ -189,51 +283,36 @@ class HealthChecker:
             self.register_check("network", self.check_network_connectivity, critical=False)
             self.register_check("configuration", self.check_configuration, critical=True)
 
-        results = {}
+        results = self._collect_results(budget)
         overall_status = "healthy"
         critical_failures = []
 
         for name, check_info in self.checks.items():
-            try:
-                result = check_info["func"]()
-                check_info["last_result"] = result
-                check_info["last_check"] = time.time()
-                results[name] = result
-
-                # 检查关键项目的状态
-                if check_info["critical"] and result.get("status") == "error":
-                    critical_failures.append(name)
-                    overall_status = "unhealthy"
-                elif result.get("status") == "warning" and overall_status == "healthy":
-                    overall_status = "warning"
-
-            except Exception as e:
-                error_result = {"status": "error", "error": str(e)}
-                check_info["last_result"] = error_result
-                check_info["last_check"] = time.time()
-                results[name] = error_result
-
-                if check_info["critical"]:
-                    critical_failures.append(name)
-                    overall_status = "unhealthy"
+            result = results[name]
+
+            # 检查关键项目的状态
+            if check_info["critical"] and result.get("status") == "error":
+                critical_failures.append(name)
+                overall_status = "unhealthy"
+            elif result.get("status") == "warning" and overall_status == "healthy":
+                overall_status = "warning"
 
         return {
             "overall_status": overall_status,
             "timestamp": self.last_check_time,
             "critical_failures": critical_failures,
             "checks": results,
-            "system_info": {
-                "python_version": sys.version,
-                "platform": sys.platform,
-                "pid": os.getpid(),
-                "uptime": time.time() - psutil.Process().create_time(),
-            },
+            "system_info": {**self._sys_info, "uptime": time.time() - self._create_time},
         }
 
 
 class HealthCheckHandler(BaseHTTPRequestHandler):
     """健康检查HTTP处理器"""
 
+    # 存活检查响应中仅时间戳会变化，其余部分在类定义时预先编码
+    LIVE_PREFIX = b'{"status": "alive", "pid": ' + str(os.getpid()).encode() + b', "timestamp": '
+    LIVE_SUFFIX = b"}"
+
     def __init__(self, health_checker: HealthChecker, *args, **kwargs):
         self.health_checker = health_checker
         super().__init__(*args, **kwargs)
@@ -291,9 +370,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         self.send_header("Content-Type", "application/json")
         self.end_headers()
 
-        response = {"status": "alive", "timestamp": time.time(), "pid": os.getpid()}
-
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(self.LIVE_PREFIX + f"{time.time():.3f}".encode() + self.LIVE_SUFFIX)
 
     def handle_readiness_check(self):
         """处理就绪检查"""
@@ -357,7 +434,7 @@ def main():
     health_checker = HealthChecker()
 
     print("🏥 运行健康检查...")
-    health_status = health_checker.run_all_checks()
+    health_status = health_checker.run_all_checks(budget=None)
 
     print("\n📊 健康检查结果:")
     print(f"   总体状态: {health_status['overall_status']}")
@@ -161,8 +161,9 @@ def setup_utf8_encoding():
     EncodingFixer.fix_console_encoding()
 
 
-# 自动修复编码（导入时执行）
-if __name__ != "__main__":
+# 默认不在导入时修改全局状态，由程序入口显式调用 setup_utf8_encoding()；
+# 如需保留导入即修复的旧行为，可设置环境变量 PY_AUTO_UTF8=1
+if __name__ != "__main__" and os.environ.get("PY_AUTO_UTF8") == "1":
     setup_utf8_encoding()
 
 
@@ -14,15 +14,69 @@ This module provides log control functionality.
 @Author : txl
 @Update : 2023-12-20 优化日志配置和类型注解
 """
+import json
 import logging
 import time
 from logging import handlers
-from typing import Dict
+from typing import Any, Dict
 
 import colorlog
 
 from common.setting import ensure_path_sep
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 结构化请求详情字段在控制台中展示的中文标签
+DETAIL_LABELS: Dict[str, str] = {
+    "title": "用例标题",
+    "url": "请求路径",
+    "method": "请求方式",
+    "headers": "请求头",
+    "request_body": "请求内容",
+    "response_data": "接口响应内容",
+    "res_time": "接口响应时长(ms)",
+    "status_code": "Http状态码",
+}
+
+
+def dumps_detail(detail: Any) -> str:
+    """将结构化日志字段序列化为 JSON 字符串，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(detail, default=str).decode("utf-8")
+    return json.dumps(detail, ensure_ascii=False, default=str)
+
+
+class DetailFormatter(logging.Formatter):
+    """文件日志格式化器，记录携带 detail 字段时以 JSON 追加到日志行末尾"""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        detail = getattr(record, "detail", None)
+        if detail is None:
+            return message
+        return f"{message} {dumps_detail(detail)}"
+
+
+class ColoredDetailFormatter(colorlog.ColoredFormatter):
+    """控制台彩色格式化器，记录携带 detail 字段时展开为多行可读文本"""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        detail = getattr(record, "detail", None)
+        if detail is not None:
+            # 复制一份记录再展开，避免影响同一条记录的其他处理器
+            record = logging.makeLogRecord(record.__dict__)
+            lines = "\n".join(f"{DETAIL_LABELS.get(k, k)}: {v}" for k, v in detail.items())
+            record.message = (
+                f"{record.message}\n"
+                "======================================================\n"
+                f"{lines}\n"
+                "====================================================="
+            )
+        return super().formatMessage(record)
+
 
 class LogHandler:
     """日志处理器，提供彩色日志输出和文件日志记录功能"""
@@ -61,7 +115,7 @@ class LogHandler:
         formatter = self._create_color_formatter()
 
         # 设置日志格式
-        file_formatter = logging.Formatter(fmt)
+        file_formatter = DetailFormatter(fmt)
         # 设置日志级别
         self.logger.setLevel(self.level_relations.get(level, logging.INFO))
 
@@ -83,7 +137,7 @@ class LogHandler:
         self.log_path = ensure_path_sep("\\logs\\log.log")
 
     @classmethod
-    def _create_color_formatter(cls) -> colorlog.ColoredFormatter:
+    def _create_color_formatter(cls) -> ColoredDetailFormatter:
         """
         创建彩色日志格式化器
 
@@ -98,7 +152,7 @@ class LogHandler:
             "CRITICAL": "red",
         }
 
-        formatter = colorlog.ColoredFormatter(
+        formatter = ColoredDetailFormatter(
             "%(log_color)s[%(asctime)s] [%(name)s] [%(levelname)s]: %(message)s",
             log_colors=log_colors_config,
             datefmt="%Y-%m-%d %H:%M:%S",
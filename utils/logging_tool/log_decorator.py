@@ -18,6 +18,8 @@ from functools import wraps
 from utils.logging_tool.log_control import ERROR, INFO
 from utils.read_files_tools.regular_control import cache_regular
 
+_LOG_FORMAT = "REQ %s %s -> %s in %sms"
+
 
 def log_decorator(switch: bool):
     """
@@ -56,25 +58,25 @@ def log_decorator(switch: bool):
             res = func(*args, **kwargs)
             # 判断日志开关为开启状态
             if switch:
-                _log_msg = (
-                    "\n======================================================\n"
-                    f"用例标题: {res.detail}\n"
-                    f"请求路径: {res.url}\n"
-                    f"请求方式: {res.method}\n"
-                    f"请求头:   {res.headers}\n"
-                    f"请求内容: {res.request_body}\n"
-                    f"接口响应内容: {res.response_data}\n"
-                    f"接口响应时长: {res.res_time} ms\n"
-                    f"Http状态码: {res.status_code}\n"
-                    "====================================================="
-                )
+                # 日志内容按需惰性格式化，请求详情以结构化字段交由处理器序列化
+                _log_args = (res.method, res.url, res.status_code, res.res_time)
+                _detail = {
+                    "title": res.detail,
+                    "url": res.url,
+                    "method": res.method,
+                    "headers": res.headers,
+                    "request_body": res.request_body,
+                    "response_data": res.response_data,
+                    "res_time": res.res_time,
+                    "status_code": res.status_code,
+                }
                 _is_run = ast.literal_eval(cache_regular(str(res.is_run)))
                 # 判断正常打印的日志，控制台输出绿色
                 if _is_run in (True, None) and res.status_code == 200:
-                    INFO.logger.info(_log_msg)
+                    INFO.logger.info(_LOG_FORMAT, *_log_args, extra={"detail": _detail})
                 else:
                     # 失败的用例，控制台打印红色
-                    ERROR.logger.error(_log_msg)
+                    ERROR.logger.error(_LOG_FORMAT, *_log_args, extra={"detail": _detail})
             return res
 
         return swapper
@@ -25,6 +25,7 @@ MySQL数据库操作控制模块
 import ast
 import datetime
 import decimal
+import re
 from typing import Dict, List, Text, Union
 from warnings import filterwarnings
 
@@ -37,6 +38,27 @@ from utils.read_files_tools.regular_control import cache_regular, sql_regular
 
 filterwarnings("ignore", category=pymysql.Warning)
 
+# 识别写操作 / 查询操作 sql 的预编译正则
+_WRITE_RE = re.compile(r"^\s*(update|delete|insert)\b", re.I)
+_SELECT_RE = re.compile(r"^\s*select\b", re.I)
+
+
+# 查询结果中需要转换的字段类型，按值的精确类型查表
+_CONV = {decimal.Decimal: float, datetime.datetime: str, datetime.date: str}
+
+
+def _convert_value(value):
+    """转换 sql 查询结果中的字段值，精确类型未命中时按 isinstance 兜底，兼容 Decimal、datetime 的子类"""
+    conv = _CONV.get(type(value))
+    if conv is not None:
+        return conv(value)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, datetime.date):
+        # datetime.datetime 为 datetime.date 的子类，一并转换为字符串
+        return str(value)
+    return value
+
 
 class MysqlDB:
     """
@@ -47,18 +69,20 @@ class MysqlDB:
 
     特性：
     - 自动连接管理
-    - 字典格式返回查询结果
+    - 字典格式返回查询结果（元组游标 + 列名组装，避免 DictCursor 的逐行开销）
     - 事务支持
     - 异常处理和日志记录
     """
 
+    __slots__ = ("conn", "cur", "_col_names")
+
     if config.mysql_db.switch:
 
         def __init__(self) -> None:
             """
             初始化数据库连接
 
-            根据配置文件中的数据库配置建立连接，使用字典游标返回查询结果。
+            根据配置文件中的数据库配置建立连接，使用默认元组游标，查询时按列名组装字典。
 
             Raises:
                 AttributeError: 当数据库配置错误或连接失败时抛出
@@ -72,8 +96,9 @@ class MysqlDB:
                     port=config.mysql_db.port,
                 )
 
-                # 使用字典游标，查询结果以字典形式返回，便于数据处理
-                self.cur = self.conn.cursor(cursor=pymysql.cursors.DictCursor)
+                # 使用默认元组游标，查询结果在 query 中按列名组装为字典
+                self.cur = self.conn.cursor()
+                self._col_names = []
             except AttributeError as error:
                 ERROR.logger.error("数据库连接失败，失败原因 %s", error)
                 raise
@@ -96,18 +121,36 @@ class MysqlDB:
             """
             try:
                 self.cur.execute(sql)
+                # 缓存本次查询的列名，用于将元组行组装为字典
+                names = [d[0] for d in self.cur.description] if self.cur.description else []
+                self._col_names = names
 
                 if state == "all":
                     # 查询全部
-                    data = self.cur.fetchall()
-                else:
-                    # 查询单条
-                    data = self.cur.fetchone()
-                return data
+                    return [dict(zip(names, row)) for row in self.cur.fetchall()]
+                # 查询单条
+                row = self.cur.fetchone()
+                return dict(zip(names, row)) if row is not None else None
             except AttributeError as error_data:
                 ERROR.logger.error("数据库连接失败，失败原因 %s", error_data)
                 raise
 
+        def iter_query(self, sql):
+            """
+            流式查询，使用服务端游标逐行返回结果，不将全部结果加载到内存
+            注意：迭代结束前同一连接上不能执行其他 sql
+            :param sql:
+            :return: 逐行生成的字典
+            """
+            cur = self.conn.cursor(pymysql.cursors.SSCursor)
+            try:
+                cur.execute(sql)
+                names = [d[0] for d in cur.description] if cur.description else []
+                for row in cur:
+                    yield dict(zip(names, row))
+            finally:
+                cur.close()
+
         def execute(self, sql: Text):
             """
             更新 、 删除、 新增
@@ -126,46 +169,72 @@ class MysqlDB:
                 self.conn.rollback()
                 raise
 
+        def execute_batch(self, sql_list: List[Text]):
+            """
+            在同一事务中逐条执行多条 更新 、 删除、 新增 sql，最后统一提交一次，减少提交带来的网络往返
+            不开启 MULTI_STATEMENTS，避免经缓存、响应替换后的 sql 被拼接执行额外语句
+            :param sql_list: sql 列表
+            :return:
+            """
+            try:
+                for i in sql_list:
+                    self.cur.execute(i)
+                self.conn.commit()
+            except AttributeError as error:
+                ERROR.logger.error("数据库连接失败，失败原因 %s", error)
+                self.conn.rollback()
+                raise
+
         @classmethod
-        def sql_data_handler(cls, query_data, data):
+        def sql_data_handler(cls, query_data, data, names=None):
             """
             处理部分类型sql查询出来的数据格式
-            @param query_data: 查询出来的sql数据
+            @param query_data: 查询出来的sql数据，字典或配合 names 使用的元组行
             @param data: 数据池
+            @param names: 列名列表，query_data 为元组行时传入
             @return:
             """
+            items = zip(names, query_data) if names is not None else query_data.items()
             # 将sql 返回的所有内容全部放入对象中
-            for key, value in query_data.items():
-                if isinstance(value, decimal.Decimal):
-                    data[key] = float(value)
-                elif isinstance(value, datetime.datetime):
-                    data[key] = str(value)
-                else:
-                    data[key] = value
+            for key, value in items:
+                data[key] = _convert_value(value)
             return data
 
 
 class SetUpMySQL(MysqlDB):
     """处理前置sql"""
 
+    __slots__ = ()
+
     def setup_sql_data(self, sql: Union[List, None]) -> Dict:
         """
         处理前置请求sql
         :param sql:
         :return:
         """
-        sql = ast.literal_eval(cache_regular(str(sql)))
+        # 列表逐条替换缓存数据，避免 str -> literal_eval 的整体解析往返
+        if isinstance(sql, list):
+            sql = [cache_regular(i) for i in sql]
+        else:
+            sql = ast.literal_eval(cache_regular(str(sql)))
         try:
             data = {}
             if sql is not None:
+                # 连续的写操作 sql 在同一事务中执行并统一提交，遇到查询语句前先执行已积攒的写操作，保证执行顺序
+                writes = []
                 for i in sql:
                     # 判断断言类型为查询类型的时候，
-                    if i[0:6].upper() == "SELECT":
+                    if _SELECT_RE.match(i):
+                        if writes:
+                            self.execute_batch(writes)
+                            writes = []
                         sql_date = self.query(sql=i)[0]
                         for key, value in sql_date.items():
                             data[key] = value
                     else:
-                        self.execute(sql=i)
+                        writes.append(i)
+                if writes:
+                    self.execute_batch(writes)
             return data
         except IndexError as exc:
             raise DataAcquisitionFailed("sql 数据查询失败，请检查setup_sql语句是否正确") from exc
@@ -174,6 +243,8 @@ class SetUpMySQL(MysqlDB):
 class AssertExecution(MysqlDB):
     """处理断言sql数据"""
 
+    __slots__ = ()
+
     def assert_execution(self, sql: list, resp) -> dict:
         """
          执行 sql, 负责处理 yaml 文件中的断言需要执行多条 sql 的场景，最终会将所有数据以对象形式返回
@@ -185,8 +256,7 @@ class AssertExecution(MysqlDB):
             if isinstance(sql, list):
 
                 data = {}
-                _sql_type = ["UPDATE", "update", "DELETE", "delete", "INSERT", "insert"]
-                if any(i in sql for i in _sql_type) is False:
+                if not any(_WRITE_RE.match(stmt) for stmt in sql):
                     for i in sql:
                         # 判断sql中是否有正则，如果有则通过jsonpath提取相关的数据
                         sql = sql_regular(i, resp)
@@ -12,7 +12,8 @@ This module provides alert level management functionality.
 @Author : txl
 """
 
-from typing import Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence
 from enum import Enum
 
 
@@ -25,6 +26,114 @@ class AlertLevel(Enum):
     INFO = "info"        # 信息 - 无测试或跳过
 
 
+class LevelMeta(NamedTuple):
+    """告警等级的静态元数据，每个颜色共享一个不可变实例"""
+    icon: str
+    level: str
+    color: str
+    priority: int
+    description: str
+
+
+class AlertResult(NamedTuple):
+    """告警级别计算结果"""
+    meta: LevelMeta
+    success_rate: float
+    total_cases: int
+    failed_cases: int
+    alert_level: str
+
+    @property
+    def icon(self) -> str:
+        return self.meta.icon
+
+    @property
+    def level(self) -> str:
+        return self.meta.level
+
+    @property
+    def description(self) -> str:
+        return self.meta.description
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典，兼容旧的字典格式调用方"""
+        return {
+            **self.meta._asdict(),
+            "success_rate": self.success_rate,
+            "total_cases": self.total_cases,
+            "failed_cases": self.failed_cases,
+            "alert_level": self.alert_level
+        }
+
+
+# 预警颜色对应的等级信息，模块加载时构建一次
+_LEVELS: Dict[str, LevelMeta] = {
+    "red": LevelMeta("🔴", "[I级/特别严重]", "#FF0000", 1, "严重故障，需要立即处理"),
+    "orange": LevelMeta("🟠", "[II级/严重]", "#FF8C00", 2, "重要故障，需要尽快处理"),
+    "yellow": LevelMeta("🟡", "[III级/较重]", "#FFD700", 3, "一般故障，需要关注"),
+    "blue": LevelMeta("🔵", "[IV级/一般]", "#1E90FF", 4, "轻微问题，建议优化"),
+    "green": LevelMeta("🟢", "[正常]", "#32CD32", 5, "运行正常，无需处理"),
+}
+
+_UNKNOWN_LEVEL = LevelMeta("⚪", "[未知]", "#808080", 0, "未知状态")
+
+# 平均响应时间(毫秒)上限（升序）与性能指示器，bisect_left 的结果即指示器下标
+_PERFORMANCE_THRESHOLDS = (200, 500, 1000, 2000)
+_PERFORMANCE_INDICATORS = (
+    {"icon": "🚀", "level": "优秀", "color": "green"},
+    {"icon": "✅", "level": "良好", "color": "blue"},
+    {"icon": "⚠️", "level": "一般", "color": "yellow"},
+    {"icon": "🐌", "level": "较慢", "color": "orange"},
+    {"icon": "🔥", "level": "很慢", "color": "red"},
+)
+
+# 成功率阈值（升序）与对应颜色，bisect_right 的结果即颜色下标，下标越小越严重
+_RATE_THRESHOLDS = (40, 60, 80, 95)
+_RATE_COLORS = ("red", "orange", "yellow", "blue", "green")
+
+# 失败用例数阈值（升序），依次命中时最低告警颜色为 yellow / orange / red
+_FAIL_THRESHOLDS = (5, 10, 20)
+
+# 趋势指示器：显著上升、轻微上升、持平、轻微下降、显著下降
+_TREND_ICONS = ("📈", "↗️", "➖", "↘️", "📉")
+
+
+def _classify(success_rate: float, failed_cases: int) -> int:
+    """计算告警颜色在 _RATE_COLORS 中的下标"""
+    # NaN 与任何阈值比较均为 False，bisect 会将其归入最健康的一档；
+    # 这里与原先逐级比较的判断保持一致：成功率为 NaN 时为 red，
+    # 失败数为 NaN 时不提升告警级别
+    if success_rate != success_rate:
+        return 0
+    rate_index = bisect_right(_RATE_THRESHOLDS, success_rate)
+    fail_index = bisect_right(_FAIL_THRESHOLDS, failed_cases) if failed_cases == failed_cases else 0
+    if not fail_index:
+        return rate_index
+    # 命中 1/2/3 个失败阈值时对应下标 2/1/0，取两者中更严重的一个
+    return min(rate_index, len(_FAIL_THRESHOLDS) - fail_index)
+
+
+def _trend_index(diff: float) -> int:
+    """计算成功率变化量在 _TREND_ICONS 中的下标"""
+    if diff > 5:
+        return 0
+    if diff > 0:
+        return 1
+    if diff < -5:
+        return 4
+    if diff < 0:
+        return 3
+    return 2
+
+
+def _performance_index(avg_response_time: float) -> int:
+    """计算平均响应时间在 _PERFORMANCE_INDICATORS 中的下标"""
+    # NaN 不满足任何 <= 阈值的判断，与原逻辑一致归为最慢一档
+    if avg_response_time != avg_response_time:
+        return len(_PERFORMANCE_THRESHOLDS)
+    return bisect_left(_PERFORMANCE_THRESHOLDS, avg_response_time)
+
+
 def get_warning_level_info(color: str) -> Dict[str, Any]:
     """
     根据预警颜色获取等级和图标
@@ -33,56 +142,12 @@ def get_warning_level_info(color: str) -> Dict[str, Any]:
         color: 预警颜色 (red/orange/yellow/blue/green)
         
     Returns:
-        包含图标和级别信息的字典
+        包含图标和级别信息的字典（每次返回新字典，调用方可直接修改）
     """
-    levels = {
-        "red": {
-            "icon": "🔴", 
-            "level": "[I级/特别严重]",
-            "color": "#FF0000",
-            "priority": 1,
-            "description": "严重故障，需要立即处理"
-        },
-        "orange": {
-            "icon": "🟠", 
-            "level": "[II级/严重]",
-            "color": "#FF8C00", 
-            "priority": 2,
-            "description": "重要故障，需要尽快处理"
-        },
-        "yellow": {
-            "icon": "🟡", 
-            "level": "[III级/较重]",
-            "color": "#FFD700",
-            "priority": 3, 
-            "description": "一般故障，需要关注"
-        },
-        "blue": {
-            "icon": "🔵", 
-            "level": "[IV级/一般]",
-            "color": "#1E90FF",
-            "priority": 4,
-            "description": "轻微问题，建议优化"
-        },
-        "green": {
-            "icon": "🟢", 
-            "level": "[正常]",
-            "color": "#32CD32",
-            "priority": 5,
-            "description": "运行正常，无需处理"
-        }
-    }
-    
-    return levels.get(color, {
-        "icon": "⚪", 
-        "level": "[未知]",
-        "color": "#808080",
-        "priority": 0,
-        "description": "未知状态"
-    })
+    return _LEVELS.get(color, _UNKNOWN_LEVEL)._asdict()
 
 
-def calculate_alert_level(success_rate: float, total_cases: int, failed_cases: int) -> Dict[str, Any]:
+def calculate_alert_level(success_rate: float, total_cases: int, failed_cases: int) -> AlertResult:
     """
     根据测试结果计算告警级别
     
@@ -94,35 +159,24 @@ def calculate_alert_level(success_rate: float, total_cases: int, failed_cases: i
     Returns:
         告警级别信息
     """
-    # 根据成功率和失败用例数判断告警级别
-    if success_rate >= 95:
-        color = "green"
-    elif success_rate >= 80:
-        color = "blue" 
-    elif success_rate >= 60:
-        color = "yellow"
-    elif success_rate >= 40:
-        color = "orange"
-    else:
-        color = "red"
-    
-    # 如果失败用例数过多，提升告警级别
-    if failed_cases >= 20:
-        color = "red"
-    elif failed_cases >= 10 and color not in ["red"]:
-        color = "orange"
-    elif failed_cases >= 5 and color not in ["red", "orange"]:
-        color = "yellow"
-    
-    level_info = get_warning_level_info(color)
-    level_info.update({
-        "success_rate": success_rate,
-        "total_cases": total_cases,
-        "failed_cases": failed_cases,
-        "alert_level": color
-    })
+    # 根据成功率确定基础告警颜色，失败用例数过多时提升告警级别
+    color = _RATE_COLORS[_classify(success_rate, failed_cases)]
+
+    return AlertResult(_LEVELS[color], success_rate, total_cases, failed_cases, color)
+
+
+def classify_alert_levels(success_rates: Sequence[float], failed_cases: Sequence[int]) -> List[str]:
+    """
+    批量计算告警颜色，适用于按模块汇总等一次需要处理多组结果的场景
     
-    return level_info
+    Args:
+        success_rates: 成功率序列 (0-100)
+        failed_cases: 与成功率一一对应的失败用例数序列
+        
+    Returns:
+        告警颜色列表 (red/orange/yellow/blue/green)
+    """
+    return [_RATE_COLORS[_classify(rate, failed)] for rate, failed in zip(success_rates, failed_cases)]
 
 
 def get_trend_indicator(current_rate: float, previous_rate: Optional[float] = None) -> str:
@@ -138,18 +192,8 @@ def get_trend_indicator(current_rate: float, previous_rate: Optional[float] = No
     """
     if previous_rate is None:
         return "➖"
-    
-    diff = current_rate - previous_rate
-    if diff > 5:
-        return "📈"  # 显著上升
-    elif diff > 0:
-        return "↗️"   # 轻微上升
-    elif diff < -5:
-        return "📉"  # 显著下降
-    elif diff < 0:
-        return "↘️"   # 轻微下降
-    else:
-        return "➖"  # 持平
+
+    return _TREND_ICONS[_trend_index(current_rate - previous_rate)]
 
 
 def get_performance_indicator(avg_response_time: float) -> Dict[str, str]:
@@ -162,34 +206,22 @@ def get_performance_indicator(avg_response_time: float) -> Dict[str, str]:
     Returns:
         性能指示器信息
     """
-    if avg_response_time <= 200:
-        return {"icon": "🚀", "level": "优秀", "color": "green"}
-    elif avg_response_time <= 500:
-        return {"icon": "✅", "level": "良好", "color": "blue"}
-    elif avg_response_time <= 1000:
-        return {"icon": "⚠️", "level": "一般", "color": "yellow"}
-    elif avg_response_time <= 2000:
-        return {"icon": "🐌", "level": "较慢", "color": "orange"}
-    else:
-        return {"icon": "🔥", "level": "很慢", "color": "red"}
-
-
-def format_alert_summary(alert_info: Dict[str, Any]) -> str:
+    # 返回副本，调用方修改结果不会影响模块共享的指示器表
+    return dict(_PERFORMANCE_INDICATORS[_performance_index(avg_response_time)])
+
+
+def format_alert_summary(alert_info: AlertResult) -> str:
     """
     格式化告警摘要信息
     
     Args:
-        alert_info: 告警信息字典
+        alert_info: 告警级别计算结果
         
     Returns:
         格式化的告警摘要
     """
-    icon = alert_info.get("icon", "⚪")
-    level = alert_info.get("level", "[未知]")
-    success_rate = alert_info.get("success_rate", 0)
-    description = alert_info.get("description", "")
-    
-    return f"{icon} {level} 成功率: {success_rate:.1f}% - {description}"
+    meta = alert_info.meta
+    return f"{meta.icon} {meta.level} 成功率: {alert_info.success_rate:.1f}% - {meta.description}"
 
 
 if __name__ == "__main__":
@@ -14,37 +14,159 @@ This module provides ding talk functionality.
 import base64
 import hashlib
 import hmac
+import json
+import re
 import time
 import urllib.parse
-from typing import Any, Text
-
-from dingtalkchatbot.chatbot import DingtalkChatbot, FeedLink
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Text
 
 from utils import config
-from utils.other_tools.allure_data.allure_report_data import AllureFileClean, TestMetrics
+from utils.logging_tool.log_control import ERROR
 from utils.other_tools.get_local_ip import get_host_ip
 
+if TYPE_CHECKING:
+    from utils.other_tools.allure_data.allure_report_data import TestMetrics
+
+# 钉钉签名有效期为 1 小时，提前 5 分钟刷新签名与机器人实例
+SIGN_REFRESH_MS = 55 * 60 * 1000
+# 钉钉消息发送超时时间（秒），避免接口响应慢时阻塞测试结束后的通知流程
+DING_TALK_TIMEOUT = 10
+
+# 通用markdown转钉钉markdown：一级标题转####，二级标题转引用，移除加粗标记（钉钉不支持）
+_DT_PATTERN = re.compile(r"^(##?) |\*\*", re.M)
+_DT_HEADINGS = {"#": "#### ", "##": "> "}
+# 钉钉通知末尾附加的图片
+_DT_SUFFIX = "\n\n ![screenshot](https://img.alicdn.com/tfs/TB1NwmBEL9TBuNjy1zbXXXpepXa-2400-1218.png)"
+
+
+# 原始格式钉钉通知模板，逐行定义后在模块加载时拼接一次
+_LEGACY_TEMPLATE_LINES = (
+    "#### {project_name}自动化通知  ",
+    "",
+    ">Python脚本任务: {project_name}",
+    "",
+    ">环境: TEST",
+    "",
+    ">执行人: {tester_name}",
+    "",
+    ">执行结果: {metrics.pass_rate}% ",
+    "",
+    ">总用例数: {metrics.total} ",
+    "",
+    ">成功用例数: {metrics.passed} ",
+    "",
+    ">失败用例数: {metrics.failed}  ",
+    "",
+    ">异常用例数: {metrics.broken} ",
+    "",
+    ">跳过用例数: {metrics.skipped}",
+    "",
+    ">用例执行时长: {metrics.time} s ![screenshot](https://img.alicdn.com/tfs/TB1NwmBEL9TBuNjy1zbXXXpepXa-2400-1218.png)",
+    "",
+    "{report_links}",
+    "",
+    "> 💡 **报告访问说明**：",
+    "> - 如果链接1无法访问，请尝试链接2或链接3",
+    "> - 或复制链接到浏览器中打开",
+    "> - 报告文件位置：./report/html/index.html",
+    "",
+    ">非相关负责人员可忽略此消息。",
+)
+_LEGACY_TEMPLATE = "\n".join(_LEGACY_TEMPLATE_LINES)
+
+
+@lru_cache(maxsize=1)
+def _legacy_report_links() -> str:
+    """构建报告链接文本，本地IP在进程内不变，结果只需构建一次"""
+    # 获取本地IP和端口，提供多个访问方式
+    report_urls = (
+        f"http://{get_host_ip()}:9999/index.html",
+        "http://localhost:9999/index.html",
+        "http://127.0.0.1:9999/index.html",
+    )
+    return "\n".join(f"> 📊 [测试报告链接{i + 1}]({url})" for i, url in enumerate(report_urls))
+
+
+@lru_cache(maxsize=1)
+def _session_chatbot_cls():
+    """
+    构建通过共享 requests.Session 发送消息的钉钉机器人类
+
+    DingtalkChatbot 每次发送都使用 requests.post 并携带 Connection: close，
+    无法复用 TCP/TLS 连接；这里覆盖 post，所有实例共用一个保持长连接的会话。
+    """
+    import requests
+    from dingtalkchatbot.chatbot import DingtalkChatbot
+
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json; charset=utf-8"})
+
+    class SessionChatbot(DingtalkChatbot):
+        """复用 HTTP 长连接的钉钉机器人"""
+
+        def post(self, data):
+            # 发送失败只记录日志并返回错误结果，不中断测试结束后的报告流程
+            try:
+                response = session.post(self.webhook, data=json.dumps(data), timeout=DING_TALK_TIMEOUT)
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as exc:
+                ERROR.logger.error(
+                    "消息发送失败， HTTP error: %d, reason: %s", exc.response.status_code, exc.response.reason
+                )
+                return {"errcode": exc.response.status_code, "errmsg": "消息发送失败"}
+            except requests.exceptions.ConnectionError:
+                ERROR.logger.error("消息发送失败，HTTP connection error!")
+                return {"errcode": 500, "errmsg": "消息发送失败"}
+            except requests.exceptions.Timeout:
+                ERROR.logger.error("消息发送失败，Timeout error!")
+                return {"errcode": 500, "errmsg": "消息发送失败"}
+            except requests.exceptions.RequestException:
+                ERROR.logger.error("消息发送失败, Request Exception!")
+                return {"errcode": 500, "errmsg": "消息发送失败"}
+
+            try:
+                return response.json()
+            except ValueError:
+                # requests 的 JSONDecodeError 为 ValueError 的子类
+                ERROR.logger.error("服务器响应异常，状态码：%s，响应内容：%s", response.status_code, response.text)
+                return {"errcode": 500, "errmsg": "服务器响应异常"}
+
+    return SessionChatbot
+
+
+def _dt_repl(match: "re.Match") -> str:
+    """_DT_PATTERN 的替换函数"""
+    heading = match.group(1)
+    return _DT_HEADINGS[heading] if heading else ""
+
 
 class DingTalkSendMsg:
     """发送钉钉通知"""
 
-    def __init__(self, metrics: TestMetrics):
+    __slots__ = ("metrics", "timeStamp", "_bot")
+
+    def __init__(self, metrics: "TestMetrics"):
         self.metrics = metrics
         self.timeStamp = str(round(time.time() * 1000))
+        self._bot = None
 
     def xiao_ding(self):
         """
         创建钉钉机器人实例
 
-        根据配置信息和签名创建钉钉聊天机器人实例。
+        根据配置信息和签名创建钉钉聊天机器人实例，实例在签名有效期内复用。
 
         Returns:
             DingtalkChatbot: 钉钉机器人实例
         """
-        sign = self.get_sign()
-        # 从yaml文件中获取钉钉配置信息
-        webhook = config.ding_talk.webhook + "&timestamp=" + self.timeStamp + "&sign=" + sign
-        return DingtalkChatbot(webhook)
+        if self._bot is None or time.time() * 1000 - int(self.timeStamp) > SIGN_REFRESH_MS:
+            self.timeStamp = str(round(time.time() * 1000))
+            sign = self.get_sign()
+            # 从yaml文件中获取钉钉配置信息
+            webhook = config.ding_talk.webhook + "&timestamp=" + self.timeStamp + "&sign=" + sign
+            self._bot = _session_chatbot_cls()(webhook)
+        return self._bot
 
     def get_sign(self) -> Text:
         """
@@ -100,6 +222,8 @@ class DingTalkSendMsg:
     @staticmethod
     def feed_link(title: Text, message_url: Text, pic_url: Text) -> Any:
         """FeedLink 二次封装"""
+        from dingtalkchatbot.chatbot import FeedLink
+
         return FeedLink(title=title, message_url=message_url, pic_url=pic_url)
 
     def send_feed_link(self, *arg) -> None:
@@ -156,19 +280,8 @@ class DingTalkSendMsg:
         Returns:
             钉钉格式的markdown内容
         """
-        # 钉钉markdown格式调整
-        dingtalk_content = content.replace("# ", "#### ")  # 钉钉使用####作为标题
-        dingtalk_content = dingtalk_content.replace("## ", "> **")  # 二级标题转换
-        dingtalk_content = dingtalk_content.replace("**", "")  # 移除加粗标记，钉钉不支持
-
-        # 添加钉钉特有的图片
-        dingtalk_content += (
-            "\n\n ![screenshot]("
-            "https://img.alicdn.com/tfs/TB1NwmBEL9TBuNjy1zbXXXpepXa-2400-1218.png"
-            ")"
-        )
-
-        return dingtalk_content
+        # 单次扫描完成标题转换与加粗移除，并添加钉钉特有的图片
+        return _DT_PATTERN.sub(_dt_repl, content) + _DT_SUFFIX
 
     def _send_legacy_notification(self):
         """发送原始格式的钉钉通知（保持向后兼容）"""
@@ -177,41 +290,16 @@ class DingTalkSendMsg:
         if self.metrics.failed + self.metrics.broken > 0:
             is_at_all = True
 
-        # 获取本地IP和端口，提供多个访问方式
-        local_ip = get_host_ip()
-        report_urls = [
-            f"http://{local_ip}:9999/index.html",
-            f"http://localhost:9999/index.html",
-            f"http://127.0.0.1:9999/index.html"
-        ]
-
-        # 构建报告链接文本
-        report_links = "\n".join([f"> 📊 [测试报告链接{i+1}]({url})" for i, url in enumerate(report_urls)])
-
-        text = (
-            f"#### {config.project_name}自动化通知  "
-            f"\n\n>Python脚本任务: {config.project_name}"
-            "\n\n>环境: TEST\n\n>"
-            f"执行人: {config.tester_name}"
-            f"\n\n>执行结果: {self.metrics.pass_rate}% "
-            f"\n\n>总用例数: {self.metrics.total} "
-            f"\n\n>成功用例数: {self.metrics.passed}"
-            f" \n\n>失败用例数: {self.metrics.failed} "
-            f" \n\n>异常用例数: {self.metrics.broken} "
-            f"\n\n>跳过用例数: {self.metrics.skipped}"
-            f"\n\n>用例执行时长: {self.metrics.time} s"
-            " ![screenshot]("
-            "https://img.alicdn.com/tfs/TB1NwmBEL9TBuNjy1zbXXXpepXa-2400-1218.png"
-            ")\n\n"
-            f"{report_links}"
-            "\n\n> 💡 **报告访问说明**："
-            "\n> - 如果链接1无法访问，请尝试链接2或链接3"
-            "\n> - 或复制链接到浏览器中打开"
-            "\n> - 报告文件位置：./report/html/index.html"
-            "\n\n>非相关负责人员可忽略此消息。"
+        text = _LEGACY_TEMPLATE.format(
+            project_name=config.project_name,
+            tester_name=config.tester_name,
+            metrics=self.metrics,
+            report_links=_legacy_report_links(),
         )
         self.send_markdown(title="【接口自动化通知】", msg=text, is_at_all=is_at_all)
 
 
 if __name__ == "__main__":
+    from utils.other_tools.allure_data.allure_report_data import AllureFileClean
+
     DingTalkSendMsg(AllureFileClean().get_case_count()).send_ding_notification()
@@ -13,10 +13,69 @@ This module provides enhanced notification formatting functionality.
 """
 
 import datetime
+import re
 from typing import Dict, Any, List, Optional
-from utils.notify.alert_level_manager import calculate_alert_level, get_trend_indicator, get_performance_indicator
+from utils.notify.alert_level_manager import (
+    AlertResult,
+    calculate_alert_level,
+    classify_alert_levels,
+    get_performance_indicator,
+    get_trend_indicator,
+    get_warning_level_info,
+)
 from utils.other_tools.get_local_ip import get_host_ip
 
+# 告警日期 / 日期时间格式：YYYY-MM-DD、YYYY-MM-DD HH:MM:SS。
+# 与 strptime 一致，月日时分秒可不补零，日期也可用空格补位；取值范围由构造 datetime 时校验
+_DATE_PATTERN = r"(\d{4})-(\d{1,2})-(\d{1,2}| \d)"
+_DATE_RE = re.compile(_DATE_PATTERN)
+_DATETIME_RE = re.compile(_DATE_PATTERN + r"\s+(\d{1,2}):(\d{1,2}):(\d{1,2})")
+
+# 告警通知模板，模块加载时定义一次，每次通知通过 format_map 填充
+_ALARM_TEMPLATE = """# 🔔 接口自动化测试告警通知
+
+## {icon} 告警级别: {level}
+
+**⏰ 告警时间:** {alarm_date} {alarm_time}
+**🎯 项目名称:** {project_name}
+**👤 测试人员:** {tester_name}
+**🌍 测试环境:** {environment}
+
+---
+
+## 📊 测试结果概览
+
+| 指标 | 数值 | 状态 |
+|------|------|------|
+| **总用例数** | {total_cases} | 📝 |
+| **成功用例** | {success_cases} | ✅ |
+| **失败用例** | {failed_cases} | ❌ |
+| **跳过用例** | {skipped_cases} | ⏭️ |
+| **成功率** | {success_rate:.1f}% | {trend} |
+
+## ⚡ 性能指标
+
+**{perf_icon} 平均响应时间:** {avg_response_time:.0f}ms ({perf_level})
+
+## 🔍 详细分析
+
+**📈 趋势分析:** {trend_analysis}
+
+**⚠️ 风险评估:** {description}
+
+**🎯 建议措施:** {suggestions}
+
+---
+
+## 📋 报告链接
+
+{report_links}
+
+---
+
+> 📞 如有疑问，请联系测试团队
+> ⏰ 通知时间: {notify_time}"""
+
 
 def format_alarm_notification(alarm_data: Dict[str, Any]) -> str:
     """
@@ -32,22 +91,25 @@ def format_alarm_notification(alarm_data: Dict[str, Any]) -> str:
     alarm_date = alarm_data.get('alarmDate', '')
     alarm_time = alarm_data.get('alarmTime', '')
 
+    # 直接用正则提取年月日时分秒，避免 strptime/strftime 的解析开销
+    match = None
     if alarm_date:
+        if alarm_time:
+            match = _DATETIME_RE.fullmatch(f"{alarm_date} {alarm_time}")
+        else:
+            match = _DATE_RE.fullmatch(alarm_date)
+    dt = None
+    if match:
         try:
-            # 解析日期时间
-            if alarm_time:
-                dt = datetime.datetime.strptime(f"{alarm_date} {alarm_time}", '%Y-%m-%d %H:%M:%S')
-            else:
-                dt = datetime.datetime.strptime(alarm_date, '%Y-%m-%d')
-            alarm_time = dt.strftime('%H:%M:%S')
-            alarm_date = dt.strftime('%Y年%m月%d日')
+            # 构造 datetime 校验月份、日期与时分秒的取值范围，非法日期与原先一样回退为当前时间
+            dt = datetime.datetime(*map(int, match.groups(default="0")))
         except ValueError:
-            # 如果解析失败，使用当前时间
-            now = datetime.datetime.now()
-            alarm_date = now.strftime('%Y年%m月%d日')
-            alarm_time = now.strftime('%H:%M:%S')
+            pass
+    if dt is not None:
+        alarm_date = f"{dt.year}年{dt.month:02d}月{dt.day:02d}日"
+        alarm_time = f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
     else:
-        # 使用当前时间
+        # 未提供日期或解析失败时，使用当前时间
         now = datetime.datetime.now()
         alarm_date = now.strftime('%Y年%m月%d日')
         alarm_time = now.strftime('%H:%M:%S')
@@ -67,52 +129,30 @@ def format_alarm_notification(alarm_data: Dict[str, Any]) -> str:
     previous_rate = alarm_data.get('previous_success_rate')
     trend = get_trend_indicator(success_rate, previous_rate)
 
-    # 构建通知内容
-    notification = f"""# 🔔 接口自动化测试告警通知
-
-## {alert_info['icon']} 告警级别: {alert_info['level']}
-
-**⏰ 告警时间:** {alarm_date} {alarm_time}
-**🎯 项目名称:** {alarm_data.get('project_name', '未知项目')}
-**👤 测试人员:** {alarm_data.get('tester_name', '未知')}
-**🌍 测试环境:** {alarm_data.get('environment', '未知环境')}
-
----
-
-## 📊 测试结果概览
-
-| 指标 | 数值 | 状态 |
-|------|------|------|
-| **总用例数** | {total_cases} | 📝 |
-| **成功用例** | {alarm_data.get('success_cases', 0)} | ✅ |
-| **失败用例** | {failed_cases} | ❌ |
-| **跳过用例** | {alarm_data.get('skipped_cases', 0)} | ⏭️ |
-| **成功率** | {success_rate:.1f}% | {trend} |
-
-## ⚡ 性能指标
-
-**{perf_info['icon']} 平均响应时间:** {avg_response_time:.0f}ms ({perf_info['level']})
-
-## 🔍 详细分析
-
-**📈 趋势分析:** {_get_trend_analysis(success_rate, previous_rate)}
-
-**⚠️ 风险评估:** {alert_info['description']}
-
-**🎯 建议措施:** {_get_suggestions(alert_info, failed_cases)}
-
----
-
-## 📋 报告链接
-
-{_format_report_links(alarm_data.get('timestamp'))}
-
----
-
-> 📞 如有疑问，请联系测试团队
-> ⏰ 通知时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
-
-    return notification
+    # 填充通知模板
+    return _ALARM_TEMPLATE.format_map({
+        'icon': alert_info.icon,
+        'level': alert_info.level,
+        'alarm_date': alarm_date,
+        'alarm_time': alarm_time,
+        'project_name': alarm_data.get('project_name', '未知项目'),
+        'tester_name': alarm_data.get('tester_name', '未知'),
+        'environment': alarm_data.get('environment', '未知环境'),
+        'total_cases': total_cases,
+        'success_cases': alarm_data.get('success_cases', 0),
+        'failed_cases': failed_cases,
+        'skipped_cases': alarm_data.get('skipped_cases', 0),
+        'success_rate': success_rate,
+        'trend': trend,
+        'perf_icon': perf_info['icon'],
+        'avg_response_time': avg_response_time,
+        'perf_level': perf_info['level'],
+        'trend_analysis': _get_trend_analysis(success_rate, previous_rate),
+        'description': alert_info.description,
+        'suggestions': _get_suggestions(alert_info, failed_cases),
+        'report_links': _format_report_links(alarm_data.get('timestamp')),
+        'notify_time': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    })
 
 
 def _get_trend_analysis(current_rate: float, previous_rate: Optional[float]) -> str:
@@ -133,9 +173,9 @@ def _get_trend_analysis(current_rate: float, previous_rate: Optional[float]) ->
         return "成功率与上次持平，保持稳定 ➖"
 
 
-def _get_suggestions(alert_info: Dict[str, Any], failed_cases: int) -> str:
+def _get_suggestions(alert_info: AlertResult, failed_cases: int) -> str:
     """获取建议措施"""
-    alert_level = alert_info.get('alert_level', 'green')
+    alert_level = alert_info.alert_level
 
     suggestions = {
         'red': f"🚨 立即排查 {failed_cases} 个失败用例，优先修复核心功能问题",
@@ -174,6 +214,51 @@ def _format_report_links(timestamp: str = None) -> str:
     return report_links
 
 
+class _MetricView:
+    """
+    测试指标只读视图，一次性完成不同属性名的兼容映射
+
+    兼容 TestMetrics（total/passed/failed/broken/skipped/pass_rate）与
+    其他指标对象（case_count/success_count/failed_count/skipped_count/success_rate）。
+    """
+
+    __slots__ = ("total", "passed", "failed", "skipped", "rate", "avg_rt", "timestamp")
+
+    def __init__(self, m: Any):
+        self.total = getattr(m, 'case_count', None) or getattr(m, 'total', 0)
+        self.passed = getattr(m, 'success_count', None) or getattr(m, 'passed', 0)
+        self.failed = getattr(m, 'failed_count', None) or (getattr(m, 'failed', 0) + getattr(m, 'broken', 0))
+        self.skipped = getattr(m, 'skipped_count', None) or getattr(m, 'skipped', 0)
+        self.rate = getattr(m, 'success_rate', None) or getattr(m, 'pass_rate', 0)
+        self.avg_rt = getattr(m, 'avg_response_time', 500)
+        self.timestamp = getattr(m, 'timestamp', None)
+
+
+def format_many(metrics_list: List[Any]) -> str:
+    """
+    批量格式化多组测试指标（如按模块汇总的结果），每组输出一行告警摘要
+
+    先一次性完成所有结果的告警分级，再统一拼接文本；不读写历史数据。
+
+    Args:
+        metrics_list: 测试指标对象列表
+
+    Returns:
+        每行一个模块的告警摘要文本
+    """
+    views = [_MetricView(m) for m in metrics_list]
+    colors = classify_alert_levels([v.rate for v in views], [v.failed for v in views])
+
+    lines = []
+    for index, (test_metrics, view, color) in enumerate(zip(metrics_list, views, colors)):
+        name = getattr(test_metrics, 'module_name', None) or getattr(test_metrics, 'project_name', None) or f"#{index + 1}"
+        level_info = get_warning_level_info(color)
+        lines.append(
+            f"{level_info['icon']} {level_info['level']} {name}: 成功率 {view.rate:.1f}% ({view.passed}/{view.total})"
+        )
+    return "\n".join(lines)
+
+
 def format_simple_notification(test_metrics: Any) -> str:
     """
     格式化简单通知（兼容现有接口）
@@ -185,11 +270,7 @@ def format_simple_notification(test_metrics: Any) -> str:
         格式化的通知内容
     """
     # 从test_metrics提取数据，兼容不同的属性名
-    total_cases = getattr(test_metrics, 'case_count', None) or getattr(test_metrics, 'total', 0)
-    success_cases = getattr(test_metrics, 'success_count', None) or getattr(test_metrics, 'passed', 0)
-    failed_cases = getattr(test_metrics, 'failed_count', None) or (getattr(test_metrics, 'failed', 0) + getattr(test_metrics, 'broken', 0))
-    skipped_cases = getattr(test_metrics, 'skipped_count', None) or getattr(test_metrics, 'skipped', 0)
-    success_rate = getattr(test_metrics, 'success_rate', None) or getattr(test_metrics, 'pass_rate', 0)
+    view = _MetricView(test_metrics)
 
     # 导入配置
     try:
@@ -217,7 +298,7 @@ def format_simple_notification(test_metrics: Any) -> str:
         history_manager.save_test_result(test_metrics)
 
         print(f"📊 历史数据处理:")
-        print(f"   当前成功率: {success_rate}%")
+        print(f"   当前成功率: {view.rate}%")
         print(f"   上次成功率: {previous_success_rate}%" if previous_success_rate else "   上次成功率: 无历史数据")
 
     except Exception as e:
@@ -229,14 +310,14 @@ def format_simple_notification(test_metrics: Any) -> str:
         'project_name': project_name,
         'tester_name': tester_name,
         'environment': environment,
-        'total_cases': total_cases,
-        'success_cases': success_cases,
-        'failed_cases': failed_cases,
-        'skipped_cases': skipped_cases,
-        'success_rate': success_rate,
+        'total_cases': view.total,
+        'success_cases': view.passed,
+        'failed_cases': view.failed,
+        'skipped_cases': view.skipped,
+        'success_rate': view.rate,
         'previous_success_rate': previous_success_rate,  # 添加历史成功率
-        'avg_response_time': getattr(test_metrics, 'avg_response_time', 500),
-        'timestamp': getattr(test_metrics, 'timestamp', None),  # 添加时间戳
+        'avg_response_time': view.avg_rt,
+        'timestamp': view.timestamp,  # 添加时间戳
     }
 
     return format_alarm_notification(alarm_data)
@@ -12,11 +12,37 @@ This module provides history data management functionality.
 @Author : txl
 """
 
+import atexit
 import json
 import os
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional
+
+from utils.logging_tool.log_control import ERROR, INFO
+
+# 趋势分析保留的最近记录数
+MAX_RECORDS = 30
+# JSONL 文件行数超过该值时，重写文件只保留最近 MAX_RECORDS 条
+ROTATE_THRESHOLD = 60
+# 历史文件读写缓冲区大小（64KB）
+IO_BUFFER_SIZE = 64 * 1024
+# 待写入记录的合并等待时间（秒），期间的多次保存合并为一次写入
+DRAIN_DELAY = 0.05
+# 趋势分析中每个统计窗口的记录数（最近5次 / 更早5次）
+TREND_WINDOW = 5
+
+# 按项目名称共享的管理器实例：保存为延迟写入，各调用方需共用同一份内存缓存才能读到尚未落盘的记录
+_managers: Dict[str, "HistoryDataManager"] = {}
+_managers_lock = threading.Lock()
+
+
+def _rate(record: Dict[str, Any]) -> float:
+    """读取记录中的成功率"""
+    return record.get('success_rate', 0)
 
 
 class HistoryDataManager:
@@ -31,7 +57,23 @@ class HistoryDataManager:
         """
         self.project_name = project_name or "pytest-auto-api2"
         self.history_dir = Path("logs/history")
-        self.history_file = self.history_dir / f"{self.project_name}_history.json"
+        # 每行一条记录的 JSONL 文件，保存时只需追加一行
+        self.history_file = self.history_dir / f"{self.project_name}_history.jsonl"
+        # 旧版整体 JSON 数组格式的历史文件，首次加载时迁移
+        self.legacy_history_file = self.history_dir / f"{self.project_name}_history.json"
+        # 历史数据的内存环形缓冲区，首次访问时从文件加载，
+        # 超出 MAX_RECORDS 自动淘汰最旧记录
+        self._cache: Optional[Deque[Dict[str, Any]]] = None
+        # 最近5次与更早5次成功率之和，随记录追加增量维护
+        self._sum_recent = 0
+        self._sum_earlier = 0
+        # 当前 JSONL 文件中的行数，用于判断何时截断重写
+        self._file_lines = 0
+        # 尚未写入文件的记录（已序列化的 JSONL 行）及其调度状态
+        self._pending: List[str] = []
+        self._drain_scheduled = False
+        self._atexit_registered = False
+        self._lock = threading.Lock()
         
         # 确保目录存在
         self.history_dir.mkdir(parents=True, exist_ok=True)
@@ -59,21 +101,16 @@ class HistoryDataManager:
                 "calculation_method": getattr(test_metrics, 'calculation_method', 'passed only')
             }
             
-            # 读取现有历史数据
+            # 读取现有历史数据（内存缓存，原地追加）
             history_data = self._load_history_data()
             
-            # 添加新记录
-            history_data.append(current_data)
-            
-            # 只保留最近30次记录
-            if len(history_data) > 30:
-                history_data = history_data[-30:]
-            
-            # 保存到文件
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                # 添加新记录（环形缓冲区只保留最近30次记录）
+                self._push(history_data, current_data)
                 
-            print(f"📊 历史数据已保存: {self.history_file}")
+                # 放入待写入队列，短时间内的多次保存合并为一次写入
+                self._pending.append(json.dumps(current_data, ensure_ascii=False) + "\n")
+                self._schedule_drain()
             
         except Exception as e:
             print(f"⚠️ 保存历史数据失败: {e}")
@@ -118,14 +155,12 @@ class HistoryDataManager:
                     "message": "历史数据不足，无法进行趋势分析"
                 }
             
-            # 计算最近5次的平均成功率
-            recent_5 = history_data[-5:] if len(history_data) >= 5 else history_data
-            avg_recent = sum(record.get('success_rate', 0) for record in recent_5) / len(recent_5)
+            # 计算最近5次的平均成功率（窗口和已增量维护）
+            avg_recent = self._sum_recent / min(len(history_data), TREND_WINDOW)
             
             # 计算更早期的平均成功率
-            if len(history_data) >= 10:
-                earlier_5 = history_data[-10:-5]
-                avg_earlier = sum(record.get('success_rate', 0) for record in earlier_5) / len(earlier_5)
+            if len(history_data) >= 2 * TREND_WINDOW:
+                avg_earlier = self._sum_earlier / TREND_WINDOW
             else:
                 avg_earlier = avg_recent
             
@@ -173,17 +208,29 @@ class HistoryDataManager:
                 }
             
             # 获取最近的记录
-            recent_data = history_data[-limit:] if len(history_data) > limit else history_data
+            # limit <= 0 时与原先的列表切片一致，返回全部记录
+            if 0 < limit < len(history_data):
+                recent_data = list(islice(history_data, len(history_data) - limit, None))
+            else:
+                recent_data = history_data
             
-            # 计算统计信息
-            success_rates = [record.get('success_rate', 0) for record in recent_data]
+            # 单次遍历计算总和、最大值、最小值
+            total_rate = 0
+            max_rate = min_rate = recent_data[0].get('success_rate', 0)
+            for record in recent_data:
+                rate = record.get('success_rate', 0)
+                total_rate += rate
+                if rate > max_rate:
+                    max_rate = rate
+                elif rate < min_rate:
+                    min_rate = rate
             
             return {
                 "total_records": len(history_data),
                 "recent_records": len(recent_data),
-                "avg_success_rate": round(sum(success_rates) / len(success_rates), 1),
-                "max_success_rate": max(success_rates),
-                "min_success_rate": min(success_rates),
+                "avg_success_rate": round(total_rate / len(recent_data), 1),
+                "max_success_rate": max_rate,
+                "min_success_rate": min_rate,
                 "latest_record": history_data[-1],
                 "date_range": {
                     "start": recent_data[0].get('date', ''),
@@ -198,22 +245,100 @@ class HistoryDataManager:
                 "message": f"获取历史摘要失败: {e}"
             }
     
-    def _load_history_data(self) -> list:
+    def _load_history_data(self) -> Deque[Dict[str, Any]]:
         """
-        加载历史数据
+        加载历史数据，仅在首次访问时读取文件，之后直接返回内存缓存
         
         Returns:
             历史数据列表
         """
+        if self._cache is not None:
+            return self._cache
         try:
             if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.history_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                    records = [json.loads(line) for line in f if line.strip()]
+                self._file_lines = len(records)
+            elif self.legacy_history_file.exists():
+                # 兼容旧版 JSON 数组文件，下次保存时会重写为 JSONL
+                with open(self.legacy_history_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                    records = json.load(f)
             else:
-                return []
+                records = []
         except Exception as e:
             print(f"⚠️ 加载历史数据失败: {e}")
-            return []
+            records = []
+        self._cache = deque(maxlen=MAX_RECORDS)
+        self._sum_recent = self._sum_earlier = 0
+        for record in records[-MAX_RECORDS:]:
+            self._push(self._cache, record)
+        return self._cache
+
+    def _push(self, history_data: Deque[Dict[str, Any]], record: Dict[str, Any]) -> None:
+        """
+        追加一条记录，并增量更新最近5次 / 更早5次的成功率之和
+        
+        Args:
+            history_data: 历史数据环形缓冲区
+            record: 新记录
+        """
+        count = len(history_data)
+        if count >= TREND_WINDOW:
+            # 最近窗口中最旧的一条移入更早窗口
+            moved = _rate(history_data[-TREND_WINDOW])
+            self._sum_recent -= moved
+            self._sum_earlier += moved
+            if count >= 2 * TREND_WINDOW:
+                self._sum_earlier -= _rate(history_data[-2 * TREND_WINDOW])
+        self._sum_recent += _rate(record)
+        history_data.append(record)
+
+    def _schedule_drain(self) -> None:
+        """调度一次延迟写入，调用方需持有 self._lock"""
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        if not self._atexit_registered:
+            # 进程退出前确保待写入记录落盘
+            atexit.register(self.flush)
+            self._atexit_registered = True
+        timer = threading.Timer(DRAIN_DELAY, self.flush)
+        timer.daemon = True
+        timer.start()
+
+    def flush(self) -> None:
+        """将所有待写入的记录一次性写入历史文件"""
+        with self._lock:
+            self._drain_scheduled = False
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            try:
+                if self._file_lines + len(pending) > ROTATE_THRESHOLD or not self.history_file.exists():
+                    # 文件过长（或尚未创建）时整体重写，仅保留最近的记录
+                    self._rewrite_history_file(self._cache or [])
+                else:
+                    # 追加写入，无需重写整个文件
+                    with open(self.history_file, 'a', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                        f.write("".join(pending))
+                    self._file_lines += len(pending)
+            except Exception as e:
+                ERROR.logger.error(f"保存历史数据失败: {e}")
+                return
+        # 实际写入文件后再记录保存成功
+        INFO.logger.info(f"历史数据已保存: {self.history_file}, 本次写入 {len(pending)} 条记录")
+
+    def _rewrite_history_file(self, history_data: Deque[Dict[str, Any]]) -> None:
+        """
+        将历史记录整体重写为 JSONL 文件
+        
+        Args:
+            history_data: 需要保留的历史记录
+        """
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in history_data)
+        with open(self.history_file, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            f.write(payload)
+        self._file_lines = len(history_data)
     
     def clear_history(self) -> bool:
         """
@@ -223,8 +348,14 @@ class HistoryDataManager:
             是否清空成功
         """
         try:
-            if self.history_file.exists():
-                os.remove(self.history_file)
+            with self._lock:
+                self._pending = []
+                for history_file in (self.history_file, self.legacy_history_file):
+                    if history_file.exists():
+                        os.remove(history_file)
+                self._cache = deque(maxlen=MAX_RECORDS)
+                self._sum_recent = self._sum_earlier = 0
+                self._file_lines = 0
             print(f"🗑️ 历史数据已清空: {self.history_file}")
             return True
         except Exception as e:
@@ -234,7 +365,7 @@ class HistoryDataManager:
 
 def get_history_manager(project_name: str = None) -> HistoryDataManager:
     """
-    获取历史数据管理器实例
+    获取历史数据管理器实例，同一项目名称在进程内返回同一个实例
     
     Args:
         project_name: 项目名称
@@ -249,7 +380,11 @@ def get_history_manager(project_name: str = None) -> HistoryDataManager:
         except:
             project_name = "pytest-auto-api2"
     
-    return HistoryDataManager(project_name)
+    with _managers_lock:
+        manager = _managers.get(project_name)
+        if manager is None:
+            manager = _managers[project_name] = HistoryDataManager(project_name)
+    return manager
 
 
 if __name__ == "__main__":
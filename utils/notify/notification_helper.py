@@ -11,13 +11,37 @@ from utils.other_tools.get_local_ip import get_host_ip
 from utils.times_tool.time_control import now_time
 from utils import config
 
+# 各渠道报告链接的单行模板，绑定 str.format 后直接调用
+_DINGTALK_LINE = "> 📊 [测试报告链接{index}]({url})".format
+_WECHAT_LINE = ">📊 [测试报告链接{index}]({url})".format
+_EMAIL_LINE = "        测试报告链接{index}: {url}".format
+_LARK_TEXT = "测试报告链接{index}".format
+# 飞书链接之间的分隔元素
+_LARK_SEPARATOR = {"tag": "text", "text": " | "}
+
 
 class NotificationHelper:
     """通知助手类"""
     
+    # 报告访问说明，各通知渠道共用，按渠道格式预先拼接
+    ACCESS_TIPS = (
+        "如果链接1无法访问，请尝试链接2或链接3",
+        "或复制链接到浏览器中打开",
+        "报告文件位置：./report/html/index.html",
+    )
+    DINGTALK_TIPS = "\n\n> 💡 **报告访问说明**：" + "".join(f"\n> - {tip}" for tip in ACCESS_TIPS)
+    WECHAT_TIPS = "\n>\n>💡 **报告访问说明**：" + "".join(f"\n>- {tip}" for tip in ACCESS_TIPS)
+    EMAIL_TIPS = "\n        \n        报告访问说明：" + "".join(f"\n        - {tip}" for tip in ACCESS_TIPS)
+    
     def __init__(self):
         self.local_ip = get_host_ip()
         self.report_port = 9999
+        # 本地IP与端口在实例生命周期内不变，报告URL只需构建一次
+        self._urls = (
+            f"http://{self.local_ip}:{self.report_port}/index.html",
+            f"http://localhost:{self.report_port}/index.html",
+            f"http://127.0.0.1:{self.report_port}/index.html"
+        )
         
     def get_report_urls(self) -> List[str]:
         """
@@ -26,11 +50,7 @@ class NotificationHelper:
         Returns:
             报告URL列表
         """
-        return [
-            f"http://{self.local_ip}:{self.report_port}/index.html",
-            f"http://localhost:{self.report_port}/index.html",
-            f"http://127.0.0.1:{self.report_port}/index.html"
-        ]
+        return list(self._urls)
     
     def get_report_info(self) -> Dict[str, Any]:
         """
@@ -39,16 +59,11 @@ class NotificationHelper:
         Returns:
             包含报告信息的字典
         """
-        urls = self.get_report_urls()
         return {
-            'urls': urls,
-            'primary_url': urls[0],
+            'urls': list(self._urls),
+            'primary_url': self._urls[0],
             'local_path': './report/html/index.html',
-            'access_tips': [
-                "如果链接1无法访问，请尝试链接2或链接3",
-                "或复制链接到浏览器中打开",
-                "报告文件位置：./report/html/index.html"
-            ]
+            'access_tips': list(self.ACCESS_TIPS)
         }
     
     def format_dingtalk_links(self) -> str:
@@ -58,17 +73,8 @@ class NotificationHelper:
         Returns:
             格式化后的链接文本
         """
-        urls = self.get_report_urls()
-        links = "\n".join([f"> 📊 [测试报告链接{i+1}]({url})" for i, url in enumerate(urls)])
-        
-        tips = (
-            "\n\n> 💡 **报告访问说明**："
-            "\n> - 如果链接1无法访问，请尝试链接2或链接3"
-            "\n> - 或复制链接到浏览器中打开"
-            "\n> - 报告文件位置：./report/html/index.html"
-        )
-        
-        return links + tips
+        links = "\n".join([_DINGTALK_LINE(index=i, url=url) for i, url in enumerate(self._urls, 1)])
+        return links + self.DINGTALK_TIPS
     
     def format_wechat_links(self) -> str:
         """
@@ -77,17 +83,8 @@ class NotificationHelper:
         Returns:
             格式化后的链接文本
         """
-        urls = self.get_report_urls()
-        links = "\n".join([f">📊 [测试报告链接{i+1}]({url})" for i, url in enumerate(urls)])
-        
-        tips = (
-            "\n>\n>💡 **报告访问说明**："
-            "\n>- 如果链接1无法访问，请尝试链接2或链接3"
-            "\n>- 或复制链接到浏览器中打开"
-            "\n>- 报告文件位置：./report/html/index.html"
-        )
-        
-        return links + tips
+        links = "\n".join([_WECHAT_LINE(index=i, url=url) for i, url in enumerate(self._urls, 1)])
+        return links + self.WECHAT_TIPS
     
     def format_email_links(self) -> str:
         """
@@ -96,17 +93,8 @@ class NotificationHelper:
         Returns:
             格式化后的链接文本
         """
-        urls = self.get_report_urls()
-        links = "\n".join([f"        测试报告链接{i+1}: {url}" for i, url in enumerate(urls)])
-        
-        tips = (
-            "\n        \n        报告访问说明："
-            "\n        - 如果链接1无法访问，请尝试链接2或链接3"
-            "\n        - 或复制链接到浏览器中打开"
-            "\n        - 报告文件位置：./report/html/index.html"
-        )
-        
-        return links + tips
+        links = "\n".join([_EMAIL_LINE(index=i, url=url) for i, url in enumerate(self._urls, 1)])
+        return links + self.EMAIL_TIPS
     
     def format_lark_links(self) -> List[Dict[str, str]]:
         """
@@ -115,14 +103,11 @@ class NotificationHelper:
         Returns:
             飞书格式的链接列表
         """
-        urls = self.get_report_urls()
         links = []
-        
-        for i, url in enumerate(urls):
-            links.append({"tag": "a", "text": f"测试报告链接{i+1}", "href": url})
-            if i < len(urls) - 1:
-                links.append({"tag": "text", "text": " | "})
-        
+        for i, url in enumerate(self._urls, 1):
+            if links:
+                links.append(dict(_LARK_SEPARATOR))
+            links.append({"tag": "a", "text": _LARK_TEXT(index=i), "href": url})
         return links
     
     def get_basic_info(self) -> Dict[str, str]:
@@ -11,6 +11,7 @@ This module provides send mail functionality.
 # @Author : txl
 描述: 发送邮件
 """
+import atexit
 import smtplib
 from email.mime.text import MIMEText
 
@@ -21,6 +22,10 @@ from utils.other_tools.allure_data.allure_report_data import AllureFileClean, Te
 class SendEmail:
     """发送邮箱"""
 
+    # 进程内共享的已登录 SMTP_SSL 连接，多次发送（如异常通知 + 报告）只握手、登录一次
+    _smtp = None
+    _closer_registered = False
+
     def __init__(self, metrics: TestMetrics):
         self.metrics = metrics
         self.allure_data = AllureFileClean()
@@ -40,11 +45,37 @@ class SendEmail:
         message["Subject"] = sub
         message["From"] = user
         message["To"] = ";".join(user_list)
-        server = smtplib.SMTP()
-        server.connect(config.email.email_host)
-        server.login(config.email.send_user, config.email.stamp_key)
-        server.sendmail(user, user_list, message.as_string())
-        server.close()
+        try:
+            cls._get_smtp().sendmail(user, user_list, message.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # 缓存的连接已被服务器断开，重新建立连接后重试一次
+            cls._smtp = None
+            cls._get_smtp().sendmail(user, user_list, message.as_string())
+
+    @classmethod
+    def _get_smtp(cls) -> smtplib.SMTP_SSL:
+        """
+        获取已登录的 SMTP_SSL 连接，首次调用时建立连接并登录
+        @return:
+        """
+        if cls._smtp is None:
+            server = smtplib.SMTP_SSL(config.email.email_host, smtplib.SMTP_SSL_PORT)
+            server.login(config.email.send_user, config.email.stamp_key)
+            if not cls._closer_registered:
+                atexit.register(cls._close_smtp)
+                cls._closer_registered = True
+            cls._smtp = server
+        return cls._smtp
+
+    @classmethod
+    def _close_smtp(cls) -> None:
+        """进程退出时关闭共享的 SMTP 连接"""
+        if cls._smtp is not None:
+            try:
+                cls._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            cls._smtp = None
 
     def error_mail(self, error_message: str) -> None:
         """
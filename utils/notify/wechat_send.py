@@ -1,5 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import os
+import urllib.parse
+from typing import Dict, Tuple
+
 import requests
 
 from utils import config
@@ -24,6 +28,12 @@ class WeChatSend:
     def __init__(self, metrics: TestMetrics):
         self.metrics = metrics
         self.headers = {"Content-Type": "application/json"}
+        # 复用同一会话的 TCP/TLS 长连接；Content-Type 仍按请求传入，避免覆盖文件上传的 multipart 请求头
+        self.session = requests.Session()
+        # 文件上传所需的 webhook key，只解析一次
+        self._webhook_key = urllib.parse.parse_qs(urllib.parse.urlsplit(config.wechat.webhook).query).get("key", [""])[0]
+        # 已上传文件的 media_id 缓存，按 (文件路径, 修改时间) 区分，文件未变化时无需重复上传
+        self._media_cache: Dict[Tuple[str, float], str] = {}
 
     def send_text(self, content, mentioned_mobile_list=None):
         """
@@ -39,19 +49,17 @@ class WeChatSend:
 
         if mentioned_mobile_list is None or isinstance(mentioned_mobile_list, list):
             # 判断手机号码列表中得数据类型，如果为int类型，发送得消息会乱码
-            if len(mentioned_mobile_list) >= 1:
-                for i in mentioned_mobile_list:
-                    if isinstance(i, str):
-                        res = requests.post(url=config.wechat.webhook, json=_data, headers=self.headers)
-                        if res.json()["errcode"] != 0:
-                            ERROR.logger.error(res.json())
-                            raise SendMessageError("企业微信「文本类型」消息发送失败")
-
-                    else:
-                        raise ValueTypeError("手机号码必须是字符串类型.")
+            if mentioned_mobile_list and not all(isinstance(i, str) for i in mentioned_mobile_list):
+                raise ValueTypeError("手机号码必须是字符串类型.")
         else:
             raise ValueTypeError("手机号码列表必须是list类型.")
 
+        # 接口本身支持传入手机号列表，只需发送一次
+        body = self.session.post(url=config.wechat.webhook, json=_data, headers=self.headers).json()
+        if body.get("errcode") != 0:
+            ERROR.logger.error(body)
+            raise SendMessageError("企业微信「文本类型」消息发送失败")
+
     def send_markdown(self, content):
         """
         发送 MarkDown 类型消息
@@ -59,20 +67,23 @@ class WeChatSend:
         :return:
         """
         _data = {"msgtype": "markdown", "markdown": {"content": content}}
-        res = requests.post(url=config.wechat.webhook, json=_data, headers=self.headers)
-        if res.json()["errcode"] != 0:
-            ERROR.logger.error(res.json())
+        body = self.session.post(url=config.wechat.webhook, json=_data, headers=self.headers).json()
+        if body.get("errcode") != 0:
+            ERROR.logger.error(body)
             raise SendMessageError("企业微信「MarkDown类型」消息发送失败")
 
     def _upload_file(self, file):
         """
         先将文件上传到临时媒体库
         """
-        key = config.wechat.webhook.split("key=")[1]
-        url = f"https://qyapi.weixin.qq.com/cgi-bin/webhook/upload_media?key={key}&type=file"
-        data = {"file": open(file, "rb")}
-        res = requests.post(url, files=data).json()
-        return res["media_id"]
+        cache_key = (file, os.path.getmtime(file))
+        media_id = self._media_cache.get(cache_key)
+        if media_id is None:
+            url = f"https://qyapi.weixin.qq.com/cgi-bin/webhook/upload_media?key={self._webhook_key}&type=file"
+            with open(file, "rb") as f:
+                res = self.session.post(url, files={"file": f}).json()
+            media_id = self._media_cache[cache_key] = res["media_id"]
+        return media_id
 
     def send_file_msg(self, file):
         """
@@ -81,9 +92,9 @@ class WeChatSend:
         """
 
         _data = {"msgtype": "file", "file": {"media_id": self._upload_file(file)}}
-        res = requests.post(url=config.wechat.webhook, json=_data, headers=self.headers)
-        if res.json()["errcode"] != 0:
-            ERROR.logger.error(res.json())
+        body = self.session.post(url=config.wechat.webhook, json=_data, headers=self.headers).json()
+        if body.get("errcode") != 0:
+            ERROR.logger.error(body)
             raise SendMessageError("企业微信「file类型」消息发送失败")
 
     def send_wechat_notification(self, use_enhanced_format: bool = True):
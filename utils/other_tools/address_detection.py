@@ -12,8 +12,8 @@ This module provides address detection functionality.
 @date：2022/11/9 11:42
 @blogs: https://blog.csdn.net/weixin_43865008
 """
-import copy
-from typing import Dict, List
+import json
+from typing import Dict, Iterator, List, Tuple
 
 from utils.mysql_tool.mysql_control import MysqlDB
 
@@ -37,6 +37,13 @@ class AddressDetection(MysqlDB):
     - 数据修复建议
     """
 
+    # 已上线且未删除的店铺地址信息查询语句
+    SHOP_ADDRESS_SQL = (
+        "SELECT id, name, attribute, shop_type, sub_shop_type "
+        "FROM `test_obp_supplier`.`supplier_shop` "
+        "where status = 2 and delete_flag = 0 and sub_shop_type >= 300"
+    )
+
     def get_shop_address_entity_str(self) -> List[Dict]:
         """
         获取所有已经上线并且未删除的店铺地址信息
@@ -46,28 +53,41 @@ class AddressDetection(MysqlDB):
         Returns:
             店铺信息列表，包含店铺ID、名称、属性等信息
         """
-        shop_info = self.query(
-            "SELECT id, name, attribute, shop_type, sub_shop_type "
-            "FROM `test_obp_supplier`.`supplier_shop` "
-            "where status = 2 and delete_flag = 0 and sub_shop_type > 300 "
-            "and sub_shop_type = 300"
-        )
+        shop_info = self.query(self.SHOP_ADDRESS_SQL)
         return shop_info
 
-    def get_logistics_address_library(self):
+    def iter_shop_address_entity(self) -> Iterator[Dict]:
         """
-        获取平台地址库中的省份code
-        :return:
+        流式获取店铺地址信息，逐行返回，适用于店铺数量较多的场景
+
+        Returns:
+            逐行生成的店铺信息
         """
+        return self.iter_query(self.SHOP_ADDRESS_SQL)
 
-        code = self.query(
-            "select name, code from `test_obp_order`.`logistics_address_library` " "where parent_code > 0"
+    def get_address_library_maps(self) -> Tuple[Dict, Dict]:
+        """
+        单次查询平台地址库，同时构建两份映射：
+        区域code -> 区域名称，以及 (上级code, 区域名称) -> 区域code，
+        替代逐个店铺按城市和区县名称查询数据库
+        :return: (code_to_name, area_code_by_city)
+        """
+        rows = self.query(
+            "select name, code, parent_code from `test_obp_order`.`logistics_address_library` " "where parent_code > 0"
         )
+        code_to_name = {}
+        area_code_by_city = {}
+        for i in rows:
+            code_to_name[i["code"]] = i["name"]
+            area_code_by_city[(str(i["parent_code"]), i["name"])] = i["code"]
+        return code_to_name, area_code_by_city
 
-        area_code = {}
-        for i in code:
-            area_code[i["code"]] = i["name"]
-        return area_code
+    def get_logistics_address_library(self):
+        """
+        获取平台地址库中的省份code
+        :return:
+        """
+        return self.get_address_library_maps()[0]
 
     def get_error_shop(self):
         """
@@ -75,37 +95,39 @@ class AddressDetection(MysqlDB):
         :return:
         """
         # 获取区域code
-        get_logistics_address_library = self.get_logistics_address_library()
+        get_logistics_address_library, area_code_by_city = self.get_address_library_maps()
         num = 0
-        for i in self.get_shop_address_entity_str():
-            # 获取店铺地址
-            shop_address_entity_str = eval(i["attribute"])["shopAddressEntityStr"]
-
-            if (
-                shop_address_entity_str["countiesName"]
-                == get_logistics_address_library[str(shop_address_entity_str["countiesCode"])]
-            ):
-                pass
-            else:
-                area_name = self.query(
-                    "SELECT name, code FROM `test_obp_order`.`logistics_address_library`"
-                    f" where parent_code = {shop_address_entity_str['cityCode']} and name = '{shop_address_entity_str['countiesName']}'"
-                )
-                num += 1
-
-                new_shop_address_entity_str = copy.deepcopy(shop_address_entity_str)
-                new_shop_address_entity_str["countiesCode"] = area_name[0]["code"]
-                # print(str(f'update obp_supplier.supplier_shop set attribute = json_set(attribute,"$.shopAddressEntityStr.countiesCode",{area_name[0]["code"]}) where id = {i["id"]};'))
-                print(
-                    f"店铺名称: {i['name']}, 店铺id: {i['id']}, "
-                    f"店铺地址：{shop_address_entity_str['cityName']}{shop_address_entity_str['provinceName']}{shop_address_entity_str['countiesName']}"
-                    f"\n当前实际数据:{shop_address_entity_str}"
-                    f"\n{shop_address_entity_str['countiesName']}的实际code码为 {area_name}"
-                    f"\n更改后的数据： {new_shop_address_entity_str}"
+        # 地址库已预先加载，遍历店铺期间无需再查询数据库，可以使用流式游标
+        for i in self.iter_shop_address_entity():
+            # 获取店铺地址，attribute 为 JSON 字段，使用 json.loads 解析（避免 eval 执行任意代码）
+            shop_address_entity_str = json.loads(i["attribute"])["shopAddressEntityStr"]
+            counties_name = shop_address_entity_str["countiesName"]
+
+            if counties_name == get_logistics_address_library.get(str(shop_address_entity_str["countiesCode"])):
+                continue
+
+            area_code = area_code_by_city.get((str(shop_address_entity_str["cityCode"]), counties_name))
+            if area_code is None:
+                # 与逐条查询时取 area_name[0] 的行为一致：地址库中无匹配区县时抛出 IndexError
+                raise IndexError(
+                    f"地址库中未找到区县: {counties_name}, 城市code: {shop_address_entity_str['cityCode']}"
                 )
-                print("*" * 100)
+            num += 1
+
+            # 地址信息为扁平字典，浅拷贝并替换区县code即可
+            new_shop_address_entity_str = {**shop_address_entity_str, "countiesCode": area_code}
+            # print(str(f'update obp_supplier.supplier_shop set attribute = json_set(attribute,"$.shopAddressEntityStr.countiesCode",{area_code}) where id = {i["id"]};'))
+            print(
+                f"店铺名称: {i['name']}, 店铺id: {i['id']}, "
+                f"店铺地址：{shop_address_entity_str['cityName']}{shop_address_entity_str['provinceName']}{counties_name}"
+                f"\n当前实际数据:{shop_address_entity_str}"
+                f"\n{counties_name}的实际code码为 {area_code}"
+                f"\n更改后的数据： {new_shop_address_entity_str}"
+            )
+            print("*" * 100)
 
         print(num)
 
 
-AddressDetection().get_error_shop()
+if __name__ == "__main__":
+    AddressDetection().get_error_shop()
@@ -33,11 +33,11 @@ class AutoTestException(Exception):
         self.message = message
         self.error_code = error_code
         self.details = details
+        # 展示文本在构造时生成一次，日志中多次 str() 直接复用
+        self._str = f"[{error_code}] {message}" if error_code else message
 
     def __str__(self) -> str:
-        if self.error_code:
-            return f"[{self.error_code}] {self.message}"
-        return self.message
+        return self._str
 
 
 # 向后兼容的基础异常类
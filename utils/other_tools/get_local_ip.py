@@ -14,11 +14,13 @@ This module provides get local ip functionality.
 # @describe:
 """
 import socket
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_host_ip():
     """
-    查询本机ip地址
+    查询本机ip地址，进程内只探测一次并缓存结果
     :return:
     """
     _s = None
@@ -27,6 +29,8 @@ def get_host_ip():
         _s.connect(("8.8.8.8", 80))
         l_host = _s.getsockname()[0]
     finally:
-        _s.close()
+        # socket 创建失败时 _s 仍为 None，避免在 finally 中掩盖原始异常
+        if _s is not None:
+            _s.close()
 
     return l_host
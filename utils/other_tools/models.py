@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import sys
 import types
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import Any, Callable, Dict, List, Optional, Text, Union
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -12,6 +13,9 @@ models module
 Provides functionality for models
 """
 
+# Python 3.10+ 的 dataclass 支持 slots，低版本退化为普通 dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class NotificationType(Enum):
     """自动化通知方式"""
@@ -90,6 +94,10 @@ class TestCaseEnum(Enum):
     SLEEP = ("sleep", False)
 
 
+# 用例必填字段名，模块加载时从 TestCaseEnum 计算一次
+REQUIRED_CASE_FIELDS: Tuple[Text, ...] = tuple(name for name, required in (m.value for m in TestCaseEnum) if required)
+
+
 class Method(Enum):
     """
     HTTP请求方法枚举
@@ -311,7 +319,8 @@ class TestCase(BaseModel):
     sleep: Optional[Union[int, float]]
 
 
-class ResponseData(BaseModel):
+@dataclass(**_DATACLASS_SLOTS)
+class ResponseData:
     """
     响应数据模型
 
@@ -328,6 +337,9 @@ class ResponseData(BaseModel):
     - res_time: 响应时间
     - status_code: HTTP状态码
     - 其他辅助字段...
+
+    由请求执行结果在框架内部构建，数据可信，使用 dataclass 避免每次请求的 pydantic 校验开销；
+    用例数据的校验仍在 TestCase 中完成。
     """
 
     url: Text
@@ -343,9 +355,9 @@ class ResponseData(BaseModel):
     assert_data: Dict
     res_time: Union[int, float]
     status_code: int
-    teardown: List["TearDown"] = None
-    teardown_sql: Union[None, List]
-    body: Any
+    teardown: Optional[List["TearDown"]] = None
+    teardown_sql: Union[None, List] = None
+    body: Any = None
 
 
 class DingTalk(BaseModel):
@@ -524,3 +536,7 @@ class AssertMethod(Enum):
     contained_by = "contained_by"
     startswith = "startswith"
     endswith = "endswith"
+
+
+# 断言类型值 -> 断言方法名称的查找表，避免每次断言都经过 Enum 构造调用
+ASSERT_METHOD_NAMES: Dict[Text, Text] = {m.value: m.name for m in AssertMethod}
@@ -13,15 +13,21 @@ This module provides performance monitor functionality.
 @Time   : 2023-12-20
 @Author : txl
 """
+import heapq
 import json
 import threading
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
 
-import psutil
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 @dataclass
@@ -38,6 +44,20 @@ class PerformanceMetrics:
     error_message: Optional[str] = None
 
 
+# 性能报告明细中不输出的字段
+_REPORT_EXCLUDED_FIELDS = ("start_time", "end_time")
+# dataclass 报告字段名缓存，避免每次序列化都调用 dataclasses.fields()
+_fields_cache: Dict[type, Tuple[str, ...]] = {}
+
+
+def _report_field_names(cls: type) -> Tuple[str, ...]:
+    """获取 dataclass 需要写入报告的字段名，按类缓存"""
+    names = _fields_cache.get(cls)
+    if names is None:
+        names = _fields_cache[cls] = tuple(f.name for f in fields(cls) if f.name not in _REPORT_EXCLUDED_FIELDS)
+    return names
+
+
 class PerformanceMonitor:
     """性能监控器"""
 
@@ -45,10 +65,13 @@ class PerformanceMonitor:
         self.metrics: List[PerformanceMetrics] = []
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
-        self.system_metrics: List[Dict[str, Any]] = []
+        # 保持最近100个数据点，超出时自动淘汰最旧的数据
+        self.system_metrics: Deque[Dict[str, Any]] = deque(maxlen=100)
 
     def start_monitoring(self):
         """开始系统监控"""
+        if self.monitoring:
+            return
         self.monitoring = True
         self.monitor_thread = threading.Thread(target=self._monitor_system)
         self.monitor_thread.daemon = True
@@ -59,11 +82,29 @@ class PerformanceMonitor:
         self.monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
+            self.monitor_thread = None
+
+    @contextmanager
+    def sampling(self):
+        """
+        在上下文范围内启动系统资源采样，退出时停止
+
+        采样线程需显式开启，未开启时 record_test_performance 会实时读取系统资源。
+        """
+        self.start_monitoring()
+        try:
+            yield self
+        finally:
+            self.stop_monitoring()
 
     def _monitor_system(self):
         """监控系统资源"""
+        # psutil 仅在实际采样时按需导入，仅使用缓存装饰器时无需承担其导入开销
+        import psutil
+
         while self.monitoring:
             try:
+                # interval=1 本身会阻塞 1 秒，作为采样间隔，无需额外 sleep
                 cpu_percent = psutil.cpu_percent(interval=1)
                 memory = psutil.virtual_memory()
 
@@ -77,14 +118,9 @@ class PerformanceMonitor:
                     }
                 )
 
-                # 保持最近100个数据点
-                if len(self.system_metrics) > 100:
-                    self.system_metrics.pop(0)
-
             except Exception:
-                pass
-
-            time.sleep(1)
+                # 采样失败时仍保持采样间隔，避免空转
+                time.sleep(1)
 
     def record_test_performance(
         self, test_name: str, start_time: float, end_time: float, success: bool, error_message: Optional[str] = None
@@ -92,9 +128,16 @@ class PerformanceMonitor:
         """记录测试性能"""
         duration = end_time - start_time
 
-        # 获取当前系统资源使用情况
-        cpu_usage = psutil.cpu_percent()
-        memory_usage = psutil.virtual_memory().percent
+        # 获取当前系统资源使用情况：监控线程运行中时直接复用最近一次采样，否则实时读取
+        if self.monitoring and self.system_metrics:
+            last = self.system_metrics[-1]
+            cpu_usage = last["cpu_percent"]
+            memory_usage = last["memory_percent"]
+        else:
+            import psutil
+
+            cpu_usage = psutil.cpu_percent()
+            memory_usage = psutil.virtual_memory().percent
 
         metrics = PerformanceMetrics(
             test_name=test_name,
@@ -114,11 +157,32 @@ class PerformanceMonitor:
         if not self.metrics:
             return {"message": "暂无性能数据"}
 
-        durations = [m.duration for m in self.metrics]
-        cpu_usages = [m.cpu_usage for m in self.metrics]
-        memory_usages = [m.memory_usage for m in self.metrics]
-
-        success_count = sum(1 for m in self.metrics if m.success)
+        # 单次遍历同时累计耗时、CPU、内存的总和 / 最小值 / 最大值
+        first = self.metrics[0]
+        dur_sum = cpu_sum = mem_sum = 0
+        dur_min = dur_max = first.duration
+        cpu_min = cpu_max = first.cpu_usage
+        mem_min = mem_max = first.memory_usage
+        success_count = 0
+        for m in self.metrics:
+            duration, cpu, mem = m.duration, m.cpu_usage, m.memory_usage
+            dur_sum += duration
+            cpu_sum += cpu
+            mem_sum += mem
+            if duration < dur_min:
+                dur_min = duration
+            elif duration > dur_max:
+                dur_max = duration
+            if cpu < cpu_min:
+                cpu_min = cpu
+            elif cpu > cpu_max:
+                cpu_max = cpu
+            if mem < mem_min:
+                mem_min = mem
+            elif mem > mem_max:
+                mem_max = mem
+            if m.success:
+                success_count += 1
         total_count = len(self.metrics)
 
         return {
@@ -126,44 +190,40 @@ class PerformanceMonitor:
             "success_tests": success_count,
             "success_rate": (success_count / total_count) * 100,
             "duration": {
-                "total": sum(durations),
-                "average": sum(durations) / len(durations),
-                "min": min(durations),
-                "max": max(durations),
+                "total": dur_sum,
+                "average": dur_sum / total_count,
+                "min": dur_min,
+                "max": dur_max,
             },
-            "cpu_usage": {"average": sum(cpu_usages) / len(cpu_usages), "min": min(cpu_usages), "max": max(cpu_usages)},
+            "cpu_usage": {"average": cpu_sum / total_count, "min": cpu_min, "max": cpu_max},
             "memory_usage": {
-                "average": sum(memory_usages) / len(memory_usages),
-                "min": min(memory_usages),
-                "max": max(memory_usages),
+                "average": mem_sum / total_count,
+                "min": mem_min,
+                "max": mem_max,
             },
-            "slowest_tests": sorted(
-                [(m.test_name, m.duration) for m in self.metrics], key=lambda x: x[1], reverse=True
-            )[:5],
+            "slowest_tests": [
+                (m.test_name, m.duration) for m in heapq.nlargest(5, self.metrics, key=lambda m: m.duration)
+            ],
         }
 
     def save_performance_report(self, file_path: str = "performance_report.json"):
         """保存性能报告"""
         summary = self.get_performance_summary()
+        names = _report_field_names(PerformanceMetrics)
 
         report = {
             "summary": summary,
-            "detailed_metrics": [
-                {
-                    "test_name": m.test_name,
-                    "duration": m.duration,
-                    "cpu_usage": m.cpu_usage,
-                    "memory_usage": m.memory_usage,
-                    "success": m.success,
-                    "error_message": m.error_message,
-                }
-                for m in self.metrics
-            ],
-            "system_metrics": self.system_metrics[-50:],  # 最近50个数据点
+            "detailed_metrics": [{name: getattr(m, name) for name in names} for m in self.metrics],
+            "system_metrics": list(self.system_metrics)[-50:],  # 最近50个数据点
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # orjson 在 C 中直接序列化为 UTF-8 字节；OPT_NON_STR_KEYS 允许 int 等非字符串键（与 json 一样转为字符串）。
+            # 与 json.dump(ensure_ascii=False, indent=2) 的差异：NaN/Infinity 写为 null，浮点数的表示可能略有不同
+            Path(file_path).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
 
 
 # 全局性能监控器实例
@@ -201,37 +261,34 @@ class TestDataCache:
     """测试数据缓存"""
 
     def __init__(self, max_size: int = 100):
-        self.cache: Dict[str, Any] = {}
-        self.access_times: Dict[str, float] = {}
+        # 按访问顺序排列，最久未访问的数据位于头部
+        self.cache: "OrderedDict[Hashable, Any]" = OrderedDict()
         self.max_size = max_size
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """获取缓存数据"""
         if key in self.cache:
-            self.access_times[key] = time.time()
+            self.cache.move_to_end(key)
             return self.cache[key]
         return None
 
-    def set(self, key: str, value: Any):
+    def set(self, key: Hashable, value: Any):
         """设置缓存数据"""
-        # 如果缓存已满，删除最久未访问的数据
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-            self.remove(oldest_key)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # 如果缓存已满，删除最久未访问的数据
+            self.cache.popitem(last=False)
 
         self.cache[key] = value
-        self.access_times[key] = time.time()
 
-    def remove(self, key: str):
+    def remove(self, key: Hashable):
         """删除缓存数据"""
-        if key in self.cache:
-            del self.cache[key]
-            del self.access_times[key]
+        self.cache.pop(key, None)
 
     def clear(self):
         """清空缓存"""
         self.cache.clear()
-        self.access_times.clear()
 
     def size(self) -> int:
         """获取缓存大小"""
@@ -257,8 +314,16 @@ def cached_test_data(cache_key: Optional[str] = None, ttl: int = 3600):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # 生成缓存键
-            key = cache_key or f"{func.__module__}.{func.__name__}:{hash(str(args) + str(kwargs))}"
+            # 生成缓存键：参数可哈希时直接使用参数元组，避免将参数整体转为字符串
+            key = cache_key
+            if key is None:
+                try:
+                    key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+                    # 提前计算哈希，参数不可哈希时在此抛出 TypeError
+                    hash(key)
+                except TypeError:
+                    # 参数中包含 dict/list 等不可哈希对象时，退化为字符串哈希
+                    key = f"{func.__module__}.{func.__name__}:{hash(str(args) + str(kwargs))}"
 
             # 尝试从缓存获取
             cached_result = test_data_cache.get(key)
@@ -276,10 +341,13 @@ def cached_test_data(cache_key: Optional[str] = None, ttl: int = 3600):
     return decorator
 
 
-def optimize_test_execution():
-    """优化测试执行"""
-    # 启动性能监控
-    performance_monitor.start_monitoring()
+def optimize_test_execution(enable_sampling: bool = False):
+    """
+    优化测试执行
+    :param enable_sampling: 是否启动后台系统资源采样线程，默认不启动，也可使用 performance_monitor.sampling()
+    """
+    if enable_sampling:
+        performance_monitor.start_monitoring()
 
     # 设置进程优先级（仅在支持的系统上）
     try:
@@ -325,9 +393,10 @@ if __name__ == "__main__":
 
     optimize_test_execution()
 
-    # 运行测试
-    for i in range(5):
-        test_function()
+    # 运行测试，期间采样系统资源
+    with performance_monitor.sampling():
+        for i in range(5):
+            test_function()
 
     # 显示性能摘要
     summary = performance_monitor.get_performance_summary()
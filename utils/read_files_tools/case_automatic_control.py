@@ -11,6 +11,8 @@ This module provides case automatic control functionality.
 # @Author : txl
 """
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
 from typing import Dict, Text
 
 from common.setting import ensure_path_sep
@@ -19,6 +21,10 @@ from utils.read_files_tools.get_all_files_path import get_all_files
 from utils.read_files_tools.testcase_template import write_testcase_file
 from utils.read_files_tools.yaml_control import GetYamlData
 
+# yaml 文件数量达到该值时才使用多进程生成。单个文件解析 + 渲染写入约 1ms（libyaml），
+# 而启动进程池约需 100ms 以上（spawn 方式更慢），文件较少时串行更快
+PARALLEL_THRESHOLD = 256
+
 
 class TestCaseAutomaticGeneration:
     """
@@ -46,6 +52,7 @@ class TestCaseAutomaticGeneration:
         """
         self.yaml_case_data = None
         self.file_path = None
+        self._case_date_path_len = len(self.case_date_path)
 
     @property
     def case_date_path(self) -> Text:
@@ -57,7 +64,27 @@ class TestCaseAutomaticGeneration:
         """存放用例代码路径"""
         return ensure_path_sep("\\test_case")
 
-    @property
+    def _load_case_file(self, file: Text) -> None:
+        """
+        切换到新的 yaml 用例文件
+
+        清除上一个文件计算出的缓存属性，再加载当前文件的用例数据。
+
+        Args:
+            file: yaml 用例文件路径
+        """
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
+        self.yaml_case_data = GetYamlData(file).get_yaml_data()
+        self.file_path = file
+
+    @cached_property
+    def _case_common(self) -> dict:
+        """用例公共配置 case_common，每个文件只查找一次"""
+        return self.yaml_case_data.get("case_common") or {}
+
+    @cached_property
     def allure_epic(self) -> str:
         """
         获取Allure Epic标签
@@ -70,11 +97,11 @@ class TestCaseAutomaticGeneration:
         Raises:
             AssertionError: 当YAML中缺少allureEpic配置时抛出
         """
-        _allure_epic = self.yaml_case_data.get("case_common").get("allureEpic")
+        _allure_epic = self._case_common.get("allureEpic")
         assert _allure_epic is not None, "用例中 allureEpic 为必填项，请检查用例内容, 用例路径：'%s'" % self.file_path
         return _allure_epic
 
-    @property
+    @cached_property
     def allure_feature(self) -> str:
         """
         获取Allure Feature标签
@@ -87,13 +114,13 @@ class TestCaseAutomaticGeneration:
         Raises:
             AssertionError: 当YAML中缺少allureFeature配置时抛出
         """
-        _allure_feature = self.yaml_case_data.get("case_common").get("allureFeature")
+        _allure_feature = self._case_common.get("allureFeature")
         assert _allure_feature is not None, (
             "用例中 allureFeature 为必填项，请检查用例内容, 用例路径：'%s'" % self.file_path
         )
         return _allure_feature
 
-    @property
+    @cached_property
     def allure_story(self) -> str:
         """
         获取Allure Story标签
@@ -106,44 +133,31 @@ class TestCaseAutomaticGeneration:
         Raises:
             AssertionError: 当YAML中缺少allureStory配置时抛出
         """
-        _allure_story = self.yaml_case_data.get("case_common").get("allureStory")
+        _allure_story = self._case_common.get("allureStory")
         assert _allure_story is not None, "用例中 allureStory 为必填项，请检查用例内容, 用例路径：'%s'" % self.file_path
         return _allure_story
 
-    @property
+    @cached_property
     def file_name(self) -> Text:
         """
         通过 yaml文件的命名，将名称转换成 py文件的名称
         :return:  示例： DateDemo.py
         """
-        i = len(self.case_date_path)
-        yaml_path = self.file_path[i:]
-        file_name = None
-        # 路径转换
-        if ".yaml" in yaml_path:
-            file_name = yaml_path.replace(".yaml", ".py")
-        elif ".yml" in yaml_path:
-            file_name = yaml_path.replace(".yml", ".py")
-        return file_name
+        yaml_path = self.file_path[self._case_date_path_len:]
+        # 路径转换：只替换文件扩展名
+        stem, ext = os.path.splitext(yaml_path)
+        return stem + ".py" if ext in (".yaml", ".yml") else None
 
-    @property
+    @cached_property
     def get_test_class_title(self):
         """
         自动生成类名称
         :return: sup_apply_list --> SupApplyList
         """
-        # 提取文件名称
-        _file_name = os.path.split(self.file_name)[1][:-3]
-        _name = _file_name.split("_")
-        _name_len = len(_name)
         # 将文件名称格式，转换成类名称: sup_apply_list --> SupApplyList
-        for i in range(_name_len):
-            _name[i] = _name[i].capitalize()
-        _class_name = "".join(_name)
-
-        return _class_name
+        return "".join(part.capitalize() for part in self.func_title.split("_"))
 
-    @property
+    @cached_property
     def func_title(self) -> Text:
         """
         函数名称
@@ -151,7 +165,7 @@ class TestCaseAutomaticGeneration:
         """
         return os.path.split(self.file_name)[1][:-3]
 
-    @property
+    @cached_property
     def spilt_path(self) -> list:
         """
         分割文件路径并添加test_前缀
@@ -166,7 +180,7 @@ class TestCaseAutomaticGeneration:
         path[-1] = path[-1].replace(path[-1], "test_" + path[-1])
         return path
 
-    @property
+    @cached_property
     def get_case_path(self):
         """
         根据 yaml 中的用例，生成对应 testCase 层代码的路径
@@ -175,7 +189,7 @@ class TestCaseAutomaticGeneration:
         new_name = os.sep.join(self.spilt_path)
         return ensure_path_sep("\\test_case" + new_name)
 
-    @property
+    @cached_property
     def case_ids(self) -> list:
         """
         获取用例ID列表
@@ -187,7 +201,7 @@ class TestCaseAutomaticGeneration:
         """
         return [k for k in self.yaml_case_data.keys() if k != "case_common"]
 
-    @property
+    @cached_property
     def get_file_name(self) -> str:
         """
         获取生成的测试文件名
@@ -207,30 +221,51 @@ class TestCaseAutomaticGeneration:
         # _LibDirPath = os.path.split(self.libPagePath(filePath))[0]
 
         _case_dir_path = os.path.split(self.get_case_path)[0]
-        if not os.path.exists(_case_dir_path):
-            os.makedirs(_case_dir_path)
+        # 多进程生成时多个文件可能同时创建同一目录
+        os.makedirs(_case_dir_path, exist_ok=True)
+
+    def generate_case_file(self, file: Text) -> None:
+        """
+        根据单个 yaml 文件生成测试代码
+
+        Args:
+            file: yaml 用例文件路径
+        """
+        self._load_case_file(file)
+        # 判断用例需要用的文件夹路径是否存在，不存在则创建
+        self.mk_dir()
+        write_testcase_file(
+            allure_epic=self.allure_epic,
+            allure_feature=self.allure_feature,
+            class_title=self.get_test_class_title,
+            func_title=self.func_title,
+            case_path=self.get_case_path,
+            case_ids=self.case_ids,
+            file_name=self.get_file_name,
+            allure_story=self.allure_story,
+        )
 
     def get_case_automatic(self) -> None:
         """自动生成 测试代码"""
         file_path = get_all_files(file_path=ensure_path_sep("\\data"), yaml_data_switch=True)
+        # 判断代理拦截的yaml文件，不生成test_case代码
+        files = [file for file in file_path if "proxy_data.yaml" not in file]
+
+        if len(files) < PARALLEL_THRESHOLD:
+            for file in files:
+                self.generate_case_file(file)
+            return
+
+        # 各 yaml 文件相互独立，分发到多个进程并行解析与生成
+        with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+            # 消费结果，使子进程中的异常在主进程抛出
+            for _ in executor.map(_generate_case_file, files, chunksize=8):
+                pass
+
 
-        for file in file_path:
-            # 判断代理拦截的yaml文件，不生成test_case代码
-            if "proxy_data.yaml" not in file:
-                # 判断用例需要用的文件夹路径是否存在，不存在则创建
-                self.yaml_case_data = GetYamlData(file).get_yaml_data()
-                self.file_path = file
-                self.mk_dir()
-                write_testcase_file(
-                    allure_epic=self.allure_epic,
-                    allure_feature=self.allure_feature,
-                    class_title=self.get_test_class_title,
-                    func_title=self.func_title,
-                    case_path=self.get_case_path,
-                    case_ids=self.case_ids,
-                    file_name=self.get_file_name,
-                    allure_story=self.allure_story,
-                )
+def _generate_case_file(file: Text) -> None:
+    """多进程任务入口：每个文件使用独立的生成器实例"""
+    TestCaseAutomaticGeneration().generate_case_file(file)
 
 
 if __name__ == "__main__":
@@ -14,11 +14,13 @@ import os
 
 
 def del_file(path):
-    """删除目录下的文件"""
-    list_path = os.listdir(path)
-    for i in list_path:
-        c_path = os.path.join(path, i)
-        if os.path.isdir(c_path):
-            del_file(c_path)
-        else:
-            os.remove(c_path)
+    """删除目录下的文件（保留目录结构），使用显式栈迭代，避免深层目录递归"""
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # DirEntry 复用读取目录时的类型信息，无需再次 stat
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    os.unlink(entry.path)
@@ -23,15 +23,62 @@ This module provides data driver control functionality.
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from common.setting import ensure_path_sep
 from utils import config
 from utils.logging_tool.log_control import ERROR, INFO
-# 注意：CaseData 是旧的数据加载接口，仅用于向后兼容
-# 新项目建议使用当前模块的统一接口
-from utils.read_files_tools.get_yaml_data_analysis import CaseData
-from utils.read_files_tools.yaml_control import GetYamlData
+
+_EMPTY = MappingProxyType({})
+# 各数据驱动类型对应的文件扩展名（不含点，小写）
+_YAML_EXTS = frozenset({"yaml", "yml"})
+_EXCEL_EXTS = frozenset({"xlsx", "xls"})
+# 模块名 -> {YAML文件名: Excel文件名}，导入时构建一次
+_YAML2EXCEL = MappingProxyType({
+    'Login': MappingProxyType({
+        'login.yaml': 'login_test_data.xlsx'
+    }),
+    'UserInfo': MappingProxyType({
+        'get_user_info.yaml': 'userinfo_test_data.xlsx'
+    }),
+    'Collect': MappingProxyType({
+        'collect_addtool.yaml': 'collect_test_data.xlsx',
+        'collect_delete_tool.yaml': 'collect_test_data.xlsx',
+        'collect_tool_list.yaml': 'collect_test_data.xlsx',
+        'collect_update_tool.yaml': 'collect_test_data.xlsx'
+    })
+})
+
+
+def _iter_by_ext(dirpath: str, exts: frozenset) -> Iterator[str]:
+    """
+    单次遍历目录（不递归），逐个返回扩展名匹配的文件路径，目录不存在时不返回任何路径
+
+    Args:
+        dirpath: 目录路径
+        exts: 扩展名集合，不含点，小写
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            for e in it:
+                if e.is_file() and e.name.rpartition(".")[2].lower() in exts:
+                    yield e.path
+    except FileNotFoundError:
+        return
+
+
+def _find_by_ext(dirpath: str, exts: frozenset) -> List[str]:
+    """返回目录下扩展名匹配的全部文件路径"""
+    return list(_iter_by_ext(dirpath, exts))
+
+
+def _first_by_ext(dirpath: str, exts: frozenset) -> Optional[str]:
+    """返回目录下第一个扩展名匹配的文件路径，找到后立即停止遍历"""
+    files = _iter_by_ext(dirpath, exts)
+    try:
+        return next(files, None)
+    finally:
+        files.close()
 
 
 class DataDriverType(Enum):
@@ -51,6 +98,8 @@ class DataDriverConfig:
     def __init__(self):
         """初始化数据驱动配置"""
         self._config = config
+        # 数据路径缓存：(驱动类型, 项目名称, YAML路径, Excel路径) -> 当前数据路径，配置变化时自动使用新的键
+        self._path_cache: Dict[tuple, str] = {}
 
     @property
     def driver_type(self):
@@ -80,12 +129,20 @@ class DataDriverConfig:
         Returns:
             数据路径字符串
         """
-        if self.driver_type == DataDriverType.YAML.value:
-            return os.path.join(self.yaml_data_path, self.project_name)
-        elif self.driver_type == DataDriverType.EXCEL.value:
-            return os.path.join(self.excel_data_path, self.project_name)
+        driver_type = self.driver_type
+        key = (driver_type, self.project_name, self.yaml_data_path, self.excel_data_path)
+        path = self._path_cache.get(key)
+        if path is not None:
+            return path
+
+        if driver_type == DataDriverType.YAML.value:
+            path = os.path.join(key[2], key[1])
+        elif driver_type == DataDriverType.EXCEL.value:
+            path = os.path.join(key[3], key[1])
         else:
-            raise ValueError(f"不支持的数据驱动类型: {self.driver_type}")
+            raise ValueError(f"不支持的数据驱动类型: {driver_type}")
+        self._path_cache[key] = path
+        return path
 
 
 class DataDriverManager:
@@ -144,16 +201,20 @@ class DataDriverManager:
             file_path = module_path / file_name
         else:
             # 自动查找YAML文件
-            yaml_files = list(module_path.glob("*.yaml")) + list(module_path.glob("*.yml"))
-            if not yaml_files:
+            yaml_file = _first_by_ext(str(module_path), _YAML_EXTS)
+            if yaml_file is None:
                 raise FileNotFoundError(f"在模块 {module_name} 中未找到YAML文件")
-            file_path = yaml_files[0]  # 使用第一个找到的文件
+            file_path = Path(yaml_file)  # 使用第一个找到的文件
 
         if not file_path.exists():
             raise FileNotFoundError(f"YAML文件不存在: {file_path}")
 
         INFO.logger.info(f"读取YAML数据文件: {file_path}")
 
+        # 注意：CaseData 是旧的数据加载接口，仅用于向后兼容，新项目建议使用当前模块的统一接口
+        # 按需导入，仅使用 Excel 数据驱动或只列出文件时无需加载用例模型
+        from utils.read_files_tools.get_yaml_data_analysis import CaseData
+
         # 使用现有的YAML数据处理器
         case_data = CaseData(str(file_path))
         return case_data.case_process()
@@ -184,10 +245,10 @@ class DataDriverManager:
             file_path = module_path / excel_file_name
         else:
             # 自动查找Excel文件
-            excel_files = list(module_path.glob("*.xlsx")) + list(module_path.glob("*.xls"))
-            if not excel_files:
+            excel_file = _first_by_ext(str(module_path), _EXCEL_EXTS)
+            if excel_file is None:
                 raise FileNotFoundError(f"在模块 {module_name} 中未找到Excel文件")
-            file_path = excel_files[0]  # 使用第一个找到的文件
+            file_path = Path(excel_file)  # 使用第一个找到的文件
 
         if not file_path.exists():
             raise FileNotFoundError(f"Excel文件不存在: {file_path}")
@@ -208,24 +269,8 @@ class DataDriverManager:
         Returns:
             对应的Excel文件名
         """
-        # 文件名映射表
-        file_mapping = {
-            'Login': {
-                'login.yaml': 'login_test_data.xlsx'
-            },
-            'UserInfo': {
-                'get_user_info.yaml': 'userinfo_test_data.xlsx'
-            },
-            'Collect': {
-                'collect_addtool.yaml': 'collect_test_data.xlsx',
-                'collect_delete_tool.yaml': 'collect_test_data.xlsx',
-                'collect_tool_list.yaml': 'collect_test_data.xlsx',
-                'collect_update_tool.yaml': 'collect_test_data.xlsx'
-            }
-        }
-
         # 获取模块的映射
-        module_mapping = file_mapping.get(module_name, {})
+        module_mapping = _YAML2EXCEL.get(module_name) or _EMPTY
 
         # 查找对应的Excel文件名
         excel_file_name = module_mapping.get(yaml_file_name)
@@ -248,10 +293,8 @@ class DataDriverManager:
         if not data_path.exists():
             return []
 
-        modules = []
-        for item in data_path.iterdir():
-            if item.is_dir():
-                modules.append(item.name)
+        with os.scandir(data_path) as it:
+            modules = [entry.name for entry in it if entry.is_dir()]
 
         return sorted(modules)
 
@@ -265,19 +308,15 @@ class DataDriverManager:
         Returns:
             文件名列表
         """
-        module_path = Path(self.config.current_data_path) / module_name
-        if not module_path.exists():
-            return []
-
-        files = []
+        module_path = os.path.join(self.config.current_data_path, module_name)
         if self.config.driver_type == DataDriverType.YAML.value:
-            files.extend([f.name for f in module_path.glob("*.yaml")])
-            files.extend([f.name for f in module_path.glob("*.yml")])
+            exts = _YAML_EXTS
         elif self.config.driver_type == DataDriverType.EXCEL.value:
-            files.extend([f.name for f in module_path.glob("*.xlsx")])
-            files.extend([f.name for f in module_path.glob("*.xls")])
+            exts = _EXCEL_EXTS
+        else:
+            return []
 
-        return sorted(files)
+        return sorted(os.path.basename(path) for path in _find_by_ext(module_path, exts))
 
 
 # 全局数据驱动管理器实例
@@ -10,18 +10,148 @@
 import os
 import hashlib
 import json
+import mmap
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 
 from common.setting import ensure_path_sep
 from utils import config
 from utils.logging_tool.log_control import INFO, ERROR
-from utils.read_files_tools.data_driver_control import DataDriverManager, get_test_data
-from utils.read_files_tools.get_all_files_path import get_all_files
-from utils.read_files_tools.testcase_template import write_testcase_file
+from utils.read_files_tools.data_driver_control import DataDriverManager, get_test_data, switch_data_driver
 from utils.read_files_tools.yaml_control import GetYamlData
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 文件指纹算法标识，写入追踪文件；算法变化时旧的哈希记录整体失效
+HASH_ALGO = "blake2b-128"
+# 小于该大小的文件一次性读取后计算哈希
+HASH_SMALL_FILE_SIZE = 64 * 1024
+# 不小于该大小的文件通过 mmap 映射后计算哈希，由内核负责分页读取
+HASH_MMAP_FILE_SIZE = 1024 * 1024
+# 中等大小文件分块读取时使用的缓冲区大小
+HASH_CHUNK_SIZE = 1024 * 1024
+# 数据文件数量达到该值时才使用线程池并行计算哈希，文件较少时线程启动开销大于收益
+PARALLEL_HASH_THRESHOLD = 4
+# 待生成文件数量达到该值时才使用多进程生成。单个文件解析 + 渲染写入约 1ms（libyaml），
+# 而启动进程池并在子进程中重新导入配置、日志约需 100ms 以上（spawn 方式更慢），文件较少时串行更快
+PARALLEL_GENERATE_THRESHOLD = 256
+
+# 各数据驱动类型对应的数据文件扩展名
+DATA_FILE_SUFFIXES = {
+    'yaml': ('.yaml', '.yml'),
+    'excel': ('.xlsx', '.xls'),
+}
+
+_EMPTY = MappingProxyType({})
+# 模块名 -> {测试文件名: YAML文件名}，导入时构建一次
+_TEST2YAML = MappingProxyType({
+    'Login': MappingProxyType({
+        'test_login.py': 'login.yaml'
+    }),
+    'UserInfo': MappingProxyType({
+        'test_get_user_info.py': 'get_user_info.yaml'
+    }),
+    'Collect': MappingProxyType({
+        'test_collect_addtool.py': 'collect_addtool.yaml',
+        'test_collect_delete_tool.py': 'collect_delete_tool.yaml',
+        'test_collect_tool_list.py': 'collect_tool_list.yaml',
+        'test_collect_update_tool.py': 'collect_update_tool.yaml'
+    })
+})
+
+# 每个线程复用的哈希读取缓冲区
+_hash_buffer = threading.local()
+
+
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry]:
+    """
+    递归遍历目录下的所有文件，单次遍历完成，复用 DirEntry 缓存的文件类型信息
+
+    Args:
+        path: 目录路径
+
+    Yields:
+        文件对应的 DirEntry
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except (PermissionError, FileNotFoundError):
+            # 无权限或遍历期间被删除的目录直接跳过
+            continue
+
+
+# 以下名称推导均为纯函数，批量生成时相同输入直接命中缓存
+@lru_cache(maxsize=1024)
+def _class_name(test_file_name: str) -> str:
+    """根据测试文件名生成类名：test_get_user_info.py --> GetUserInfo"""
+    base_name = test_file_name.replace('test_', '').replace('.py', '')
+    return ''.join(word.capitalize() for word in base_name.split('_'))
+
+
+@lru_cache(maxsize=1024)
+def _test_file_path(module_name: str, test_file_name: str) -> str:
+    """获取测试文件路径"""
+    return str(Path("test_case") / module_name / test_file_name)
+
+
+@lru_cache(maxsize=1024)
+def _yaml_file_for_module(module_name: str, test_file_name: str) -> str:
+    """根据模块名和测试文件名推断对应的YAML文件名"""
+    # 查找精确映射
+    yaml_file = (_TEST2YAML.get(module_name) or _EMPTY).get(test_file_name)
+    if yaml_file:
+        return yaml_file
+
+    # 通用推断
+    base_name = test_file_name.replace('test_', '').replace('.py', '')
+    return f"{base_name}.yaml"
+
+
+@lru_cache(maxsize=16)
+def _module_info_resolver(data_root: str) -> Callable[[Path], Tuple[str, str]]:
+    """
+    为固定的数据根目录构建模块信息解析函数，根目录前缀只计算一次，逐个文件解析时仅做字符串前缀截取
+
+    Args:
+        data_root: 数据根目录
+
+    Returns:
+        解析函数：数据文件路径 -> (模块名, 推荐的测试文件名)
+    """
+    prefix = os.path.join(data_root, "")
+    prefix_len = len(prefix)
+    sep = os.sep
+
+    def module_info(data_file_path: Path) -> Tuple[str, str]:
+        path = str(data_file_path)
+        file_stem = data_file_path.stem
+        if not path.startswith(prefix):
+            # 如果路径不在数据根目录下，使用文件名推断
+            return data_file_path.parent.name, f"test_{file_stem}.py"
+
+        # 提取模块名（第一级目录）
+        module_name = path[prefix_len:].split(sep, 1)[0] or "Unknown"
+        if file_stem.endswith('_test_data'):
+            file_stem = file_stem[:-10]  # 移除 '_test_data' 后缀
+        return module_name, f"test_{file_stem}.py"
+
+    return module_info
+
 
 class EnhancedTestCaseGenerator:
     """
@@ -38,89 +168,214 @@ class EnhancedTestCaseGenerator:
     def __init__(self):
         """初始化生成器"""
         self.project_root = Path.cwd()
+        # 项目根目录在生成器生命周期内不变，只解析一次
+        self._project_root_resolved = self.project_root.resolve()
+        # 带结尾分隔符的项目根目录字符串，用于前缀匹配生成文件 key
+        self._project_root_prefix = os.path.join(str(self._project_root_resolved), "")
         self.data_driver = DataDriverManager()
         self.change_tracking_file = self.project_root / ".test_case_tracking.json"
+        # 最近一次加载或保存时追踪文件的修改时间，用于判断是否需要重新加载
+        self._tracking_mtime_ns: Optional[int] = None
         self.file_changes = self._load_change_tracking()
+        # 单次生成过程中固定使用的数据驱动类型，生成过程之外为 None，实时读取配置
+        self._current_driver_type: Optional[str] = None
+        # 单次生成过程中固定使用的实时更新开关，生成过程之外为 None，实时读取配置
+        self._real_time_update: Optional[bool] = None
+
+    def _file_key(self, abs_file_path: Path) -> str:
+        """
+        生成数据文件在追踪记录中的 key：项目根目录下的文件使用相对路径，否则使用绝对路径
+
+        Args:
+            abs_file_path: 已解析的绝对路径
+        """
+        path = str(abs_file_path)
+        if path.startswith(self._project_root_prefix):
+            return path[len(self._project_root_prefix):]
+        return path
+
+    def _get_real_time_update(self) -> bool:
+        """获取是否实时更新测试用例，生成过程中返回开始时读取的值"""
+        if self._real_time_update is not None:
+            return self._real_time_update
+        config_data = GetYamlData(ensure_path_sep("\\common\\config.yaml")).get_yaml_data()
+        return bool(config_data.get("real_time_update_test_cases", False))
+
+    def _get_driver_type(self) -> str:
+        """获取当前数据驱动类型，生成过程中返回开始时记录的值"""
+        if self._current_driver_type is not None:
+            return self._current_driver_type
+        return getattr(config, 'data_driver_type', 'yaml')
 
     def _load_change_tracking(self) -> Dict[str, Any]:
         """加载文件变化追踪信息"""
-        if self.change_tracking_file.exists():
+        try:
+            self._tracking_mtime_ns = os.stat(self.change_tracking_file).st_mtime_ns
+        except OSError:
+            self._tracking_mtime_ns = None
+
+        if self._tracking_mtime_ns is not None:
             try:
-                with open(self.change_tracking_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                raw = self.change_tracking_file.read_bytes()
+                tracking = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                if tracking.get("hash_algo") != HASH_ALGO:
+                    # 旧版本使用其他哈希算法，记录无法比较，重新计算一次
+                    tracking["file_hashes"] = {}
+                    tracking["hash_algo"] = HASH_ALGO
+                return tracking
             except Exception as e:
                 INFO.logger.warning(f"加载变化追踪文件失败: {e}")
 
         return {
             "last_update": None,
+            "hash_algo": HASH_ALGO,
             "file_hashes": {},
             "generated_files": {},
             "data_driver_type": None
         }
 
+    def reload_if_changed(self) -> bool:
+        """
+        追踪文件在外部被修改时重新加载，未变化时沿用内存中的数据
+
+        Returns:
+            是否重新加载
+        """
+        try:
+            mtime_ns = os.stat(self.change_tracking_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._tracking_mtime_ns:
+            return False
+        self.file_changes = self._load_change_tracking()
+        return True
+
     def _save_change_tracking(self):
         """保存文件变化追踪信息"""
         try:
-            with open(self.change_tracking_file, 'w', encoding='utf-8') as f:
-                json.dump(self.file_changes, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                data = orjson.dumps(self.file_changes, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(self.file_changes, indent=2, ensure_ascii=False).encode('utf-8')
+            # 先写临时文件再替换，避免写入中断导致追踪文件损坏
+            tmp_file = self.change_tracking_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            tmp_file.replace(self.change_tracking_file)
+            self._tracking_mtime_ns = os.stat(self.change_tracking_file).st_mtime_ns
         except Exception as e:
             ERROR.logger.error(f"保存变化追踪文件失败: {e}")
 
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """计算文件哈希值"""
+        """
+        计算文件哈希值
+
+        按文件大小选择读取方式：小文件一次读取，中等文件分块读入线程复用的缓冲区，
+        大文件使用 mmap；每次 update 的数据量较大，哈希计算期间可释放 GIL。
+        """
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+            file_hash = hashlib.blake2b(digest_size=16)
+            with open(file_path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < HASH_SMALL_FILE_SIZE:
+                    file_hash.update(f.read())
+                elif size >= HASH_MMAP_FILE_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        file_hash.update(mm)
+                else:
+                    buf = getattr(_hash_buffer, "buf", None)
+                    if buf is None:
+                        buf = _hash_buffer.buf = bytearray(HASH_CHUNK_SIZE)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        file_hash.update(view[:n])
+            return file_hash.hexdigest()
         except Exception:
             return ""
 
     def _get_data_files(self) -> List[Path]:
         """获取当前数据驱动类型对应的数据文件"""
-        current_driver_type = getattr(config, 'data_driver_type', 'yaml')
+        current_driver_type = self._get_driver_type()
         data_path = Path(self.data_driver.config.current_data_path)
 
         if not data_path.exists():
             return []
 
-        data_files = []
-        if current_driver_type == 'yaml':
-            data_files.extend(data_path.rglob("*.yaml"))
-            data_files.extend(data_path.rglob("*.yml"))
-        elif current_driver_type == 'excel':
-            data_files.extend(data_path.rglob("*.xlsx"))
-            data_files.extend(data_path.rglob("*.xls"))
+        suffixes = DATA_FILE_SUFFIXES.get(current_driver_type)
+        if not suffixes:
+            return []
 
-        return data_files
+        return [Path(entry.path) for entry in _scandir_recursive(str(data_path)) if entry.name.endswith(suffixes)]
 
-    def _detect_changes(self) -> Tuple[List[Path], List[Path], bool]:
+    def _detect_changes(self, data_files: Optional[List[Path]] = None) -> Tuple[List[Path], List[Path], bool]:
         """
         检测文件变化
 
+        Args:
+            data_files: 已获取的数据文件列表，未传入时重新扫描数据目录
+
         Returns:
             (新增文件列表, 修改文件列表, 数据驱动类型是否变化)
         """
-        current_driver_type = getattr(config, 'data_driver_type', 'yaml')
+        current_driver_type = self._get_driver_type()
         driver_type_changed = self.file_changes.get("data_driver_type") != current_driver_type
 
-        data_files = self._get_data_files()
+        if data_files is None:
+            data_files = self._get_data_files()
         new_files = []
         modified_files = []
 
         current_hashes = {}
+        old_hashes = self.file_changes["file_hashes"]
 
+        file_keys = []
+        # 修改时间或大小发生变化、需要重新计算哈希的文件：(file_key, 绝对路径)
+        to_hash = []
         for file_path in data_files:
             # 确保使用绝对路径
             abs_file_path = file_path.resolve()
+            file_key = self._file_key(abs_file_path)
+            file_keys.append(file_key)
+
             try:
-                file_key = str(abs_file_path.relative_to(self.project_root.resolve()))
-            except ValueError:
-                # 如果文件不在项目根目录下，使用文件的绝对路径作为key
-                file_key = str(abs_file_path)
+                stat = os.stat(abs_file_path)
+            except OSError:
+                current_hashes[file_key] = {"h": ""}
+                continue
+            old_entry = old_hashes.get(file_key)
+            if (
+                isinstance(old_entry, dict)
+                and old_entry.get("m") == stat.st_mtime_ns
+                and old_entry.get("s") == stat.st_size
+                and old_entry.get("h")
+            ):
+                # 修改时间与大小均未变化，直接复用上次的哈希，无需读取文件内容
+                current_hashes[file_key] = old_entry
+            else:
+                current_hashes[file_key] = {"m": stat.st_mtime_ns, "s": stat.st_size}
+                to_hash.append((file_key, abs_file_path))
 
-            current_hash = self._calculate_file_hash(abs_file_path)
-            current_hashes[file_key] = current_hash
+        # 文件读取与哈希计算期间会释放 GIL，多个文件可并行计算
+        paths = [path for _, path in to_hash]
+        if len(paths) < PARALLEL_HASH_THRESHOLD:
+            hashes = [self._calculate_file_hash(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                hashes = list(executor.map(self._calculate_file_hash, paths))
+        for (file_key, _), file_hash in zip(to_hash, hashes):
+            if file_hash:
+                current_hashes[file_key]["h"] = file_hash
+            else:
+                # 哈希计算失败时不记录修改时间与大小，下次运行重新计算，避免空哈希被一直复用
+                current_hashes[file_key] = {"h": ""}
 
-            old_hash = self.file_changes["file_hashes"].get(file_key)
+        for file_path, file_key in zip(data_files, file_keys):
+            current_hash = current_hashes[file_key]["h"]
+            old_entry = old_hashes.get(file_key)
+            # 兼容仅记录哈希字符串的旧格式
+            old_hash = old_entry.get("h") if isinstance(old_entry, dict) else old_entry
 
             if old_hash is None:
                 new_files.append(file_path)
@@ -135,38 +390,20 @@ class EnhancedTestCaseGenerator:
 
         return new_files, modified_files, driver_type_changed
 
-    def _get_module_info_from_path(self, data_file_path: Path) -> Tuple[str, str]:
+    def _get_module_info_from_path(self, data_file_path: Path, data_root: Optional[Path] = None) -> Tuple[str, str]:
         """
         从数据文件路径提取模块信息
 
         Args:
             data_file_path: 数据文件路径
+            data_root: 数据根目录，批量处理时由调用方传入，未传入时根据配置获取
 
         Returns:
             (模块名, 推荐的测试文件名)
         """
-        # 获取相对于数据根目录的路径
-        try:
+        if data_root is None:
             data_root = Path(self.data_driver.config.current_data_path)
-            relative_path = data_file_path.relative_to(data_root)
-
-            # 提取模块名（第一级目录）
-            module_name = relative_path.parts[0] if relative_path.parts else "Unknown"
-
-            # 生成测试文件名
-            file_stem = data_file_path.stem
-            if file_stem.endswith('_test_data'):
-                file_stem = file_stem[:-10]  # 移除 '_test_data' 后缀
-
-            test_file_name = f"test_{file_stem}.py"
-
-            return module_name, test_file_name
-
-        except ValueError:
-            # 如果路径不在数据根目录下，使用文件名推断
-            module_name = data_file_path.parent.name
-            test_file_name = f"test_{data_file_path.stem}.py"
-            return module_name, test_file_name
+        return _module_info_resolver(str(data_root))(data_file_path)
 
     def _get_yaml_file_for_module(self, module_name: str, test_file_name: str) -> str:
         """
@@ -179,48 +416,25 @@ class EnhancedTestCaseGenerator:
         Returns:
             对应的YAML文件名
         """
-        # 文件名映射表
-        file_mapping = {
-            'Login': {
-                'test_login.py': 'login.yaml'
-            },
-            'UserInfo': {
-                'test_get_user_info.py': 'get_user_info.yaml'
-            },
-            'Collect': {
-                'test_collect_addtool.py': 'collect_addtool.yaml',
-                'test_collect_delete_tool.py': 'collect_delete_tool.yaml',
-                'test_collect_tool_list.py': 'collect_tool_list.yaml',
-                'test_collect_update_tool.py': 'collect_update_tool.yaml'
-            }
-        }
+        return _yaml_file_for_module(module_name, test_file_name)
 
-        # 查找精确映射
-        module_mapping = file_mapping.get(module_name, {})
-        yaml_file = module_mapping.get(test_file_name)
-
-        if yaml_file:
-            return yaml_file
-
-        # 通用推断
-        base_name = test_file_name.replace('test_', '').replace('.py', '')
-        return f"{base_name}.yaml"
-
-    def _should_generate_or_update(self, data_file_path: Path, force_update: bool = False) -> bool:
+    def _should_generate_or_update(
+        self, data_file_path: Path, force_update: bool = False, data_root: Optional[Path] = None
+    ) -> bool:
         """
         判断是否应该生成或更新测试文件
 
         Args:
             data_file_path: 数据文件路径
             force_update: 是否强制更新
+            data_root: 数据根目录
 
         Returns:
             是否应该生成或更新
         """
-        config_data = GetYamlData(ensure_path_sep("\\common\\config.yaml")).get_yaml_data()
-        real_time_update = config_data.get("real_time_update_test_cases", False)
+        real_time_update = self._get_real_time_update()
 
-        module_name, test_file_name = self._get_module_info_from_path(data_file_path)
+        module_name, test_file_name = self._get_module_info_from_path(data_file_path, data_root)
         test_file_path = Path("test_case") / module_name / test_file_name
 
         # 如果强制更新或实时更新开启，则更新
@@ -232,28 +446,39 @@ class EnhancedTestCaseGenerator:
             return True
 
         # 如果数据文件是新增或修改的，则更新
-        file_key = str(data_file_path.relative_to(self.project_root))
+        file_key = self._file_key(data_file_path.resolve())
         if file_key not in self.file_changes.get("generated_files", {}):
             return True
 
         return False
 
-    def generate_test_case_for_file(self, data_file_path: Path, force_update: bool = False) -> bool:
+    def generate_test_case_for_file(
+        self,
+        data_file_path: Path,
+        force_update: bool = False,
+        data_root: Optional[Path] = None,
+        updates: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+    ) -> bool:
         """
         为单个数据文件生成测试用例
 
         Args:
             data_file_path: 数据文件路径
             force_update: 是否强制更新
+            data_root: 数据根目录，批量生成时由调用方传入，避免逐个文件重复获取
+            updates: 生成记录收集列表，传入时追加 (file_key, 生成信息)，由调用方统一合并；
+                未传入时直接写入追踪记录
 
         Returns:
             是否成功生成
         """
         try:
-            if not self._should_generate_or_update(data_file_path, force_update):
+            if data_root is None:
+                data_root = Path(self.data_driver.config.current_data_path)
+            if not self._should_generate_or_update(data_file_path, force_update, data_root):
                 return True
 
-            module_name, test_file_name = self._get_module_info_from_path(data_file_path)
+            module_name, test_file_name = self._get_module_info_from_path(data_file_path, data_root)
             yaml_file_name = self._get_yaml_file_for_module(module_name, test_file_name)
 
             # 获取测试数据以验证数据文件有效性
@@ -266,9 +491,9 @@ class EnhancedTestCaseGenerator:
                 ERROR.logger.error(f"读取数据文件 {data_file_path} 失败: {e}")
                 return False
 
-            # 从第一个测试数据中提取公共信息
+            # 从第一个测试数据中提取用例ID
             first_case = test_data[0] if test_data else {}
-            case_data = list(first_case.values())[0] if first_case else {}
+            case_ids = list(first_case) if first_case else []
 
             # 构建生成参数
             generation_params = {
@@ -278,7 +503,7 @@ class EnhancedTestCaseGenerator:
                 'class_title': self._generate_class_name(test_file_name),
                 'func_title': test_file_name.replace('test_', '').replace('.py', ''),
                 'case_path': self._get_test_file_path(module_name, test_file_name),
-                'case_ids': list(first_case.keys()) if first_case else [],
+                'case_ids': case_ids,
                 'file_name': yaml_file_name
             }
 
@@ -286,25 +511,23 @@ class EnhancedTestCaseGenerator:
             test_file_path = Path(generation_params['case_path'])
             test_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # 生成测试文件
+            # 生成测试文件，模板模块仅在实际生成时导入
+            from utils.read_files_tools.testcase_template import write_testcase_file
+
             write_testcase_file(**generation_params)
 
             # 记录生成信息
-            abs_data_file_path = data_file_path.resolve()
-            try:
-                file_key = str(abs_data_file_path.relative_to(self.project_root.resolve()))
-            except ValueError:
-                file_key = str(abs_data_file_path)
-
-            if "generated_files" not in self.file_changes:
-                self.file_changes["generated_files"] = {}
-
-            self.file_changes["generated_files"][file_key] = {
+            file_key = self._file_key(data_file_path.resolve())
+            entry = {
                 "test_file": str(test_file_path),
                 "module_name": module_name,
                 "generated_at": datetime.now().isoformat(),
                 "yaml_file": yaml_file_name
             }
+            if updates is not None:
+                updates.append((file_key, entry))
+            else:
+                self.file_changes.setdefault("generated_files", {})[file_key] = entry
 
             INFO.logger.info(f"成功生成测试文件: {test_file_path}")
             return True
@@ -315,13 +538,11 @@ class EnhancedTestCaseGenerator:
 
     def _generate_class_name(self, test_file_name: str) -> str:
         """生成类名"""
-        base_name = test_file_name.replace('test_', '').replace('.py', '')
-        parts = base_name.split('_')
-        return ''.join(word.capitalize() for word in parts)
+        return _class_name(test_file_name)
 
     def _get_test_file_path(self, module_name: str, test_file_name: str) -> str:
         """获取测试文件路径"""
-        return str(Path("test_case") / module_name / test_file_name)
+        return _test_file_path(module_name, test_file_name)
 
     def generate_all_test_cases(self, force_update: bool = False, check_changes: bool = True) -> Dict[str, Any]:
         """
@@ -347,21 +568,31 @@ class EnhancedTestCaseGenerator:
             "errors": []
         }
 
+        # 本次生成过程中数据驱动类型只读取一次，中途切换数据驱动不影响当前生成
+        self._current_driver_type = getattr(config, 'data_driver_type', 'yaml')
         try:
+            # 公共配置在本次生成过程中只读取一次
+            self._real_time_update = self._get_real_time_update()
+            # 同一进程内多次生成时，追踪文件未被外部修改则无需重新解析
+            self.reload_if_changed()
+
+            # 获取所有数据文件，本次生成过程中只扫描一次数据目录
+            all_data_files = self._get_data_files()
+
             # 检测变化
             if check_changes:
-                new_files, modified_files, driver_type_changed = self._detect_changes()
+                new_files, modified_files, driver_type_changed = self._detect_changes(all_data_files)
                 result["driver_type_changed"] = driver_type_changed
 
                 if driver_type_changed:
                     INFO.logger.info(f"检测到数据驱动类型变化，将重新生成所有测试文件")
                     force_update = True
             else:
-                new_files = modified_files = self._get_data_files()
+                # 不检查变化时处理全部文件，每个文件只处理一次
+                new_files = all_data_files
+                modified_files = []
                 driver_type_changed = False
 
-            # 获取所有数据文件
-            all_data_files = self._get_data_files()
             result["total_files"] = len(all_data_files)
             result["new_files"] = len(new_files) if check_changes else 0
             result["modified_files"] = len(modified_files) if check_changes else 0
@@ -379,17 +610,26 @@ class EnhancedTestCaseGenerator:
                 return result
 
             # 生成测试文件
-            for data_file in files_to_process:
-                try:
-                    if self.generate_test_case_for_file(data_file, force_update):
-                        result["generated_files"] += 1
-                    else:
-                        result["failed_files"] += 1
-                except Exception as e:
-                    result["failed_files"] += 1
-                    error_msg = f"处理文件 {data_file} 失败: {str(e)}"
-                    result["errors"].append(error_msg)
-                    ERROR.logger.error(error_msg)
+            data_root = Path(self.data_driver.config.current_data_path)
+            updates: List[Tuple[str, Dict[str, Any]]] = []
+            if len(files_to_process) < PARALLEL_GENERATE_THRESHOLD:
+                outcomes = (_generate_one(self, data_file, force_update, data_root) for data_file in files_to_process)
+                for success, file_updates, error_msg in outcomes:
+                    self._collect_outcome(result, updates, success, file_updates, error_msg)
+            else:
+                # 各数据文件的解析与生成相互独立，分发到多个进程并行处理，生成记录返回主进程统一合并
+                with ProcessPoolExecutor(
+                    max_workers=min(len(files_to_process), os.cpu_count() or 1),
+                    initializer=_init_generate_worker,
+                    initargs=(self._current_driver_type, self._real_time_update, force_update, data_root),
+                ) as executor:
+                    for success, file_updates, error_msg in executor.map(
+                        _generate_in_worker, files_to_process, chunksize=8
+                    ):
+                        self._collect_outcome(result, updates, success, file_updates, error_msg)
+
+            # 统一合并本次生成记录
+            self.file_changes.setdefault("generated_files", {}).update(updates)
 
             # 更新时间戳
             self.file_changes["last_update"] = datetime.now().isoformat()
@@ -404,9 +644,30 @@ class EnhancedTestCaseGenerator:
             error_msg = f"测试用例生成过程出错: {str(e)}"
             result["errors"].append(error_msg)
             ERROR.logger.error(error_msg)
+        finally:
+            self._current_driver_type = None
+            self._real_time_update = None
 
         return result
 
+    @staticmethod
+    def _collect_outcome(
+        result: Dict[str, Any],
+        updates: List[Tuple[str, Dict[str, Any]]],
+        success: bool,
+        file_updates: List[Tuple[str, Dict[str, Any]]],
+        error_msg: Optional[str],
+    ) -> None:
+        """汇总单个文件的生成结果"""
+        updates.extend(file_updates)
+        if success:
+            result["generated_files"] += 1
+        else:
+            result["failed_files"] += 1
+            if error_msg:
+                result["errors"].append(error_msg)
+                ERROR.logger.error(error_msg)
+
     def _print_generation_summary(self, result: Dict[str, Any]):
         """打印生成结果摘要"""
         print("\n" + "=" * 60)
@@ -434,7 +695,7 @@ class EnhancedTestCaseGenerator:
         elif result["skipped_files"] > 0:
             print(f"\n⏭️ 没有变化，跳过了 {result['skipped_files']} 个文件")
 
-        current_driver = getattr(config, 'data_driver_type', 'yaml')
+        current_driver = self._get_driver_type()
         print(f"\n🔧 当前数据驱动类型: {current_driver}")
 
     def clean_obsolete_files(self) -> List[str]:
@@ -448,7 +709,7 @@ class EnhancedTestCaseGenerator:
 
         try:
             generated_files = self.file_changes.get("generated_files", {})
-            current_data_files = {str(f.relative_to(self.project_root)) for f in self._get_data_files()}
+            current_data_files = {self._file_key(f.resolve()) for f in self._get_data_files()}
 
             for data_file_key, file_info in list(generated_files.items()):
                 if data_file_key not in current_data_files:
@@ -474,6 +735,43 @@ class EnhancedTestCaseGenerator:
         return cleaned_files
 
 
+def _generate_one(
+    generator: EnhancedTestCaseGenerator, data_file: Path, force_update: bool, data_root: Path
+) -> Tuple[bool, List[Tuple[str, Dict[str, Any]]], Optional[str]]:
+    """
+    生成单个数据文件的测试用例，不修改生成器的追踪记录
+
+    Returns:
+        (是否成功, 生成记录列表, 错误信息)
+    """
+    file_updates: List[Tuple[str, Dict[str, Any]]] = []
+    try:
+        success = generator.generate_test_case_for_file(data_file, force_update, data_root, file_updates)
+        return success, file_updates, None
+    except Exception as e:
+        return False, file_updates, f"处理文件 {data_file} 失败: {str(e)}"
+
+
+# 多进程生成时，每个子进程复用的生成器实例及参数
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_generate_worker(driver_type: str, real_time_update: bool, force_update: bool, data_root: Path) -> None:
+    """多进程生成的子进程初始化：与主进程保持相同的数据驱动类型与公共配置"""
+    if getattr(config, 'data_driver_type', 'yaml') != driver_type:
+        switch_data_driver(driver_type)
+    generator = EnhancedTestCaseGenerator()
+    generator._current_driver_type = driver_type
+    generator._real_time_update = real_time_update
+    _worker_state.update(generator=generator, force_update=force_update, data_root=data_root)
+
+
+def _generate_in_worker(data_file: Path) -> Tuple[bool, List[Tuple[str, Dict[str, Any]]], Optional[str]]:
+    """多进程任务入口"""
+    state = _worker_state
+    return _generate_one(state["generator"], data_file, state["force_update"], state["data_root"])
+
+
 def main():
     """主函数 - 提供命令行接口"""
     import argparse
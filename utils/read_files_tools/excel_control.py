@@ -22,9 +22,12 @@ Excel数据控制模块
 @Update : 重构为现代化Excel数据驱动支持
 """
 import ast
+import copy
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -32,6 +35,74 @@ from common.setting import ensure_path_sep
 from utils.logging_tool.log_control import ERROR, INFO
 from utils.other_tools.models import TestCase
 
+# 优先使用的 Excel 读取引擎：calamine（Rust 实现，需 pandas>=2.2 并安装 python-calamine）明显快于 openpyxl；
+# 不可用时回退到 openpyxl，并记住结果避免每次读取都重复尝试。
+# 回退只是把该变量赋值为 openpyxl，多线程同时回退时结果相同，无需加锁
+_FALLBACK_EXCEL_ENGINE = "openpyxl"
+_excel_engine = "calamine"
+
+
+# 可能构成数字的开头字符（另含各类数字与空白字符，分别用 str.isdigit、str.isspace 判断）
+_NUMBER_START = frozenset("+-.")
+# 可能构成 Python 字面量的开头字符（另含数字与字母开头的情况，见 _parse_cell_value_cached）；
+# 注释与续行符之后换行的内容仍会被 ast.literal_eval 解析
+_LITERAL_START = frozenset("{[(\"'+-.#\\")
+_LITERAL_NAMES = ("True", "False", "None", "set(")
+_QUOTES = frozenset("\"'")
+
+
+@lru_cache(maxsize=4096)
+def _parse_cell_value_cached(value: str) -> Any:
+    """
+    解析单元格值，按字符串缓存结果；测试数据中大量单元格取值重复（GET、200、{}、json 等）
+
+    按首字符判断可能的类型，普通字符串不再依次尝试数字、JSON 与 ast.literal_eval 解析
+
+    返回值可能是可变容器，调用方需复制后再交出
+    """
+    if not value:
+        return None
+    lower = value.lower()
+    if lower in ("none", "null"):
+        return None
+
+    # 尝试解析为布尔值
+    if lower in ("true", "false"):
+        return lower == "true"
+
+    first = value[0]
+    if first.isdigit() or first in _NUMBER_START or first.isspace():
+        # 尝试解析为数字：先按整数解析，失败且包含小数点时再按浮点数解析
+        try:
+            return int(value)
+        except ValueError:
+            if "." in value:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+    elif first == "{" or first == "[":
+        # 尝试解析为JSON对象
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    elif first.isalpha():
+        # 字母开头时，只有 True/False/None/set() 开头或带前缀的字符串（如 b'..'）才可能是 Python 字面量
+        if not (value.startswith(_LITERAL_NAMES) or value[1:2] in _QUOTES or value[2:3] in _QUOTES):
+            return value
+    elif first not in _LITERAL_START:
+        return value
+
+    # 尝试解析为Python字面量
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+
+    # 返回原始字符串
+    return value
+
 
 class ExcelDataReader:
     """
@@ -66,17 +137,26 @@ class ExcelDataReader:
             FileNotFoundError: 当Excel文件不存在时抛出
             ValueError: 当Excel文件格式不正确时抛出
         """
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"Excel文件不存在: {self.file_path}")
+        # stat 同时用于判断文件是否存在和作为缓存键
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Excel文件不存在: {self.file_path}") from None
 
+        # 缓存中为共享对象，复制后交出，调用方可自由修改
+        self.data = copy.deepcopy(_read_excel_cached(str(self.file_path), stat.st_mtime_ns, stat.st_size))
+        return self.data
+
+    def _parse_workbook(self) -> Dict[str, Any]:
+        """
+        读取并解析工作簿，不使用缓存
+
+        Returns:
+            包含测试用例数据的字典
+        """
         try:
             # 读取所有sheet，指定编码处理
-            excel_data = pd.read_excel(
-                self.file_path,
-                sheet_name=None,
-                dtype=str,
-                engine='openpyxl'  # 使用openpyxl引擎，更好的编码支持
-            )
+            excel_data = self._read_all_sheets()
 
             # 处理公共配置
             if "case_common" in excel_data:
@@ -98,6 +178,29 @@ class ExcelDataReader:
             ERROR.logger.error(f"读取Excel文件失败: {self.file_path}, 错误: {e}")
             raise
 
+    def _read_all_sheets(self) -> Dict[str, pd.DataFrame]:
+        """
+        使用可用的最快引擎读取全部 sheet
+
+        Returns:
+            sheet 名称 -> DataFrame
+        """
+        global _excel_engine
+        engine = _excel_engine
+        if engine != _FALLBACK_EXCEL_ENGINE:
+            try:
+                return pd.read_excel(self.file_path, sheet_name=None, dtype=str, engine=engine)
+            except ImportError:
+                # 未安装 python-calamine
+                _excel_engine = _FALLBACK_EXCEL_ENGINE
+            except ValueError as e:
+                # pandas 版本过低，不支持该引擎；其他 ValueError 为文件内容问题，直接抛出
+                if "engine" not in str(e).lower():
+                    raise
+                _excel_engine = _FALLBACK_EXCEL_ENGINE
+        # openpyxl 引擎由 pandas 以只读、仅取值模式打开工作簿
+        return pd.read_excel(self.file_path, sheet_name=None, dtype=str, engine=_FALLBACK_EXCEL_ENGINE)
+
     def _parse_common_config(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         解析公共配置数据
@@ -110,11 +213,12 @@ class ExcelDataReader:
         """
         common_config = {}
 
-        # 假设公共配置是键值对格式
-        for _, row in df.iterrows():
-            if pd.notna(row.iloc[0]) and pd.notna(row.iloc[1]):
-                key = str(row.iloc[0]).strip()
-                value = str(row.iloc[1]).strip()
+        # 假设公共配置是键值对格式；直接遍历前两列的底层数组，避免逐行构造 Series
+        for raw_key, raw_value in zip(df.iloc[:, 0].to_numpy(dtype=object), df.iloc[:, 1].to_numpy(dtype=object)):
+            # v == v 为 False 时即 NaN
+            if raw_key is not None and raw_key == raw_key and raw_value is not None and raw_value == raw_value:
+                key = str(raw_key).strip()
+                value = str(raw_value).strip()
 
                 # 尝试解析为Python对象
                 try:
@@ -137,28 +241,30 @@ class ExcelDataReader:
         test_cases = {}
 
         # 清理列名
-        df.columns = df.columns.str.strip()
-
-        for _, row in df.iterrows():
-            # 跳过空行
-            if pd.isna(row.get("case_id")):
+        columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
+        if "case_id" not in columns:
+            return test_cases
+        case_id_idx = columns.index("case_id")
+        # 除 case_id 外的字段：(列下标, 列名)
+        fields = [(i, c) for i, c in enumerate(columns) if c != "case_id"]
+
+        # 一次取出底层对象数组逐行遍历，避免 iterrows 为每行构造 Series
+        for row in df.to_numpy(dtype=object):
+            case_id = row[case_id_idx]
+            # 跳过空行（v != v 即 NaN）
+            if case_id is None or case_id != case_id:
                 continue
 
-            case_id = str(row["case_id"]).strip()
-            case_data = {}
-
             # 处理每个字段
-            for column in df.columns:
-                if column == "case_id":
-                    continue
-
-                value = row[column]
-                if pd.notna(value):
+            case_data = {}
+            for i, column in fields:
+                value = row[i]
+                if value is not None and value == value:
                     case_data[column] = self._parse_cell_value(str(value).strip())
                 else:
                     case_data[column] = None
 
-            test_cases[case_id] = case_data
+            test_cases[str(case_id).strip()] = case_data
 
         return test_cases
 
@@ -174,37 +280,21 @@ class ExcelDataReader:
         Returns:
             转换后的值
         """
-        if not value or value.lower() in ["none", "null", ""]:
-            return None
-
-        # 尝试解析为布尔值
-        if value.lower() in ["true", "false"]:
-            return value.lower() == "true"
-
-        # 尝试解析为数字
-        try:
-            if "." in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            pass
+        result = _parse_cell_value_cached(value)
+        # 容器类型为缓存中的共享对象，复制后返回，避免用例之间相互修改
+        if isinstance(result, (dict, list, set, tuple)):
+            return copy.deepcopy(result)
+        return result
 
-        # 尝试解析为JSON对象
-        if value.startswith(("{", "[")):
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                pass
 
-        # 尝试解析为Python字面量
-        try:
-            return ast.literal_eval(value)
-        except (ValueError, SyntaxError):
-            pass
+@lru_cache(maxsize=64)
+def _read_excel_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    按 (文件路径, 修改时间, 文件大小) 缓存 Excel 解析结果，文件修改后自动重新读取
 
-        # 返回原始字符串
-        return value
+    返回的是共享对象，调用方需复制后再使用
+    """
+    return ExcelDataReader(path)._parse_workbook()
 
 
 class ExcelDataProcessor:
@@ -240,7 +330,7 @@ class ExcelDataProcessor:
         Returns:
             TestCase对象字典列表
         """
-        data = self.get_excel_data()
+        data = self.reader.read_excel_data()
         test_cases = []
 
         for case_id, case_data in data.items():
@@ -304,6 +394,30 @@ class ExcelDataProcessor:
         return case_data
 
 
+def _apply_regular(obj: Any, render: Callable[[str], str]) -> Any:
+    """
+    递归处理用例数据中的动态函数 ${{...}}，仅对包含占位符的字符串做替换
+
+    字符串按其字面量形式替换后再解析，与整体转字符串处理的结果一致，
+    ${{int:...}} 等类型占位符仍会被转换为对应类型。
+
+    Args:
+        obj: 用例数据
+        render: 占位符替换函数，即 regular
+    """
+    if isinstance(obj, str):
+        if "${{" not in obj:
+            return obj
+        return ast.literal_eval(render(repr(obj)))
+    if isinstance(obj, dict):
+        return {_apply_regular(k, render): _apply_regular(v, render) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_apply_regular(i, render) for i in obj]
+    if isinstance(obj, tuple):
+        return tuple(_apply_regular(i, render) for i in obj)
+    return obj
+
+
 # 兼容旧版本的函数
 def get_excel_data(sheet_name: str, case_name: str) -> List[tuple]:
     """
@@ -336,15 +450,8 @@ def get_excel_test_data(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
     processor = ExcelDataProcessor(file_path)
     test_cases = processor.convert_to_test_cases()
 
-    # 对Excel数据应用动态函数处理，就像YAML一样
-    processed_cases = []
-    for case in test_cases:
-        # 对每个测试用例应用regular处理
-        processed_case_str = regular(str(case))
-        processed_case = ast.literal_eval(processed_case_str)
-        processed_cases.append(processed_case)
-
-    return processed_cases
+    # 对Excel数据应用动态函数处理，就像YAML一样；逐个字段处理，无需整体转为字符串再解析
+    return [_apply_regular(case, regular) for case in test_cases]
 
 
 if __name__ == "__main__":
@@ -17,9 +17,28 @@ from typing import Dict, List, Text, Union
 from utils import config
 from utils.cache_process.cache_control import CacheHandler
 from utils.other_tools.exceptions import ValueNotFoundError
-from utils.other_tools.models import Method, RequestType, TestCase, TestCaseEnum
+from utils.other_tools.models import REQUIRED_CASE_FIELDS, Method, RequestType, TestCase, TestCaseEnum
 from utils.read_files_tools.yaml_control import GetYamlData
 
+# 用例字段名，导入时解析一次，避免在逐条用例处理中重复访问枚举属性
+_K_URL = TestCaseEnum.URL.value[0]
+_K_HOST = TestCaseEnum.HOST.value[0]
+_K_METHOD = TestCaseEnum.METHOD.value[0]
+_K_DETAIL = TestCaseEnum.DETAIL.value[0]
+_K_IS_RUN = TestCaseEnum.IS_RUN.value[0]
+_K_HEADERS = TestCaseEnum.HEADERS.value[0]
+_K_REQUEST_TYPE = TestCaseEnum.REQUEST_TYPE.value[0]
+_K_DATA = TestCaseEnum.DATA.value[0]
+_K_DE_CASE = TestCaseEnum.DE_CASE.value[0]
+_K_DE_CASE_DATA = TestCaseEnum.DE_CASE_DATA.value[0]
+_K_CURRENT_RE_SET_CACHE = TestCaseEnum.CURRENT_RE_SET_CACHE.value[0]
+_K_SQL = TestCaseEnum.SQL.value[0]
+_K_ASSERT_DATA = TestCaseEnum.ASSERT_DATA.value[0]
+_K_SETUP_SQL = TestCaseEnum.SETUP_SQL.value[0]
+_K_TEARDOWN = TestCaseEnum.TEARDOWN.value[0]
+_K_TEARDOWN_SQL = TestCaseEnum.TEARDOWN_SQL.value[0]
+_K_SLEEP = TestCaseEnum.SLEEP.value[0]
+
 
 class CaseDataCheck:
     """
@@ -46,9 +65,8 @@ class CaseDataCheck:
 
         遍历TestCaseEnum中所有必填字段，检查当前用例数据中是否包含这些字段。
         """
-        for enum in list(TestCaseEnum._value2member_map_.keys()):
-            if enum[1]:
-                self._assert(enum[0])
+        for field_name in REQUIRED_CASE_FIELDS:
+            self._assert(field_name)
 
     def check_params_right(self, enum_name, attr) -> str:
         """
@@ -67,13 +85,15 @@ class CaseDataCheck:
             AssertionError: 当属性值不在允许范围内时抛出
         """
         _member_names_ = enum_name._member_names_
-        assert attr.upper() in _member_names_, (
+        upper_attr = attr.upper()
+        # __members__ 为名称到成员的映射，成员判断为 O(1) 查找
+        assert upper_attr in enum_name.__members__, (
             f"用例ID为 {self.case_id} 的用例中 {attr} 填写不正确，"
             f"当前框架中只支持 {_member_names_} 类型."
             "如需新增 method 类型，请联系管理员."
             f"当前用例文件路径：{self.file_path}"
         )
-        return attr.upper()
+        return upper_attr
 
     @property
     def get_method(self) -> Text:
@@ -85,7 +105,7 @@ class CaseDataCheck:
         Returns:
             验证后的请求方法（大写）
         """
-        return self.check_params_right(Method, self.case_data.get(TestCaseEnum.METHOD.value[0]))
+        return self.check_params_right(Method, self.case_data.get(_K_METHOD))
 
     @property
     def get_host(self) -> Text:
@@ -97,7 +117,7 @@ class CaseDataCheck:
         Returns:
             完整的请求URL
         """
-        host = self.case_data.get(TestCaseEnum.HOST.value[0]) + self.case_data.get(TestCaseEnum.URL.value[0])
+        host = self.case_data.get(_K_HOST) + self.case_data.get(_K_URL)
         return host
 
     @property
@@ -110,7 +130,7 @@ class CaseDataCheck:
         Returns:
             验证后的请求类型（如：json、data、params等）
         """
-        return self.check_params_right(RequestType, self.case_data.get(TestCaseEnum.REQUEST_TYPE.value[0]))
+        return self.check_params_right(RequestType, self.case_data.get(_K_REQUEST_TYPE))
 
     @property
     def get_dependence_case_data(self) -> Union[None, list]:
@@ -125,13 +145,13 @@ class CaseDataCheck:
         Raises:
             AssertionError: 当存在依赖但缺少依赖数据时抛出
         """
-        _dep_data = self.case_data.get(TestCaseEnum.DE_CASE.value[0])
+        _dep_data = self.case_data.get(_K_DE_CASE)
         if _dep_data:
-            assert self.case_data.get(TestCaseEnum.DE_CASE_DATA.value[0]) is not None, (
+            assert self.case_data.get(_K_DE_CASE_DATA) is not None, (
                 f"程序中检测到您的 case_id 为 {self.case_id} 的用例存在依赖，但是 {_dep_data} 缺少依赖数据."
                 f"如已填写，请检查缩进是否正确， 用例路径: {self.file_path}"
             )
-        return self.case_data.get(TestCaseEnum.DE_CASE_DATA.value[0])
+        return self.case_data.get(_K_DE_CASE_DATA)
 
     @property
     def get_assert(self) -> dict:
@@ -146,7 +166,7 @@ class CaseDataCheck:
         Raises:
             AssertionError: 当用例缺少断言配置时抛出
         """
-        _assert_data = self.case_data.get(TestCaseEnum.ASSERT_DATA.value[0])
+        _assert_data = self.case_data.get(_K_ASSERT_DATA)
         assert _assert_data is not None, f"用例ID 为 {self.case_id} 未添加断言，用例路径: {self.file_path}"
         return _assert_data
 
@@ -160,7 +180,7 @@ class CaseDataCheck:
         Returns:
             SQL查询配置列表，如果数据库开关关闭或无SQL配置则返回None
         """
-        _sql = self.case_data.get(TestCaseEnum.SQL.value[0])
+        _sql = self.case_data.get(_K_SQL)
         # 判断数据库开关为开启状态，并且sql不为空
         if config.mysql_db.switch and _sql is None:
             return None
@@ -204,23 +224,24 @@ class CaseData(CaseDataCheck):
                 self.case_data = values
                 self.case_id = key
                 super().check_params_exit()
+                cd_get = values.get
                 case_date = {
                     "method": self.get_method,
-                    "is_run": self.case_data.get(TestCaseEnum.IS_RUN.value[0]),
+                    "is_run": cd_get(_K_IS_RUN),
                     "url": self.get_host,
-                    "detail": self.case_data.get(TestCaseEnum.DETAIL.value[0]),
-                    "headers": self.case_data.get(TestCaseEnum.HEADERS.value[0]),
+                    "detail": cd_get(_K_DETAIL),
+                    "headers": cd_get(_K_HEADERS),
                     "requestType": super().get_request_type,
-                    "data": self.case_data.get(TestCaseEnum.DATA.value[0]),
-                    "dependence_case": self.case_data.get(TestCaseEnum.DE_CASE.value[0]),
+                    "data": cd_get(_K_DATA),
+                    "dependence_case": cd_get(_K_DE_CASE),
                     "dependence_case_data": self.get_dependence_case_data,
-                    "current_request_set_cache": self.case_data.get(TestCaseEnum.CURRENT_RE_SET_CACHE.value[0]),
+                    "current_request_set_cache": cd_get(_K_CURRENT_RE_SET_CACHE),
                     "sql": self.get_sql,
                     "assert_data": self.get_assert,
-                    "setup_sql": self.case_data.get(TestCaseEnum.SETUP_SQL.value[0]),
-                    "teardown": self.case_data.get(TestCaseEnum.TEARDOWN.value[0]),
-                    "teardown_sql": self.case_data.get(TestCaseEnum.TEARDOWN_SQL.value[0]),
-                    "sleep": self.case_data.get(TestCaseEnum.SLEEP.value[0]),
+                    "setup_sql": cd_get(_K_SETUP_SQL),
+                    "teardown": cd_get(_K_TEARDOWN),
+                    "teardown_sql": cd_get(_K_TEARDOWN_SQL),
+                    "sleep": cd_get(_K_SLEEP),
                 }
                 if case_id_switch is True:
                     case_list.append({key: TestCase(**case_date).dict()})
@@ -257,9 +278,5 @@ class GetTestCase:
         Returns:
             测试用例数据列表
         """
-        case_lists = []
-        for i in case_id_lists:
-            _data = CacheHandler.get_cache(i)
-            case_lists.append(_data)
-
-        return case_lists
+        get_cache = CacheHandler.get_cache
+        return [get_cache(i) for i in case_id_lists]
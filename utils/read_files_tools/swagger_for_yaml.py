@@ -12,13 +12,35 @@ This module provides swagger for yaml functionality.
 """
 import json
 import os
-from typing import Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
 
-from jsonpath import jsonpath
-from ruamel import yaml
+from ruamel.yaml import YAML
 
 from common.setting import ensure_path_sep
 
+# 接口路径数达到该值时使用线程池并发写入 yaml 文件
+PARALLEL_WRITE_THRESHOLD = 4
+
+_yaml_local = threading.local()
+
+
+def _round_trip_yaml() -> YAML:
+    """
+    获取当前线程的 round-trip dumper，同一线程内复用，避免每次写入都重新构造 dumper 与 emitter
+
+    ruamel 的 YAML 实例不可重入，并发写入时每个线程各自持有一个；
+    保持 round-trip 的默认块格式，输出与原 yaml.dump(Dumper=RoundTripDumper, allow_unicode=True) 逐字节一致
+    """
+    _yaml = getattr(_yaml_local, "yaml", None)
+    if _yaml is None:
+        _yaml = YAML(typ="rt")
+        _yaml.allow_unicode = True
+        _yaml_local.yaml = _yaml
+    return _yaml
+
 
 class SwaggerForYaml:
     """
@@ -103,7 +125,8 @@ class SwaggerForYaml:
     @classmethod
     def get_request_type(cls, value, headers):
         """处理 request_type"""
-        if jsonpath(obj=value, expr="$.parameters") is not False:
+        # 单层键判断直接用 in，无需每次编译执行 jsonpath 表达式
+        if "parameters" in value:
             _parameters = value["parameters"]
             if _parameters[0]["in"] == "query":
                 return "params"
@@ -121,7 +144,7 @@ class SwaggerForYaml:
     def get_case_data(cls, value):
         """处理 data 数据"""
         _dict = {}
-        if jsonpath(obj=value, expr="$.parameters") is not False:
+        if "parameters" in value:
             _parameters = value["parameters"]
             for i in _parameters:
                 if i["in"] == "header":
@@ -140,27 +163,46 @@ class SwaggerForYaml:
         :param data: 测试用例数据
         :return:
         """
+        cls._write_yaml_cases([data], file_path)
 
-        _file_path = ensure_path_sep("\\data\\" + file_path[1:].replace("/", os.sep) + ".yaml")
-        _file = _file_path.split(os.sep)[:-1]
-        _dir_path = ""
-        for i in _file:
-            _dir_path += i + os.sep
-        try:
-            os.makedirs(_dir_path)
-        except FileExistsError:
-            ...
-        with open(_file_path, "a", encoding="utf-8") as file:
-            yaml.dump(data, file, Dumper=yaml.RoundTripDumper, allow_unicode=True)
-            file.write("\n")
+    @classmethod
+    def _yaml_file_path(cls, file_path: str) -> Path:
+        """接口路径对应的 yaml 文件路径"""
+        return Path(ensure_path_sep("\\data\\" + file_path[1:].replace("/", os.sep) + ".yaml"))
+
+    @classmethod
+    def _write_yaml_cases(cls, data_list: List[Dict], file_path: str) -> None:
+        """
+        将同一接口路径下的多条 yaml 数据一次写入对应文件，只创建一次目录、打开一次文件
+        :param data_list: 测试用例数据列表
+        :param file_path: 接口路径
+        :return:
+        """
+        _file_path = cls._yaml_file_path(file_path)
+        _file_path.parent.mkdir(parents=True, exist_ok=True)
+        cls._dump_yaml_cases(data_list, _file_path)
+
+    @classmethod
+    def _dump_yaml_cases(cls, data_list: List[Dict], yaml_path: Path) -> None:
+        """
+        追加写入 yaml 数据，调用方需保证目录已存在
+        :param data_list: 测试用例数据列表
+        :param yaml_path: yaml 文件路径
+        :return:
+        """
+        _yaml = _round_trip_yaml()
+        with open(yaml_path, "a", encoding="utf-8") as file:
+            for data in data_list:
+                _yaml.dump(data, file)
+                file.write("\n")
 
     @classmethod
     def get_headers(cls, value):
         """获取请求头"""
         _headers = {}
-        if jsonpath(obj=value, expr="$.consumes") is not False:
+        if "consumes" in value:
             _headers = {"Content-Type": value["consumes"][0]}
-        if jsonpath(obj=value, expr="$.parameters") is not False:
+        if "parameters" in value:
             for i in value["parameters"]:
                 if i["in"] == "header":
                     _headers[i["name"]] = None
@@ -168,6 +210,40 @@ class SwaggerForYaml:
             _headers = None
         return _headers
 
+    def _write_path_cases(self, key: str, value: Dict, yaml_path: Path) -> None:
+        """
+        生成接口路径下各请求方法的用例，并一次写入该路径对应的 yaml 文件
+        :param key: 接口路径
+        :param value: 该路径下各请求方法的接口信息
+        :param yaml_path: yaml 文件路径
+        :return:
+        """
+        _cases = []
+        for k, v in value.items():
+            _headers = self.get_headers(v)
+            yaml_data = {
+                "case_common": {
+                    "allureEpic": self.get_allure_epic(),
+                    "allureFeature": self.get_allure_feature(v),
+                    "allureStory": self.get_allure_story(v),
+                },
+                self.get_case_id(key): {
+                    "host": "${{host()}}",
+                    "url": key,
+                    "method": k,
+                    "detail": self.get_detail(v),
+                    "headers": _headers,
+                    "requestType": self.get_request_type(v, _headers),
+                    "is_run": None,
+                    "data": self.get_case_data(v),
+                    "dependence_case": False,
+                    "assert": {"status_code": 200},
+                    "sql": None,
+                },
+            }
+            _cases.append(yaml_data)
+        self._dump_yaml_cases(_cases, yaml_path)
+
     def write_yaml_handler(self) -> None:
         """
         处理YAML文件写入
@@ -176,29 +252,23 @@ class SwaggerForYaml:
         包含完整的测试用例结构：公共配置、请求信息、断言配置等。
         """
         _api_data = self._data["paths"]
-        for key, value in _api_data.items():
-            for k, v in value.items():
-                yaml_data = {
-                    "case_common": {
-                        "allureEpic": self.get_allure_epic(),
-                        "allureFeature": self.get_allure_feature(v),
-                        "allureStory": self.get_allure_story(v),
-                    },
-                    self.get_case_id(key): {
-                        "host": "${{host()}}",
-                        "url": key,
-                        "method": k,
-                        "detail": self.get_detail(v),
-                        "headers": self.get_headers(v),
-                        "requestType": self.get_request_type(v, self.get_headers(v)),
-                        "is_run": None,
-                        "data": self.get_case_data(v),
-                        "dependence_case": False,
-                        "assert": {"status_code": 200},
-                        "sql": None,
-                    },
-                }
-                self.yaml_cases(yaml_data, file_path=key)
+        # 每个接口路径对应一个 yaml 文件，同一路径下各请求方法的用例一次写入
+        jobs = [(key, value, self._yaml_file_path(key)) for key, value in _api_data.items() if value]
+        # 提交任务前统一创建目录，避免线程间重复创建
+        for _dir in {yaml_path.parent for _, _, yaml_path in jobs}:
+            _dir.mkdir(parents=True, exist_ok=True)
+
+        if len(jobs) < PARALLEL_WRITE_THRESHOLD:
+            for job in jobs:
+                self._write_path_cases(*job)
+            return
+
+        # 各路径写入不同文件，互不依赖；写文件为 IO 操作，线程并发即可
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = [executor.submit(self._write_path_cases, *job) for job in jobs]
+            for future in futures:
+                # 抛出任务中的异常
+                future.result()
 
 
 if __name__ == "__main__":
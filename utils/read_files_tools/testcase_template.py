@@ -14,34 +14,12 @@ This module provides testcase template functionality.
 # @describe: 用例模板
 """
 import datetime
+from string import Template
 
-
-def write_case(case_path, page):
-    """写入用例数据"""
-    with open(case_path, "w", encoding="utf-8") as file:
-        file.write(page)
-
-
-def write_testcase_file(
-    *, allure_epic, allure_feature, class_title, func_title, case_path, case_ids, file_name, allure_story
-):
-    """
-
-    :param allure_story:
-    :param file_name: 文件名称
-    :param allure_epic: 项目名称
-    :param allure_feature: 模块名称
-    :param class_title: 类名称
-    :param func_title: 函数名称
-    :param case_path: case 路径
-    :param case_ids: 用例ID
-    :return:
-    """
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    page = '''#!/usr/bin/env python
+# 用例模板，导入时解析一次；批量生成用例时只需做占位符替换
+_TEMPLATE = Template('''#!/usr/bin/env python
 # -*- coding: utf-8 -*-
-# @Time   : {now}
+# @Time   : ${now}
 
 
 import allure
@@ -55,17 +33,17 @@ from utils.requests_tool.teardown_control import TearDownHandler
 
 # 使用新的数据驱动接口获取测试数据
 # 注意：需要根据实际情况指定具体的文件名
-TestData = get_test_data('{allure_feature}', '{file_name}')
+TestData = get_test_data('${allure_feature}', '${file_name}')
 re_data = regular(str(TestData))
 
 
-@allure.epic("{allure_epic}")
-@allure.feature("{allure_feature}")
-class Test{class_title}:
+@allure.epic("${allure_epic}")
+@allure.feature("${allure_feature}")
+class Test${class_title}:
 
-    @allure.story("{allure_story}")
+    @allure.story("${allure_story}")
     @pytest.mark.parametrize('in_data', eval(re_data), ids=[i['detail'] for i in TestData])
-    def test_{func_title}(self, in_data, case_skip):
+    def test_${func_title}(self, in_data, case_skip):
         """
         :param :
         :return:
@@ -80,10 +58,35 @@ class Test{class_title}:
 
 
 if __name__ == '__main__':
-    pytest.main(['{file_name}', '-s', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
-'''
-    # 格式化模板字符串
-    formatted_page = page.format(
+    pytest.main(['${file_name}', '-s', '-W', 'ignore:Module already imported:pytest.PytestWarning'])
+''')
+
+
+def write_case(case_path, page):
+    """写入用例数据"""
+    with open(case_path, "w", encoding="utf-8") as file:
+        file.write(page)
+
+
+def write_testcase_file(
+    *, allure_epic, allure_feature, class_title, func_title, case_path, case_ids, file_name, allure_story
+):
+    """
+
+    :param allure_story:
+    :param file_name: 文件名称
+    :param allure_epic: 项目名称
+    :param allure_feature: 模块名称
+    :param class_title: 类名称
+    :param func_title: 函数名称
+    :param case_path: case 路径
+    :param case_ids: 用例ID
+    :return:
+    """
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # 渲染用例模板
+    formatted_page = _TEMPLATE.substitute(
         now=now,
         allure_epic=allure_epic,
         allure_feature=allure_feature,
@@ -11,12 +11,71 @@ This module provides yaml control functionality.
 # @Author : txl
 """
 import ast
+import copy
+import hashlib
+import json
 import os
+from typing import Any, Dict, Optional, Tuple
 
 import yaml.scanner
 
+try:
+    # 优先使用 libyaml 的 C 实现，解析语义与 FullLoader 一致
+    from yaml import CFullLoader as _YamlLoader
+except ImportError:
+    from yaml import FullLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from common.setting import root_path
 from utils.read_files_tools.regular_control import regular
 
+# yaml 解析结果缓存：文件路径 -> (修改时间, 文件大小, 解析结果)，文件变化后自动失效
+_YAML_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+# yaml 解析结果的 JSON 缓存目录，跨进程复用，JSON 解析远快于 yaml
+YAML_JSON_CACHE_DIR = os.path.join(root_path(), ".cache", "yaml")
+
+
+def _json_cache_path(file_dir: str) -> str:
+    """yaml 文件对应的 JSON 缓存文件路径"""
+    digest = hashlib.sha1(os.path.abspath(file_dir).encode("utf-8")).hexdigest()
+    return os.path.join(YAML_JSON_CACHE_DIR, digest + ".json")
+
+
+def _read_json_cache(file_dir: str, stat: os.stat_result) -> Optional[Tuple[Any]]:
+    """
+    读取 JSON 缓存，缓存记录的 yaml 修改时间与大小一致时才有效
+    :return: 命中时返回 (data,)，未命中返回 None
+    """
+    try:
+        with open(_json_cache_path(file_dir), "rb") as file:
+            raw = file.read()
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+        return (cached.get("data"),)
+    return None
+
+
+def _write_json_cache(file_dir: str, stat: os.stat_result, data: Any) -> None:
+    """
+    写入 JSON 缓存；数据无法与 JSON 无损互转时（如日期、元组、非字符串键）不缓存
+    """
+    try:
+        payload = json.dumps({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data}, ensure_ascii=False)
+        if json.loads(payload)["data"] != data:
+            return
+        os.makedirs(YAML_JSON_CACHE_DIR, exist_ok=True)
+        with open(_json_cache_path(file_dir), "w", encoding="utf-8") as file:
+            file.write(payload)
+    except (OSError, TypeError, ValueError):
+        # 缓存写入失败不影响用例读取
+        pass
+
 
 class GetYamlData:
     """获取 yaml 文件中的数据"""
@@ -31,12 +90,25 @@ class GetYamlData:
         :return:
         """
         # 判断文件是否存在
-        if os.path.exists(self.file_dir):
-            data = open(self.file_dir, "r", encoding="utf-8")
-            res = yaml.load(data, Loader=yaml.FullLoader)
+        try:
+            stat = os.stat(self.file_dir)
+        except FileNotFoundError:
+            raise FileNotFoundError("文件路径不存在") from None
+
+        cached = _YAML_CACHE.get(self.file_dir)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            # 返回副本，避免调用方修改数据污染缓存
+            return copy.deepcopy(cached[2])
+
+        json_cached = _read_json_cache(self.file_dir, stat)
+        if json_cached is not None:
+            res = json_cached[0]
         else:
-            raise FileNotFoundError("文件路径不存在")
-        return res
+            with open(self.file_dir, "r", encoding="utf-8") as data:
+                res = yaml.load(data, Loader=_YamlLoader)
+            _write_json_cache(self.file_dir, stat, res)
+        _YAML_CACHE[self.file_dir] = (stat.st_mtime_ns, stat.st_size, res)
+        return copy.deepcopy(res)
 
     def write_yaml_data(self, key: str, value) -> int:
         """
@@ -110,7 +110,6 @@ class DependentCase:
         # 判断依赖数据类型，依赖 sql中的数据
         if setup_sql is not None:
             if config.mysql_db.switch:
-                setup_sql = ast.literal_eval(cache_regular(str(setup_sql)))
                 sql_data = SetUpMySQL().setup_sql_data(sql=setup_sql)
                 dependent_data = dependence_case_data.dependent_data
                 for i in dependent_data:
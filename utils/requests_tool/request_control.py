@@ -330,8 +330,8 @@ class RequestControl:
             "method": res.request.method,
             "sql_data": self._sql_data_handler(sql_data=ast.literal_eval(cache_regular(str(yaml_data.sql))), res=res),
             "yaml_data": yaml_data,
-            "headers": res.request.headers,
-            "cookie": res.cookies,
+            "headers": dict(res.request.headers),
+            "cookie": dict(res.cookies),
             "assert_data": yaml_data.assert_data,
             "res_time": self.response_elapsed_total_seconds(res),
             "status_code": res.status_code,